@@ -0,0 +1,102 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+"""
+Builds the date time model of each culture with and without the shared component
+containers and reports build time, traced memory, how many times a pattern was
+compiled and how many distinct compiled patterns, extractors, parsers and
+configurations the model holds.
+
+    python benchmarks/component_sharing.py
+"""
+
+import tracemalloc
+from timeit import default_timer
+import regex
+
+from recognizers_text import Culture, ModelFactory
+from recognizers_text.literal_prefilter import reachable_patterns
+from recognizers_date_time.date_time import component_container
+from recognizers_date_time.date_time.component_container import ComponentContainer
+from recognizers_date_time.date_time.date_time_recognizer import DateTimeRecognizer
+
+CULTURES = [Culture.English, Culture.Spanish, Culture.French, Culture.Portuguese,
+            Culture.Italian, Culture.German, Culture.Chinese]
+
+
+def count_components(root: object) -> int:
+    seen = set()
+    pending = [root]
+    count = 0
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or obj is None or isinstance(obj, (type, str, bytes, int, float, bool)):
+            continue
+        seen.add(id(obj))
+        if type(obj).__name__.endswith(('Extractor', 'Parser', 'Configuration')):
+            count += 1
+        if isinstance(obj, dict):
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        if hasattr(obj, '__dict__'):
+            pending.extend(vars(obj).values())
+    return count
+
+
+class CompileCounter:
+
+    def __init__(self):
+        self.count = 0
+        self.__compile = regex.compile
+
+    def __enter__(self):
+        def compile_and_count(*args, **kwargs):
+            self.count += 1
+            return self.__compile(*args, **kwargs)
+        regex.compile = compile_and_count
+        return self
+
+    def __exit__(self, *args):
+        regex.compile = self.__compile
+
+
+def build(culture: str, shared: bool, traced: bool):
+    # Nothing left over from an earlier build: no cached model, component or compiled pattern.
+    ModelFactory.clear_cache()
+    for container in vars(component_container).values():
+        if isinstance(container, ComponentContainer):
+            container.clear()
+    regex.purge()
+    ComponentContainer.set_enabled(shared)
+    if traced:
+        tracemalloc.start()
+    with CompileCounter() as compiles:
+        start = default_timer()
+        model = DateTimeRecognizer(culture).get_datetime_model(culture)
+        seconds = default_timer() - start
+    memory = 0
+    if traced:
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    return model, seconds, memory, compiles.count
+
+
+def main():
+    print('{:<8}{:>8}{:>10}{:>13}{:>10}{:>10}{:>12}'.format(
+        'culture', 'shared', 'seconds', 'memory (MB)', 'compiles', 'patterns', 'components'))
+    try:
+        for culture in CULTURES:
+            for shared in (False, True):
+                model, seconds, _, compiles = build(culture, shared, False)
+                _, _, memory, _ = build(culture, shared, True)
+                patterns = len(set(id(pattern) for pattern in reachable_patterns(model)))
+                print('{:<8}{:>8}{:>10.2f}{:>13.1f}{:>10}{:>10}{:>12}'.format(
+                    culture, 'yes' if shared else 'no', seconds, memory / 2 ** 20, compiles, patterns,
+                    count_components(model)))
+    finally:
+        ComponentContainer.set_enabled(True)
+
+
+if __name__ == '__main__':
+    main()
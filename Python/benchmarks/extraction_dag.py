@@ -0,0 +1,64 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+"""
+Times the merged date time extractor with and without the extraction memo, and
+prints how many times each extractor was called and how many of those calls ran.
+
+    python benchmarks/extraction_dag.py
+"""
+
+from datetime import datetime
+from timeit import default_timer
+
+from recognizers_text import ExtractionContext
+from recognizers_date_time.date_time.base_merged import BaseMergedExtractor
+from recognizers_date_time.date_time.chinese.merged_extractor import ChineseMergedExtractor
+from recognizers_date_time.date_time.english.merged_extractor_config import EnglishMergedExtractorConfiguration
+from recognizers_date_time.date_time.utilities import DateTimeOptions
+
+ENGLISH = ['I will leave tomorrow at 5pm for two weeks and come back next monday morning',
+           'the meeting moved from 3 to 4:30 pm on friday, june 5th',
+           'every tuesday between 9am and noon until the end of the year',
+           'book it for the day after tomorrow at half past seven']
+CHINESE = ['我明天下午5点出发，下周一上午回来', '会议从周五下午3点到4点半', '每周二上午9点到中午', '后天晚上七点半']
+REFERENCE = datetime(2016, 11, 7)
+REPEAT = 5
+
+
+def measure(extractor, messages) -> float:
+    start = default_timer()
+    for _ in range(REPEAT):
+        for message in messages:
+            extractor.extract(message, REFERENCE)
+    return (default_timer() - start) / (REPEAT * len(messages))
+
+
+def main():
+    extractors = [
+        ('english', BaseMergedExtractor(EnglishMergedExtractorConfiguration(), DateTimeOptions.NONE), ENGLISH),
+        ('chinese', ChineseMergedExtractor(DateTimeOptions.NONE), CHINESE),
+    ]
+
+    current = ExtractionContext.current
+    for name, extractor, messages in extractors:
+        measure(extractor, messages)
+        with_memo = measure(extractor, messages)
+        ExtractionContext.current = staticmethod(lambda: None)
+        try:
+            without_memo = measure(extractor, messages)
+        finally:
+            ExtractionContext.current = current
+
+        print('{}: {:.2f} ms per message without memo, {:.2f} ms with'.format(
+            name, without_memo * 1e3, with_memo * 1e3))
+        with ExtractionContext() as context:
+            for message in messages:
+                extractor.extract(message, REFERENCE)
+        print('  {:<34}{:>8}{:>13}'.format('extractor', 'calls', 'extractions'))
+        for extractor_name, statistics in sorted(context.statistics().items()):
+            print('  {:<34}{:>8}{:>13}'.format(extractor_name, statistics.calls, statistics.extractions))
+
+
+if __name__ == '__main__':
+    main()
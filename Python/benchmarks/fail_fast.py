@@ -0,0 +1,61 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+"""
+Times the merged date time extractor of each culture over chat messages without
+dates, with and without DateTimeOptions.FAIL_FAST.
+
+    python benchmarks/fail_fast.py
+"""
+
+import importlib
+from timeit import default_timer
+
+from recognizers_date_time.date_time.base_merged import BaseMergedExtractor
+from recognizers_date_time.date_time.chinese.merged_extractor import ChineseMergedExtractor
+from recognizers_date_time.date_time.utilities import DateTimeOptions
+
+MESSAGES = {
+    'English': ['hey how are you doing', 'lol that is so funny', 'can you send me the link please', 'thanks!',
+                'ok sounds good', 'I love this song', 'where did you put my keys', 'what do you think about it'],
+    'Spanish': ['hola, ¿qué tal?', 'gracias por todo', 'me gusta esta canción', '¿dónde pusiste mis llaves?'],
+    'French': ['salut, ça va ?', 'merci beaucoup', "j'adore cette chanson", 'où as-tu mis mes clés ?'],
+    'Portuguese': ['oi, tudo bem?', 'obrigado pela ajuda', 'eu gosto dessa música', 'onde você pôs minhas chaves?'],
+    'Italian': ['ciao, come stai?', 'grazie mille', 'mi piace questa canzone', 'dove hai messo le mie chiavi?'],
+    'German': ['hallo, wie geht es dir?', 'vielen dank', 'ich liebe dieses lied', 'wo hast du meine schlüssel?'],
+    'Chinese': ['你好吗', '谢谢你的帮助', '这个很好笑', '请把链接发给我', '我喜欢这首歌', '你觉得怎么样'],
+}
+REPEAT = 5
+
+
+def create(culture: str, options: DateTimeOptions):
+    if culture == 'Chinese':
+        return ChineseMergedExtractor(options)
+    module = importlib.import_module(
+        'recognizers_date_time.date_time.{}.merged_extractor_config'.format(culture.lower()))
+    configuration = getattr(module, '{}MergedExtractorConfiguration'.format(culture))
+    return BaseMergedExtractor(configuration(), options)
+
+
+def measure(extractor, messages) -> float:
+    for message in messages:
+        extractor.extract(message)
+    start = default_timer()
+    for _ in range(REPEAT):
+        for message in messages:
+            extractor.extract(message)
+    return (default_timer() - start) / (REPEAT * len(messages))
+
+
+def main():
+    print('{:<12}{:>12}{:>14}{:>16}'.format('culture', 'fail fast', 'none (ms)', 'fail fast (ms)'))
+    for culture, messages in MESSAGES.items():
+        fail_fast = create(culture, DateTimeOptions.FAIL_FAST)
+        rate = sum(1 for message in messages if fail_fast.is_fail_fast_case(message)) / len(messages)
+        without = measure(create(culture, DateTimeOptions.NONE), messages)
+        with_fail_fast = measure(fail_fast, messages)
+        print('{:<12}{:>12.0%}{:>14.2f}{:>16.2f}'.format(culture, rate, without * 1e3, with_fail_fast * 1e3))
+
+
+if __name__ == '__main__':
+    main()
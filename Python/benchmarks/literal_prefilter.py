@@ -0,0 +1,60 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+"""
+Times the merged date time extractor over chat messages without dates, with and
+without the literal prefilter, and prints how often each sub-extractor was skipped.
+
+    python benchmarks/literal_prefilter.py
+"""
+
+from timeit import default_timer
+
+from recognizers_text.literal_prefilter import LiteralPrefilter
+from recognizers_date_time.date_time.base_merged import BaseMergedExtractor
+from recognizers_date_time.date_time.chinese.merged_extractor import ChineseMergedExtractor
+from recognizers_date_time.date_time.english.merged_extractor_config import EnglishMergedExtractorConfiguration
+from recognizers_date_time.date_time.utilities import DateTimeOptions
+
+ENGLISH = ['hey how are you doing', 'lol that is so funny', 'can you send me the link please', 'thanks!',
+           'ok sounds good', 'I love this song', 'where did you put my keys', 'omg no way',
+           'what do you think about it', 'brb', 'great job everyone', 'who is coming?']
+CHINESE = ['你好吗', '谢谢你的帮助', '这个很好笑', '请把链接发给我', '我喜欢这首歌', '你觉得怎么样']
+REPEAT = 5
+
+
+def measure(extractor, messages) -> float:
+    start = default_timer()
+    for _ in range(REPEAT):
+        for message in messages:
+            extractor.extract(message)
+    return (default_timer() - start) / (REPEAT * len(messages))
+
+
+def main():
+    extractors = [
+        ('english', BaseMergedExtractor(EnglishMergedExtractorConfiguration(), DateTimeOptions.NONE), ENGLISH),
+        ('chinese', ChineseMergedExtractor(DateTimeOptions.NONE), CHINESE),
+    ]
+
+    may_match = LiteralPrefilter.may_match
+    for name, extractor, messages in extractors:
+        measure(extractor, messages)
+        for prefilter in extractor._prefilters.values():
+            prefilter.reset_statistics()
+        with_prefilter = measure(extractor, messages)
+        statistics = extractor.prefilter_statistics()
+        LiteralPrefilter.may_match = lambda self, text: True
+        try:
+            without_prefilter = measure(extractor, messages)
+        finally:
+            LiteralPrefilter.may_match = may_match
+
+        print('{}: {:.2f} ms per message without prefilter, {:.2f} ms with'.format(
+            name, without_prefilter * 1e3, with_prefilter * 1e3))
+        for sub_extractor, value in statistics.items():
+            print('  {:<30}{:>8.0%} skipped'.format(sub_extractor, value.skip_rate))
+
+
+if __name__ == '__main__':
+    main()
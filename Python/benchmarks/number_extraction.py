@@ -0,0 +1,48 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+"""
+Times number and sequence extraction over documents of growing length to show
+that span assembly scales linearly with the input.
+
+    python benchmarks/number_extraction.py
+"""
+
+from timeit import default_timer
+
+from recognizers_number.number.english.extractors import EnglishNumberExtractor
+from recognizers_sequence.sequence.sequence_recognizer import SequenceOptions
+from recognizers_sequence.sequence.extractors import BaseIpExtractor
+from recognizers_sequence.sequence.english.extractors import EnglishHashtagExtractor, EnglishIpExtractorConfiguration
+
+SENTENCE = 'We shipped 12 boxes, 3.5 tons and twenty one crates to 42 stores via 10.0.0.1 #logistics. '
+SIZES = [10000, 20000, 40000, 80000]
+REPEAT = 3
+
+
+def measure(extractor, source: str) -> float:
+    best = None
+    for _ in range(REPEAT):
+        start = default_timer()
+        extractor.extract(source)
+        elapsed = default_timer() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    extractors = [('number', EnglishNumberExtractor()),
+                  ('hashtag', EnglishHashtagExtractor()),
+                  ('ip', BaseIpExtractor(EnglishIpExtractorConfiguration(SequenceOptions.NONE)))]
+
+    print('{:<14}{:>10}{:>10}{:>12}{:>16}'.format('extractor', 'chars', 'results', 'seconds', 'us per char'))
+    for name, extractor in extractors:
+        for size in SIZES:
+            source = (SENTENCE * (size // len(SENTENCE) + 1))[:size]
+            results = len(extractor.extract(source))
+            seconds = measure(extractor, source)
+            print('{:<14}{:>10}{:>10}{:>12.4f}{:>16.3f}'.format(name, size, results, seconds, seconds / size * 1e6))
+
+
+if __name__ == '__main__':
+    main()
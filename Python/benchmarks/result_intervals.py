@@ -0,0 +1,99 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+"""
+Merges the results of a long document with the merged extractor's add_to and
+merge_all_tokens, against the scan over every merged result they used to do, and
+times the English merged extractor on documents of growing length.
+
+    python benchmarks/result_intervals.py
+"""
+
+import random
+from datetime import datetime
+from timeit import default_timer
+from typing import List
+
+from recognizers_text import ExtractResult
+from recognizers_date_time.date_time.base_merged import BaseMergedExtractor
+from recognizers_date_time.date_time.english.merged_extractor_config import EnglishMergedExtractorConfiguration
+from recognizers_date_time.date_time.utilities import DateTimeOptions, Token, merge_all_tokens
+
+SENTENCES = ['Let us meet tomorrow at 5pm.', 'The report is due on March 3rd.', 'I was out for two weeks.',
+             'Call me between 9 and 11 am next monday.', 'Nothing else to add here, thanks.']
+REFERENCE = datetime(2016, 11, 7)
+
+
+def scan_add_to(destinations: List[ExtractResult], source: List[ExtractResult]) -> List[ExtractResult]:
+    for value in source:
+        overlap_indexes = [index for index, d in enumerate(destinations) if d.overlap(value) and d.cover(value)]
+        if not any(d.overlap(value) for d in destinations):
+            destinations.append(value)
+        elif overlap_indexes:
+            destinations = [d for index, d in enumerate(destinations) if index not in overlap_indexes]
+            destinations.insert(overlap_indexes[0], value)
+    return destinations
+
+
+def scan_merge_all_tokens(tokens: List[Token]) -> List[Token]:
+    merged: List[Token] = list()
+    for token in sorted(tokens, key=lambda x: x.start):
+        add = True
+        for index, m_token in enumerate(merged):
+            if not add:
+                break
+            if token.start >= m_token.start and token.end <= m_token.end:
+                add = False
+            if m_token.start < token.start < m_token.end:
+                add = False
+            if token.start <= m_token.start and token.end >= m_token.end:
+                add = False
+                merged[index] = token
+        if add:
+            merged.append(token)
+    return merged
+
+
+def results(count: int, seed: int) -> List[ExtractResult]:
+    generator = random.Random(seed)
+    values = []
+    for _ in range(count):
+        value = ExtractResult()
+        value.start = generator.randrange(count * 30)
+        value.length = generator.randint(3, 25)
+        values.append(value)
+    return values
+
+
+def elapsed(function, *args) -> float:
+    start = default_timer()
+    function(*args)
+    return default_timer() - start
+
+
+def main():
+    extractor = BaseMergedExtractor(EnglishMergedExtractorConfiguration(), DateTimeOptions.NONE)
+
+    print('{:>8}{:>16}{:>18}{:>16}{:>18}'.format(
+        'results', 'add_to scan ms', 'add_to sorted ms', 'tokens scan ms', 'tokens sorted ms'))
+    for count in (100, 1000, 5000):
+        destinations, source = results(count, 1), results(count, 2)
+        tokens = [Token(r.start, r.start + r.length) for r in destinations + source]
+        print('{:>8}{:>16.1f}{:>18.1f}{:>16.1f}{:>18.1f}'.format(
+            count,
+            elapsed(scan_add_to, list(destinations), source) * 1e3,
+            elapsed(extractor.add_to, list(destinations), source, '') * 1e3,
+            elapsed(scan_merge_all_tokens, tokens) * 1e3,
+            elapsed(merge_all_tokens, tokens, '', 'date') * 1e3))
+
+    print()
+    print('{:>10}{:>10}{:>14}'.format('sentences', 'results', 'extract (s)'))
+    for count in (25, 50, 100):
+        document = ' '.join(SENTENCES[i % len(SENTENCES)] for i in range(count))
+        start = default_timer()
+        extracted = extractor.extract(document, REFERENCE)
+        print('{:>10}{:>10}{:>14.2f}'.format(count, len(extracted), default_timer() - start))
+
+
+if __name__ == '__main__':
+    main()
@@ -8,7 +8,7 @@ from recognizers_choice.choice.extractors import BooleanExtractor
 from recognizers_choice.choice.english import EnglishBooleanExtractorConfiguration
 from recognizers_choice.choice.models import BooleanModel
 from recognizers_choice.choice.parsers import BooleanParser
-from recognizers_text import Culture, Recognizer, ModelResult, Model
+from recognizers_text import Culture, Recognizer, RecognizerRegistry, ModelResult, Model
 
 
 class ChoiceOptions(IntFlag):
@@ -19,7 +19,7 @@ def recognize_boolean(query: str,
                       culture: str,
                       options: ChoiceOptions = ChoiceOptions.NONE,
                       fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = ChoiceRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(ChoiceRecognizer, culture, options)
     model = recognizer.get_boolean_model(culture, fallback_to_default_culture)
     return model.parse(query)
 
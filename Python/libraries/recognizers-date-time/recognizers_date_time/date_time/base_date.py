@@ -9,9 +9,10 @@ from recognizers_date_time.date_time.abstract_year_extractor import AbstractYear
 from datedelta import datedelta
 from recognizers_text.extractor import ExtractResult
 from recognizers_text.utilities import RegExpUtility, flatten
+from recognizers_text.regex_set import RegexSet
 from recognizers_number.number import Constants as NumberConstants
 from .constants import Constants, TimeTypeConstants
-from .extractors import DateTimeExtractor
+from .extractors import DateTimeExtractor, memoized_extract
 from .parsers import DateTimeParser, DateTimeParseResult
 from .utilities import Token, MatchingUtil
 import regex
@@ -224,7 +225,9 @@ class BaseDateExtractor(DateTimeExtractor, AbstractYearExtractor):
 
     def __init__(self, config: DateExtractorConfiguration):
         super().__init__(config)
+        self._date_regex_set = RegexSet((regexp, None) for regexp in config.date_regex_list)
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         from .utilities import merge_all_tokens
         if reference is None:
@@ -244,30 +247,20 @@ class BaseDateExtractor(DateTimeExtractor, AbstractYearExtractor):
         from .utilities import RegExpUtility
         ret: List[Token] = list()
 
-        for regexp in self.config.date_regex_list:
+        for match, _ in self._date_regex_set.finditer(source):
+
+            # some match might be part of the date range entity, and might be split in a wrong way
+            if self.validate_match(match, source):
 
-            matches = list(regexp.finditer(source))
-            if matches:
-                for match in matches:
-
-                    # some match might be part of the date range entity, and might be split in a wrong way
-                    if self.validate_match(match, source):
-
-                        # Cases that the relative term is before
-                        # the detected date entity, like "this 5/12", "next friday 5/12"
-                        pre_text = source[0:source.index(match.group())]
-                        relative_regex = RegExpUtility.match_end(self.config.strict_relative_regex, pre_text, True)
-
-                        if relative_regex:
-                            if relative_regex.success:
-                                ret.append(Token(relative_regex.index, source.index(match.group())
-                                                 + match.end() - match.start()))
-                            else:
-                                ret.append(Token(source.index(match.group()),
-                                                 source.index(match.group()) + match.end() - match.start()))
-                        else:
-                            ret.append(Token(source.index(match.group()),
-                                             source.index(match.group()) + match.end() - match.start()))
+                # Cases that the relative term is before
+                # the detected date entity, like "this 5/12", "next friday 5/12"
+                pre_text = source[0:match.start()]
+                relative_regex = RegExpUtility.match_end(self.config.strict_relative_regex, pre_text, True)
+
+                if relative_regex and relative_regex.success:
+                    ret.append(Token(relative_regex.index, match.end()))
+                else:
+                    ret.append(Token(match.start(), match.end()))
 
         return ret
 
@@ -284,11 +277,11 @@ class BaseDateExtractor(DateTimeExtractor, AbstractYearExtractor):
             year_group = RegExpUtility.get_group(
                 match, Constants.YEAR_GROUP_NAME)
             # If the "year" part is not at the end of the match, it's a valid match
-            if not text.index(year_group) + len(year_group) == text.index(match.group())\
-                    + (match.end() - match.start()):
+            year_start = match.start(Constants.YEAR_GROUP_NAME)
+            if not year_start + len(year_group) == match.end():
                 is_valid_match = True
             else:
-                sub_text = text[text.index(year_group):]
+                sub_text = text[year_start:]
 
                 # If the following text (include the "year" part) doesn't start with a Date entity, it's a valid match
                 if not self.starts_with_basic_date(sub_text):
@@ -302,7 +295,7 @@ class BaseDateExtractor(DateTimeExtractor, AbstractYearExtractor):
                     # though "2018-10-2" a valid match (indicates the first year "2018" might
                     # belongs to the second Date entity), but "10-2-2018" is also
 
-                    sub_text = text[text.index(year_group) + len(year_group):].strip()
+                    sub_text = text[year_start + len(year_group):].strip()
                     sub_text = self.trim_start_range_connector_symbols(sub_text)
                     is_valid_match = self.starts_with_basic_date(sub_text)
 
@@ -330,7 +323,7 @@ class BaseDateExtractor(DateTimeExtractor, AbstractYearExtractor):
         for symbol_match in range_connector_symbol_matches:
             start_symbol_length = -1
 
-            if symbol_match and text.index(symbol_match.group()) == 0 and len(symbol_match.group()) >\
+            if symbol_match and symbol_match.start() == 0 and len(symbol_match.group()) >\
                     start_symbol_length:
                 start_symbol_length = len(symbol_match.group())
 
@@ -14,7 +14,7 @@ from recognizers_text.extractor import ExtractResult, Extractor, Metadata
 from recognizers_date_time.date_time.date_extractor import DateExtractor
 from recognizers_number.number import BaseNumberParser, BaseNumberExtractor
 from .constants import Constants, TimeTypeConstants
-from .extractors import DateTimeExtractor
+from .extractors import DateTimeExtractor, memoized_extract
 from .parsers import DateTimeParser, DateTimeParseResult
 from .base_date import BaseDateParser
 from .base_duration import BaseDurationParser
@@ -222,6 +222,7 @@ class BaseDatePeriodExtractor(DateTimeExtractor):
     def __init__(self, config: DatePeriodExtractorConfiguration):
         self.config = config
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if not reference:
             reference = datetime.now()
@@ -251,15 +252,14 @@ class BaseDatePeriodExtractor(DateTimeExtractor):
                 continue
 
             after_string = text[er.start + er.length:]
-            trimmed_after_string = after_string.rstrip()
+            trimmed_after_string = after_string.lstrip()
             white_spaces_count = len(after_string) - len(trimmed_after_string)
             after_string_offset = (er.start + er.length) + white_spaces_count
 
             match = regex.match(self.config.century_suffix_regex, trimmed_after_string)
 
             if match:
-                result.append(Token(er.start, after_string_offset + text.index(match.group()) +
-                                    (match.end() - match.start())))
+                result.append(Token(er.start, after_string_offset + match.end()))
 
         return result
 
@@ -306,7 +306,7 @@ class BaseDatePeriodExtractor(DateTimeExtractor):
                     if self.has_invalid_dash_context(match, text):
                         continue
 
-            result.append(Token(match.start(), match.start() - (match.end() - match.start()), metadata))
+            result.append(Token(match.start(), match.end(), metadata))
 
         return result
 
@@ -326,8 +326,7 @@ class BaseDatePeriodExtractor(DateTimeExtractor):
                                                                                                  dash_prefix_index)
 
             if has_digit_number_before_dash:
-                digit_number_str = text[number_start_index: number_start_index + (text.index(match.group()) -
-                                                                                  1 - number_start_index)]
+                digit_number_str = text[number_start_index: match.start() - 1]
 
                 if RegExpUtility.is_exact_match(self.config.month_num_regex, digit_number_str, True):
                     has_invalid_dash_context = True
@@ -340,7 +339,7 @@ class BaseDatePeriodExtractor(DateTimeExtractor):
 
             has_digit_number_after_dash, number_end_index = self.has_digit_number_after_dash(text, dash_suffix_index)
 
-            number_start_index = text.index(match.group()) + (match.end() - match.start()) + 1
+            number_start_index = match.end() + 1
             digit_number_str = text[number_start_index: number_start_index + (number_end_index - number_start_index)]
 
             if RegExpUtility.is_exact_match(self.config.month_num_regex, digit_number_str, True):
@@ -379,7 +378,7 @@ class BaseDatePeriodExtractor(DateTimeExtractor):
 
         dash_suffix_index = -1
 
-        i = source.index(match.group()) + (match.end() - match.start())
+        i = match.end()
         for i in range(i, len(source) + 1, 1):
             if source[i] != ' ' and source[i] != '-':
                 break
@@ -396,7 +395,7 @@ class BaseDatePeriodExtractor(DateTimeExtractor):
 
         dash_prefix_index = -1
 
-        i = source.index(match.group()) - 1
+        i = match.start() - 1
         for i in range(i, 0, -1):
             if source[i] != ' ' and source[i] != '-':
                 break
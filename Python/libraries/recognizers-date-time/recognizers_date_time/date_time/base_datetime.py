@@ -13,7 +13,7 @@ from recognizers_number.number.extractors import BaseNumberExtractor
 from recognizers_number.number.parsers import BaseNumberParser
 from .constants import Constants, TimeTypeConstants
 from recognizers_number.number.constants import Constants as NumConstants
-from .extractors import DateTimeExtractor
+from .extractors import DateTimeExtractor, memoized_extract
 from .parsers import DateTimeParser, DateTimeParseResult
 from .utilities import Token, merge_all_tokens, DateTimeResolutionResult, DateTimeUtilityConfiguration, AgoLaterUtil,\
     DateTimeFormatUtil, RegExpUtility, AgoLaterMode, DateTimeOptionsConfiguration, DateTimeOptions
@@ -128,6 +128,7 @@ class BaseDateTimeExtractor(DateTimeExtractor):
     def __init__(self, config: DateTimeExtractorConfiguration):
         self.config = config
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
 
         if reference is None:
@@ -154,9 +155,9 @@ class BaseDateTimeExtractor(DateTimeExtractor):
             return tokens
 
         time_ers = self.config.time_point_extractor.extract(source, reference)
-        time_num_matches = self.config.number_as_time_regex.match(source)
+        time_num_matches = list(self.config.number_as_time_regex.finditer(source))
 
-        if len(time_ers) == 0 and time_num_matches == 0:
+        if len(time_ers) == 0 and len(time_num_matches) == 0:
             return tokens
 
         extract_results = date_ers
@@ -172,9 +173,9 @@ class BaseDateTimeExtractor(DateTimeExtractor):
             for idx in range(idx, len(time_num_matches), 1):
                 match = time_num_matches[idx]
                 node = ExtractResult()
-                node.start = source.index(match.group())
+                node.start = match.start()
                 node.length = len(match.group())
-                node.text = match.text
+                node.text = match.group()
                 node.type = NumConstants.SYS_NUM_INTEGER
                 num_ers.append(node)
 
@@ -219,8 +220,7 @@ class BaseDateTimeExtractor(DateTimeExtractor):
                     # for case like "3 pm or later on monday"
                     match = self.config.suffix_after_regex.search(middle_str)
                     if match:
-                        middle_str = middle_str[
-                            middle_str.index(match.group()) + len(match.group()): len(middle_end)].strip()
+                        middle_str = middle_str[match.end():].strip()
 
                     if not (match and len(middle_str) == 0):
                         if self.config.is_connector_token(middle_str):
@@ -259,7 +259,7 @@ class BaseDateTimeExtractor(DateTimeExtractor):
         # check whether there's a year behind.
         suffix = text[end_index:]
         match_year = self.config.year_suffix.search(suffix)
-        if match_year and suffix.index(match_year.group()) == 0:
+        if match_year and match_year.start() == 0:
 
             check_year = self.config.date_point_extractor.get_year_from_text(self.config.year_regex.search(text))
             year = self.config.date_point_extractor.get_year_from_text(match_year)
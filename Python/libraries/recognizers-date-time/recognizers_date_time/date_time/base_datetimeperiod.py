@@ -15,7 +15,7 @@ from .base_datetime import BaseDateTimeExtractor
 from .base_duration import BaseDurationExtractor
 from .base_timeperiod import BaseTimePeriodExtractor
 from .constants import Constants, TimeTypeConstants
-from .extractors import DateTimeExtractor
+from .extractors import DateTimeExtractor, memoized_extract
 from .parsers import DateTimeParser, DateTimeParseResult
 from .utilities import Token, merge_all_tokens, RegExpUtility, DateTimeFormatUtil, DateTimeResolutionResult, \
     DateUtils, RegExpUtility, DateTimeOptionsConfiguration, DateTimeOptions, TimexUtil
@@ -223,6 +223,7 @@ class BaseDateTimePeriodExtractor(DateTimeExtractor):
     def __init__(self, config: DateTimePeriodExtractorConfiguration):
         self.config = config
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
             reference = datetime.now()
@@ -674,12 +675,14 @@ class BaseDateTimePeriodExtractor(DateTimeExtractor):
         match = self.config.within_next_prefix_regex.match(sub_str)
 
         if self.match_prefix_regex_in_segment(sub_str, match, in_prefix):
+            # sub_str is the text before or after the duration with its spaces stripped
             if in_prefix:
-                start_token = source.index(match.group())
+                start_token = len(source) - len(source.lstrip()) + match.start()
                 end_token = duration.end + 0
             else:
+                after_str = source[duration.end:]
                 start_token = duration.start
-                end_token = duration.end + (source.index(match.group()) + duration.length)
+                end_token = duration.end + len(after_str) - len(after_str.lstrip()) + match.end()
             match = self.config.time_unit_regex.match(source[duration.start: duration.length])
             success = match
 
@@ -11,7 +11,7 @@ from recognizers_text.extractor import ExtractResult
 from recognizers_number.number.extractors import BaseNumberExtractor
 from recognizers_number.number.parsers import BaseNumberParser
 from .constants import Constants, TimeTypeConstants
-from .extractors import DateTimeExtractor
+from .extractors import DateTimeExtractor, memoized_extract
 from .parsers import DateTimeParser, DateTimeParseResult
 from .utilities import Token, merge_all_tokens, DateTimeResolutionResult, RegExpUtility,\
     DateTimeOptionsConfiguration, DateTimeOptions, DurationParsingUtil, RegExpUtility
@@ -113,6 +113,7 @@ class BaseDurationExtractor(DateTimeExtractor):
         self.config = config
         self.merge = merge
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
             reference = datetime.now()
@@ -158,8 +159,8 @@ class BaseDurationExtractor(DateTimeExtractor):
 
             if is_inequality_prefix_matched:
                 if not is_match_after:
-                    extract_result.length += extract_result.start - text.index(match.group())
-                    extract_result.start = text.index(match.group())
+                    extract_result.length += extract_result.start - match.index
+                    extract_result.start = match.index
                     extract_result.text = text[extract_result.start: extract_result.start + extract_result.length]
                 else:
                     extract_result.length += match.index + match.length
@@ -9,7 +9,7 @@ from calendar import Calendar
 from recognizers_text.extractor import ExtractResult, Metadata
 from ..resources.base_date_time import BaseDateTime
 from .constants import Constants, TimeTypeConstants
-from .extractors import DateTimeExtractor
+from .extractors import DateTimeExtractor, memoized_extract
 from .parsers import DateTimeParser, DateTimeParseResult
 from .utilities import Token, merge_all_tokens, DateTimeFormatUtil, DayOfWeek, DateTimeResolutionResult, DateUtils
 
@@ -29,6 +29,7 @@ class BaseHolidayExtractor(DateTimeExtractor):
     def __init__(self, config: HolidayExtractorConfiguration):
         self.config = config
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if not reference:
             reference = datetime.now()
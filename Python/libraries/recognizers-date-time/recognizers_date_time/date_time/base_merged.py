@@ -9,6 +9,8 @@ import regex
 
 from recognizers_text.extractor import Extractor, ExtractResult
 from recognizers_text.meta_data import MetaData
+from recognizers_text.literal_prefilter import LiteralPrefilter, PrefilterStatistics
+from recognizers_text.extraction_context import in_extraction_context
 from .constants import Constants, TimeTypeConstants
 from .extractors import DateTimeExtractor
 from .parsers import DateTimeParser, DateTimeParseResult
@@ -22,7 +24,7 @@ from .base_datetimeperiod import BaseDateTimePeriodParser
 from .base_duration import BaseDurationParser
 from .base_set import BaseSetParser
 from .utilities import Token, merge_all_tokens, RegExpUtility, DateTimeOptions, DateTimeFormatUtil, DateUtils,\
-    MatchingUtil, RegExpUtility, TimexUtil
+    MatchingUtil, RegExpUtility, TimexUtil, ResultIntervals
 from .datetime_zone_extractor import DateTimeZoneExtractor
 from .datetime_list_extractor import DateTimeListExtractor
 
@@ -183,6 +185,10 @@ class MergedExtractorConfiguration:
 
 
 class BaseMergedExtractor(DateTimeExtractor):
+    sub_extractor_names = ['date_extractor', 'time_extractor', 'date_period_extractor', 'duration_extractor',
+                           'time_period_extractor', 'date_time_period_extractor', 'date_time_extractor',
+                           'set_extractor', 'holiday_extractor']
+
     @property
     def extractor_type_name(self) -> str:
         return Constants.SYS_DATETIME_MERGED
@@ -190,7 +196,9 @@ class BaseMergedExtractor(DateTimeExtractor):
     def __init__(self, config: MergedExtractorConfiguration, options: DateTimeOptions):
         self.config = config
         self.options = options
+        self._prefilters: Dict[str, LiteralPrefilter] = dict()
 
+    @in_extraction_context
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
             reference = datetime.now()
@@ -198,12 +206,7 @@ class BaseMergedExtractor(DateTimeExtractor):
         result: List[ExtractResult] = list()
 
         if (self.options & DateTimeOptions.FAIL_FAST) != 0 and self.is_fail_fast_case(source):
-
-            ''' @TODO needs better handling of holidays and timezones.
-             self.add_to(result,self.config.holiday_extractor.extract(source,reference), source)
-             result = self.add_mod(result,source)
-            '''
-            return result
+            return self.extract_fail_fast(source, reference)
 
         origin_text = source
 
@@ -216,26 +219,26 @@ class BaseMergedExtractor(DateTimeExtractor):
             )
         # The order is important, since there can be conflicts in merging
         result = self.add_to(
-            result, self.config.date_extractor.extract(source, reference), source)
+            result, self.extract_triggered('date_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.time_extractor.extract(source, reference), source)
+            result, self.extract_triggered('time_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.date_period_extractor.extract(source, reference), source)
+            result, self.extract_triggered('date_period_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.duration_extractor.extract(source, reference), source)
+            result, self.extract_triggered('duration_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.time_period_extractor.extract(source, reference), source)
+            result, self.extract_triggered('time_period_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.date_time_period_extractor.extract(source, reference), source)
+            result, self.extract_triggered('date_time_period_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.date_time_extractor.extract(source, reference), source)
+            result, self.extract_triggered('date_time_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.set_extractor.extract(source, reference), source)
+            result, self.extract_triggered('set_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.holiday_extractor.extract(source, reference), source)
+            result, self.extract_triggered('holiday_extractor', source, reference), source)
 
         if (self.options & DateTimeOptions.ENABLE_PREVIEW) != 0:
-            self.add_to(result, self.config.time_zone_extractor.extract(source, reference), source)
+            result = self.add_to(result, self.config.time_zone_extractor.extract(source, reference), source)
             result = self.config.time_zone_extractor.remove_ambiguous_time_zone(result)
 
         # this should be at the end since if need the extractor to determine the previous text contains time or not
@@ -265,42 +268,57 @@ class BaseMergedExtractor(DateTimeExtractor):
         return result
 
     def add_to(self, destinations: List[ExtractResult], source: List[ExtractResult], text: str) -> List[ExtractResult]:
+        intervals = ResultIntervals(destinations)
         for value in source:
             if self.options & DateTimeOptions.SKIP_FROM_TO_MERGE and self.should_skip_from_merge(value):
                 continue
-            is_found = False
-            overlap_indexes: List[int] = list()
-            first_index = -1
-
-            for index, destination in enumerate(destinations):
-                if destination.overlap(value):
-                    is_found = True
-                    if destination.cover(value):
-                        if first_index == -1:
-                            first_index = index
-                        overlap_indexes.append(index)
-                    else:
-                        continue
-
-            if not is_found:
-                destinations.append(value)
-            elif overlap_indexes:
-                temp_dst: List[ExtractResult] = list()
+            overlapping = intervals.overlapping(value)
+            covered = [rank for rank, destination in overlapping if destination.cover(value)]
 
-                for index, destination in enumerate(destinations):
-                    if index not in overlap_indexes:
-                        temp_dst.append(destination)
+            if not overlapping:
+                intervals.append(value)
+            elif covered:
+                for rank in covered:
+                    intervals.remove(rank)
 
                 # insert at the first overlap occurence to keep the order
-                temp_dst.insert(first_index, value)
-                destinations = temp_dst
-        return destinations
+                intervals.insert(covered[0], value)
+        return intervals.results()
+
+    def extract_triggered(self, name: str, source: str, reference: datetime) -> List[ExtractResult]:
+        # Skips the named sub-extractor when none of the literals its patterns need is in the text.
+        if not self.prefilter(name).may_match(source):
+            return list()
+        return getattr(self.config, name).extract(source, reference)
+
+    def extract_fail_fast(self, source: str, reference: datetime) -> List[ExtractResult]:
+        # Holidays and time zones are not all covered by the fail fast check, they are cheap to look for.
+        result: List[ExtractResult] = list()
+        result = self.add_to(result, self.extract_triggered('holiday_extractor', source, reference), source)
+        if (self.options & DateTimeOptions.ENABLE_PREVIEW) != 0 and self.config.time_zone_extractor is not None:
+            result = self.add_to(result, self.config.time_zone_extractor.extract(source, reference), source)
+            result = self.config.time_zone_extractor.remove_ambiguous_time_zone(result)
+        result = self.add_mod(result, source)
+        return sorted(result, key=lambda x: x.start)
+
+    def prefilter(self, name: str) -> LiteralPrefilter:
+        prefilter = self._prefilters.get(name, None)
+        if prefilter is None:
+            prefilter = LiteralPrefilter.of(getattr(self.config, name))
+            self._prefilters[name] = prefilter
+        return prefilter
+
+    def prefilter_statistics(self) -> Dict[str, PrefilterStatistics]:
+        return {name: prefilter.statistics() for name, prefilter in self._prefilters.items()}
 
     def should_skip_from_merge(self, source: ExtractResult) -> bool:
         return regex.search(self.config.from_to_regex, source.text)
 
-    def is_fail_fast_case(self, text: str):
-        return self.config.fail_fast_regex is not None and not self.config.fail_fast_regex.finditer(text)
+    def is_fail_fast_case(self, text: str) -> bool:
+        if self.config.fail_fast_regex is not None:
+            return self.config.fail_fast_regex.search(text) is None
+        # Cultures without a fail fast regex bail out when no sub-extractor can match at all.
+        return not any(self.prefilter(name).test(text) for name in self.sub_extractor_names)
 
     def filter_unespecific_date_period(self, extract_results: List[ExtractResult]) -> List[ExtractResult]:
         for extract_result in extract_results:
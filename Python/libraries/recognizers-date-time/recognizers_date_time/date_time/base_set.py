@@ -9,7 +9,7 @@ import regex
 from recognizers_text.utilities import RegExpUtility
 from recognizers_text.extractor import ExtractResult
 from .constants import Constants, TimeTypeConstants
-from .extractors import DateTimeExtractor
+from .extractors import DateTimeExtractor, memoized_extract
 from .parsers import DateTimeParser, DateTimeParseResult
 from .utilities import Token, merge_all_tokens, DateTimeResolutionResult
 from .base_duration import BaseDurationParser
@@ -106,6 +106,7 @@ class BaseSetExtractor(DateTimeExtractor):
     def __init__(self, config: SetExtractorConfiguration):
         self.config = config
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
             reference = datetime.now()
@@ -9,7 +9,7 @@ import regex
 from recognizers_text.utilities import RegExpUtility
 from recognizers_text.extractor import ExtractResult
 from .constants import Constants, TimeTypeConstants
-from .extractors import DateTimeExtractor
+from .extractors import DateTimeExtractor, memoized_extract
 from .parsers import DateTimeParser, DateTimeParseResult
 from .utilities import DateTimeOptionsConfiguration, DateTimeOptions, merge_all_tokens, TimeZoneUtility, RegExpUtility
 
@@ -50,6 +50,7 @@ class BaseTimeExtractor(DateTimeExtractor):
     def __init__(self, config: TimeExtractorConfiguration):
         self.config = config
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
 
         if reference is None:
@@ -78,12 +79,8 @@ class BaseTimeExtractor(DateTimeExtractor):
 
         if (self.config.options & DateTimeOptions.CALENDAR) != 0:
 
-            before_after_regex = self.config.time_before_after_regex
-            if before_after_regex.search(source):
-                matches: Match = before_after_regex.match(source)
-                for match in matches:
-                    result.append(Token(source.index(match.group()), source.index(match.group()) +
-                                        (match.end() - match.start())))
+            for match in self.config.time_before_after_regex.finditer(source):
+                result.append(Token(match.start(), match.end()))
 
         return result
 
@@ -11,7 +11,7 @@ from recognizers_text.utilities import RegExpUtility, QueryProcessor
 from recognizers_text.extractor import Extractor, ExtractResult, Metadata
 from recognizers_date_time.date_time.base_time import BaseTimeExtractor, BaseTimeParser
 from .constants import Constants, TimeTypeConstants
-from .extractors import DateTimeExtractor
+from .extractors import DateTimeExtractor, memoized_extract
 from .parsers import DateTimeParser, DateTimeParseResult
 from .utilities import Token, merge_all_tokens, DateTimeResolutionResult, \
     DateTimeUtilityConfiguration, DateTimeFormatUtil, ResolutionStartEnd, DateTimeOptionsConfiguration, DateTimeOptions
@@ -92,6 +92,7 @@ class BaseTimePeriodExtractor(DateTimeExtractor):
     def __init__(self, config: TimePeriodExtractorConfiguration):
         self.config = config
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
             reference = datetime.now()
@@ -119,13 +120,11 @@ class BaseTimePeriodExtractor(DateTimeExtractor):
 
         for regexp in self.config.pure_number_regex:
 
-            matches = regexp.search(text)
-            for match in matches:
-                after_str = text[text.index(match.group()) + (match.end() - match.start()):]
+            for match in regexp.finditer(text):
+                after_str = text[match.end():]
                 ending_match = self.config.general_ending_regex.search(after_str)
                 if ending_match:
-                    ret.append(Token(text.index(match.group()),
-                                     text.index(match.group()) + (match.end() - match.start())))
+                    ret.append(Token(match.start(), match.end()))
         return ret
 
     def match_simple_cases(self, source: str) -> List[Token]:
@@ -147,11 +146,11 @@ class BaseTimePeriodExtractor(DateTimeExtractor):
                         end_with_valid_token = False
 
                         # "No extra tokens after the time period"
-                        if (source.index(match.group()) + (match.end() - match.start())) == len(source):
+                        if match.end() == len(source):
                             end_with_valid_token = True
 
                         else:
-                            after_str = source[source.index(match.group()) + (match.end() - match.start()):]
+                            after_str = source[match.end():]
 
                             end_with_general_endings = self.config.general_ending_regex.match(after_str)
                             end_with_am_pm = RegExpUtility.get_group(match, Constants.RIGHT_AM_PM_GROUP_NAME)
@@ -164,8 +163,7 @@ class BaseTimePeriodExtractor(DateTimeExtractor):
                                 end_with_valid_token = False
 
                         if end_with_valid_token:
-                            result.append(Token(source.index(match.group()), source.index(match.group()) +
-                                                (match.end() - match.start())))
+                            result.append(Token(match.start(), match.end()))
                     else:
                         # Is there "pm" or "am"?
                         match_pm_str = RegExpUtility.get_group(match, Constants.PM_GROUP_NAME)
@@ -174,15 +172,13 @@ class BaseTimePeriodExtractor(DateTimeExtractor):
 
                         # Check "pm", "am"
                         if match_pm_str or match_am_str or desc_str:
-                            result.append(Token(source.index(match.group()), source.index(match.group()) +
-                                                (match.end() - match.start())))
+                            result.append(Token(match.start(), match.end()))
                         else:
-                            after_str = source[source.index(match.group()) + (match.end() - match.start()):]
+                            after_str = source[match.end():]
 
                             # When TimeZone be migrated enable it
                             if (self.config.options & DateTimeOptions.ENABLE_PREVIEW) != 0:
-                                result.append(Token(source.index(match.group()),
-                                                    source.index(match.group()) + (match.end() - match.start())))
+                                result.append(Token(match.start(), match.end()))
 
         return result
 
@@ -318,8 +314,8 @@ class BaseTimePeriodExtractor(DateTimeExtractor):
                 meta = Metadata()
                 meta.is_mealtime = True
 
-            result.append(Token(start=source.index(match.group()),
-                                end=source.index(match.group()) + (match.end() - match.start()),
+            result.append(Token(start=match.start(),
+                                end=match.end(),
                                 metadata=meta))
         return result
 
@@ -13,6 +13,7 @@ from .constants import Constants
 from ..resources import TimeZoneDefinitions
 from recognizers_text import ExtractResult, RegExpUtility, QueryProcessor
 from recognizers_text.matcher.string_matcher import StringMatcher
+from .extractors import memoized_extract
 
 
 class TimeZoneExtractorConfiguration(DateTimeOptionsConfiguration):
@@ -166,6 +167,7 @@ class BaseTimeZoneExtractor(DateTimeZoneExtractor):
     def __init__(self, config: TimeZoneExtractorConfiguration):
         self.config = config
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         from .utilities import merge_all_tokens
         tokens = []
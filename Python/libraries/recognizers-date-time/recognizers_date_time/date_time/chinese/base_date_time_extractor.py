@@ -6,7 +6,8 @@ from datetime import datetime
 import regex
 
 from recognizers_text import ExtractResult
-from ..extractors import DateTimeExtractor
+from recognizers_text.utilities import MatchedSpans
+from ..extractors import DateTimeExtractor, memoized_extract
 
 
 class DateTimeExtra:
@@ -65,6 +66,7 @@ class ChineseBaseDateTimeExtractor(DateTimeExtractor):
         self._extractor_type_name = None
         self._regex_dict = regex_dict
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
 
         if reference is None:
@@ -74,48 +76,28 @@ class ChineseBaseDateTimeExtractor(DateTimeExtractor):
         if not source:
             return result
 
-        match_source: Dict[Match, any] = dict()
-        matched: List[bool] = [False] * len(source)
-
-        collections = list(map(lambda x: (
-            list(regex.finditer(x[0], source)), x[1]), self._regex_dict.items()))
-        collections = list(filter(lambda x: len(x[0]) > 0, collections))
-
-        for collection in collections:
-            for match in collection[0]:
-                for j in range(len(match.group())):
-                    matched[match.start() + j] = True
-                match_source[match] = collection[1]
-
-        last = -1
-        for i in range(len(source)):
-            if matched[i]:
-                if i + 1 == len(source) or not matched[i + 1]:
-                    start = last + 1
-                    length = i - last
-                    text = source[start:start+length].strip()
-                    src_match = next((x for x in iter(match_source) if (
-                        x.start() == start and (x.end() - x.start()) == length)), None)
-                    if src_match:
-                        value = ExtractResult()
-                        value.start = start
-                        value.length = length
-                        value.text = text
-                        value.type = self.extractor_type_name
-                        value.data = self.__get_data(match_source, src_match)
-                        result.append(value)
-            else:
-                last = i
+        spans = MatchedSpans(len(source))
+
+        for pattern, data_type in self._regex_dict.items():
+            for match in regex.finditer(pattern, source):
+                spans.add(match, data_type)
+
+        for span in spans:
+            if span.match is not None:
+                value = ExtractResult()
+                value.start = span.start
+                value.length = span.length
+                value.text = source[span.start:span.start + span.length].strip()
+                value.type = self.extractor_type_name
+                value.data = self.__get_data(span.match, span.data)
+                result.append(value)
 
         return result
 
     @staticmethod
-    def __get_data(source: Dict[Match, any], key: Match) -> any:
-        if key not in source:
-            return None
-
+    def __get_data(match: Match, data_type: any) -> any:
         result = DateTimeExtra()
-        result.data_type = source[key]
-        result.named_entity = key.capturesdict()
-        result.match = key
+        result.data_type = data_type
+        result.named_entity = match.capturesdict()
+        result.match = match
         return result
@@ -11,6 +11,8 @@ from ..utilities import merge_all_tokens, Token, get_tokens_from_regex
 from ..base_date import BaseDateExtractor
 from .date_extractor_config import ChineseDateExtractorConfiguration
 from .duration_extractor import ChineseDurationExtractor
+from ..component_container import ChineseDateTimeComponents
+from ..extractors import memoized_extract
 
 
 class ChineseDateExtractor(BaseDateExtractor):
@@ -22,9 +24,10 @@ class ChineseDateExtractor(BaseDateExtractor):
         ChineseDateTime.DateTimePeriodUnitRegex)
 
     def __init__(self):
-        super().__init__(ChineseDateExtractorConfiguration())
-        self.duration_extractor = ChineseDurationExtractor()
+        super().__init__(ChineseDateTimeComponents.get(ChineseDateExtractorConfiguration))
+        self.duration_extractor = ChineseDateTimeComponents.get(ChineseDurationExtractor)
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
             reference = datetime.now()
@@ -19,13 +19,14 @@ from ..parsers import DateTimeParseResult
 from ..base_date import BaseDateParser
 from .date_parser_config import ChineseDateParserConfiguration
 from ..utilities import parse_chinese_dynasty_year
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseDateParser(BaseDateParser):
-    integer_extractor = ChineseIntegerExtractor()
+    integer_extractor = ChineseDateTimeComponents.get(ChineseIntegerExtractor)
 
     def __init__(self):
-        super().__init__(ChineseDateParserConfiguration())
+        super().__init__(ChineseDateTimeComponents.get(ChineseDateParserConfiguration))
         self.lunar_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.LunarRegex)
         self.special_date_regex = RegExpUtility.get_safe_reg_exp(
@@ -36,7 +37,7 @@ class ChineseDateParser(BaseDateParser):
             ChineseDateTime.LastPrefixRegex)
         self.month_max_days: List[int] = [
             31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-        self.duration_extractor = ChineseDurationExtractor()
+        self.duration_extractor = ChineseDateTimeComponents.get(ChineseDurationExtractor)
 
     def parse(self, source: ExtractResult, reference: datetime = None) -> Optional[DateTimeParseResult]:
         if reference is None:
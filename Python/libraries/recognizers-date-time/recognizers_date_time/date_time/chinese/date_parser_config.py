@@ -10,6 +10,7 @@ from ...resources.chinese_date_time import ChineseDateTime
 from ..constants import Constants
 from ..base_date import DateParserConfiguration
 from ..extractors import DateTimeExtractor
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseDateParserConfiguration(DateParserConfiguration):
@@ -221,7 +222,8 @@ class ChineseDateParserConfiguration(DateParserConfiguration):
         self._dynasty_year_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.DynastyYearRegex)
         self._dynasty_year_map = ChineseDateTime.DynastyYearMap
-        self._integer_extractor = ChineseIntegerExtractor()
-        self._number_parser = CJKNumberParser(ChineseNumberParserConfiguration())
+        self._integer_extractor = ChineseDateTimeComponents.get(ChineseIntegerExtractor)
+        self._number_parser = ChineseDateTimeComponents.get(
+            CJKNumberParser, ChineseNumberParserConfiguration)
         self._date_extractor = None
         self._dynasty_start_year = ChineseDateTime.DynastyStartYear
@@ -10,12 +10,15 @@ from recognizers_text import ExtractResult
 from ..base_dateperiod import BaseDatePeriodExtractor
 from ..utilities import merge_all_tokens, Token, RegExpUtility
 from .dateperiod_extractor_config import ChineseDatePeriodExtractorConfiguration
+from ..component_container import ChineseDateTimeComponents
+from ..extractors import memoized_extract
 
 
 class ChineseDatePeriodExtractor(BaseDatePeriodExtractor):
     def __init__(self):
-        super().__init__(ChineseDatePeriodExtractorConfiguration())
+        super().__init__(ChineseDateTimeComponents.get(ChineseDatePeriodExtractorConfiguration))
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
 
         if not reference:
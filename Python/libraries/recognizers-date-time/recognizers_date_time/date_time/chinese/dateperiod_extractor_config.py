@@ -11,6 +11,7 @@ from ...resources.chinese_date_time import ChineseDateTime
 from ..extractors import DateTimeExtractor
 from ..base_dateperiod import DatePeriodExtractorConfiguration, MatchedIndex
 from .date_extractor import ChineseDateExtractor
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
@@ -268,16 +269,16 @@ class ChineseDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
             ChineseDateTime.PastRegex)
         self._future_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.FutureRegex)
-        self._date_point_extractor = ChineseDateExtractor()
-        self._integer_extractor = ChineseNumberExtractor()
-        self._number_parser = BaseNumberParser(
-            ChineseNumberParserConfiguration())
+        self._date_point_extractor = ChineseDateTimeComponents.get(ChineseDateExtractor)
+        self._integer_extractor = ChineseDateTimeComponents.get(ChineseNumberExtractor)
+        self._number_parser = ChineseDateTimeComponents.get(
+            BaseNumberParser, ChineseNumberParserConfiguration)
         self._now_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.NowRegex)
         self._month_num_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.MonthNumRegex)
-        self._cardinal_extractor = ChineseCardinalExtractor()
-        self._ordinal_extractor = ChineseOrdinalExtractor()
+        self._cardinal_extractor = ChineseDateTimeComponents.get(ChineseCardinalExtractor)
+        self._ordinal_extractor = ChineseDateTimeComponents.get(ChineseOrdinalExtractor)
 
         # TODO When the implementation for these properties is added, change the None values to their respective Regexps
         self._previous_prefix_regex = None
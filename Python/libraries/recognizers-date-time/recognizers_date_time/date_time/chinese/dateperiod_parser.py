@@ -17,14 +17,15 @@ from ..parsers import DateTimeParseResult
 from ..base_dateperiod import BaseDatePeriodParser
 from .dateperiod_parser_config import ChineseDatePeriodParserConfiguration
 from ..utilities import parse_chinese_dynasty_year
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseDatePeriodParser(BaseDatePeriodParser):
     def __init__(self):
-        super().__init__(ChineseDatePeriodParserConfiguration())
-        self.integer_extractor = ChineseIntegerExtractor()
-        self.number_parser = CJKNumberParser(
-            ChineseNumberParserConfiguration())
+        super().__init__(ChineseDateTimeComponents.get(ChineseDatePeriodParserConfiguration))
+        self.integer_extractor = ChineseDateTimeComponents.get(ChineseIntegerExtractor)
+        self.number_parser = ChineseDateTimeComponents.get(
+            CJKNumberParser, ChineseNumberParserConfiguration)
         self.year_in_chinese_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.DatePeriodYearInCJKRegex)
         self.number_combined_with_unit_regex = RegExpUtility.get_safe_reg_exp(
@@ -13,6 +13,7 @@ from ..base_dateperiod import DatePeriodParserConfiguration
 from .duration_extractor import ChineseDurationExtractor
 from .date_extractor import ChineseDateExtractor
 from .date_parser import ChineseDateParser
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseDatePeriodParserConfiguration(DatePeriodParserConfiguration):
@@ -225,9 +226,9 @@ class ChineseDatePeriodParserConfiguration(DatePeriodParserConfiguration):
         self._relative_decade_regex = None
         self._relative_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.RelativeRegex)
-        self._date_extractor = ChineseDateExtractor()
-        self._date_parser = ChineseDateParser()
-        self._duration_extractor = ChineseDurationExtractor()
+        self._date_extractor = ChineseDateTimeComponents.get(ChineseDateExtractor)
+        self._date_parser = ChineseDateTimeComponents.get(ChineseDateParser)
+        self._duration_extractor = ChineseDateTimeComponents.get(ChineseDurationExtractor)
         self._simple_cases_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.SimpleCasesRegex)
         self._one_word_period_regex = RegExpUtility.get_safe_reg_exp(
@@ -14,6 +14,8 @@ from ..constants import Constants
 from ..utilities import Token, merge_all_tokens
 from ..base_datetime import BaseDateTimeExtractor
 from .datetime_extractor_config import ChineseDateTimeExtractorConfiguration
+from ..component_container import ChineseDateTimeComponents
+from ..extractors import memoized_extract
 
 
 class ChineseDateTimeExtractor(BaseDateTimeExtractor):
@@ -25,9 +27,10 @@ class ChineseDateTimeExtractor(BaseDateTimeExtractor):
         ChineseDateTime.DateTimePeriodUnitRegex)
 
     def __init__(self):
-        super().__init__(ChineseDateTimeExtractorConfiguration())
-        self.duration_extractor = ChineseDurationExtractor()
+        super().__init__(ChineseDateTimeComponents.get(ChineseDateTimeExtractorConfiguration))
+        self.duration_extractor = ChineseDateTimeComponents.get(ChineseDurationExtractor)
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
 
         if reference is None:
@@ -11,6 +11,7 @@ from ..extractors import DateTimeExtractor
 from ..base_datetime import DateTimeExtractorConfiguration
 from .date_extractor import ChineseDateExtractor
 from .time_extractor import ChineseTimeExtractor
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
@@ -117,8 +118,8 @@ class ChineseDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
         self._before_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.BeforeRegex
         )
-        self._date_point_extractor = ChineseDateExtractor()
-        self._time_point_extractor = ChineseTimeExtractor()
+        self._date_point_extractor = ChineseDateTimeComponents.get(ChineseDateExtractor)
+        self._time_point_extractor = ChineseDateTimeComponents.get(ChineseTimeExtractor)
         self._now_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.NowRegex)
         self._night_regex = RegExpUtility.get_safe_reg_exp(
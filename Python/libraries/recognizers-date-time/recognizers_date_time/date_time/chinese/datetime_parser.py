@@ -14,12 +14,13 @@ from recognizers_number import Constants as NumberConstants
 from recognizers_text import RegExpUtility, ExtractResult
 from ..utilities import DateTimeFormatUtil, DateTimeResolutionResult, DateUtils
 from .datetime_parser_config import ChineseDateTimeParserConfiguration
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseDateTimeParser(BaseDateTimeParser):
     def __init__(self):
-        self.duration_extractor = ChineseDurationExtractor()
-        config = ChineseDateTimeParserConfiguration()
+        self.duration_extractor = ChineseDateTimeComponents.get(ChineseDurationExtractor)
+        config = ChineseDateTimeComponents.get(ChineseDateTimeParserConfiguration)
         BaseDateTimeParser.__init__(self, config)
 
     def parse(self, source: ExtractResult, reference: datetime = None) -> Optional[DateTimeParseResult]:
@@ -156,7 +157,8 @@ class ChineseDateTimeParser(BaseDateTimeParser):
                 src_unit = RegExpUtility.get_group(match, 'unit')
 
                 number_str = source[duration_res.start:match.lastindex - duration_res.start + 1]
-                number = ChineseDateParser.parse_chinese_written_number_to_value(ChineseDateParser(), number_str)
+                date_parser = ChineseDateTimeComponents.get(ChineseDateParser)
+                number = ChineseDateParser.parse_chinese_written_number_to_value(date_parser, number_str)
 
                 if src_unit in self.config.unit_map:
                     unit_str = self.config.unit_map.get(src_unit)
@@ -16,6 +16,7 @@ from .date_extractor import ChineseDateExtractor
 from .time_extractor import ChineseTimeExtractor
 from .date_parser import ChineseDateParser
 from .time_parser import ChineseTimeParser
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseDateTimeParserConfiguration():
@@ -108,10 +109,10 @@ class ChineseDateTimeParserConfiguration():
         raise NotImplementedError()
 
     def __init__(self):
-        self._date_extractor = ChineseDateExtractor()
-        self._time_extractor = ChineseTimeExtractor()
-        self._date_parser = ChineseDateParser()
-        self._time_parser = ChineseTimeParser()
+        self._date_extractor = ChineseDateTimeComponents.get(ChineseDateExtractor)
+        self._time_extractor = ChineseDateTimeComponents.get(ChineseTimeExtractor)
+        self._date_parser = ChineseDateTimeComponents.get(ChineseDateParser)
+        self._time_parser = ChineseDateTimeComponents.get(ChineseTimeParser)
         self._pm_time_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.DateTimeSimplePmRegex)
         self._am_time_regex = RegExpUtility.get_safe_reg_exp(
@@ -12,11 +12,13 @@ from ..constants import Constants
 from ..utilities import merge_all_tokens, Token
 from ..base_datetimeperiod import BaseDateTimePeriodExtractor
 from .datetimeperiod_extractor_config import ChineseDateTimePeriodExtractorConfiguration
+from ..component_container import ChineseDateTimeComponents
+from ..extractors import memoized_extract
 
 
 class ChineseDateTimePeriodExtractor(BaseDateTimePeriodExtractor):
     def __init__(self):
-        super().__init__(ChineseDateTimePeriodExtractorConfiguration())
+        super().__init__(ChineseDateTimeComponents.get(ChineseDateTimePeriodExtractorConfiguration))
         self.zhijian_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.ZhijianRegex)
         self.past_regex = RegExpUtility.get_safe_reg_exp(
@@ -24,6 +26,7 @@ class ChineseDateTimePeriodExtractor(BaseDateTimePeriodExtractor):
         self.future_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.FutureRegex)
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
             reference = datetime.now()
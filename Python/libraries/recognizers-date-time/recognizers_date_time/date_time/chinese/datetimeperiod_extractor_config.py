@@ -12,6 +12,7 @@ from ..base_datetimeperiod import DateTimePeriodExtractorConfiguration, MatchedI
 from .date_extractor import ChineseDateExtractor
 from .time_extractor import ChineseTimeExtractor
 from .datetime_extractor import ChineseDateTimeExtractor
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfiguration):
@@ -208,10 +209,10 @@ class ChineseDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfigu
         self._hour_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.HourRegex
         )
-        self._cardinal_extractor = ChineseCardinalExtractor()
-        self._single_date_extractor = ChineseDateExtractor()
-        self._single_time_extractor = ChineseTimeExtractor()
-        self._single_date_time_extractor = ChineseDateTimeExtractor()
+        self._cardinal_extractor = ChineseDateTimeComponents.get(ChineseCardinalExtractor)
+        self._single_date_extractor = ChineseDateTimeComponents.get(ChineseDateExtractor)
+        self._single_time_extractor = ChineseDateTimeComponents.get(ChineseTimeExtractor)
+        self._single_date_time_extractor = ChineseDateTimeComponents.get(ChineseDateTimeExtractor)
         self._preposition_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.DateTimePeriodPrepositionRegex)
         self._till_regex = RegExpUtility.get_safe_reg_exp(
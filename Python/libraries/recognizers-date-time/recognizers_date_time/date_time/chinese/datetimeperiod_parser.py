@@ -17,11 +17,12 @@ from ..base_datetimeperiod import BaseDateTimePeriodParser, BeginEnd
 from .datetimeperiod_parser_config import ChineseDateTimePeriodParserConfiguration
 from .date_extractor import ChineseDateExtractor
 from .timeperiod_extractor import ChineseTimePeriodExtractor
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseDateTimePeriodParser(BaseDateTimePeriodParser):
     def __init__(self):
-        super().__init__(ChineseDateTimePeriodParserConfiguration())
+        super().__init__(ChineseDateTimeComponents.get(ChineseDateTimePeriodParserConfiguration))
         self.tmo_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.DateTimePeriodMORegex)
         self.tmi_regex = RegExpUtility.get_safe_reg_exp(
@@ -36,11 +37,11 @@ class ChineseDateTimePeriodParser(BaseDateTimePeriodParser):
             ChineseDateTime.DateTimePeriodUnitRegex)
         self.time_of_day_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.TimeOfDayRegex)
-        self.single_date_extractor = ChineseDateExtractor()
-        self.time_period_extractor = ChineseTimePeriodExtractor()
-        self.cardinal_extractor = ChineseCardinalExtractor()
-        self.cardinal_parser = CJKNumberParser(
-            ChineseNumberParserConfiguration())
+        self.single_date_extractor = ChineseDateTimeComponents.get(ChineseDateExtractor)
+        self.time_period_extractor = ChineseDateTimeComponents.get(ChineseTimePeriodExtractor)
+        self.cardinal_extractor = ChineseDateTimeComponents.get(ChineseCardinalExtractor)
+        self.cardinal_parser = ChineseDateTimeComponents.get(
+            CJKNumberParser, ChineseNumberParserConfiguration)
 
     def parse(self, source: ExtractResult, reference: datetime = None) -> Optional[DateTimeParseResult]:
         if reference is None:
@@ -18,6 +18,7 @@ from .date_parser import ChineseDateParser
 from .time_parser import ChineseTimeParser
 from .timeperiod_parser import ChineseTimePeriodParser
 from .datetime_parser import ChineseDateTimeParser
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseDateTimePeriodParserConfiguration(DateTimePeriodParserConfiguration):
@@ -161,14 +162,14 @@ class ChineseDateTimePeriodParserConfiguration(DateTimePeriodParserConfiguration
         self._relative_time_unit_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.TimeOfDayRegex)
         self._unit_map = ChineseDateTime.ParserConfigurationUnitMap
-        self._date_extractor = ChineseDateExtractor()
-        self._time_extractor = ChineseTimeExtractor()
-        self._date_time_extractor = ChineseDateTimeExtractor()
-        self._time_period_extractor = ChineseTimePeriodExtractor()
-        self._date_parser = ChineseDateParser()
-        self._time_parser = ChineseTimeParser()
-        self._date_time_parser = ChineseDateTimeParser()
-        self._time_period_parser = ChineseTimePeriodParser()
+        self._date_extractor = ChineseDateTimeComponents.get(ChineseDateExtractor)
+        self._time_extractor = ChineseDateTimeComponents.get(ChineseTimeExtractor)
+        self._date_time_extractor = ChineseDateTimeComponents.get(ChineseDateTimeExtractor)
+        self._time_period_extractor = ChineseDateTimeComponents.get(ChineseTimePeriodExtractor)
+        self._date_parser = ChineseDateTimeComponents.get(ChineseDateParser)
+        self._time_parser = ChineseDateTimeComponents.get(ChineseTimeParser)
+        self._date_time_parser = ChineseDateTimeComponents.get(ChineseDateTimeParser)
+        self._time_period_parser = ChineseDateTimeComponents.get(ChineseTimePeriodParser)
         self._check_both_before_after = None
         self._token_before_date = None
         self._prefix_day_regex = None
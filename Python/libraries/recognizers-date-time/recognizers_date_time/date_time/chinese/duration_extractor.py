@@ -11,6 +11,8 @@ from ...resources.chinese_date_time import ChineseDateTime
 from ..constants import Constants
 from .base_date_time_extractor import ChineseBaseDateTimeExtractor
 from .duration_extractor_config import ChineseDurationExtractorConfiguration
+from ..component_container import ChineseDateTimeComponents
+from ..extractors import memoized_extract
 
 
 class ChineseDurationExtractor(ChineseBaseDateTimeExtractor):
@@ -21,12 +23,13 @@ class ChineseDurationExtractor(ChineseBaseDateTimeExtractor):
     def __init__(self):
         super().__init__(None)
         self.extractor = NumberWithUnitExtractor(
-            ChineseDurationExtractorConfiguration())
+            ChineseDateTimeComponents.get(ChineseDurationExtractorConfiguration))
         self.year_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.DurationYearRegex)
         self.half_suffix_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.DurationHalfSuffixRegex)
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
 
         if reference is None:
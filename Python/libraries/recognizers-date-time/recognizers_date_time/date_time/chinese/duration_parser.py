@@ -12,13 +12,14 @@ from ..extractors import ExtractResult
 from ..parsers import DateTimeParseResult
 from ..base_duration import BaseDurationParser
 from .duration_parser_config import ChineseDurationParserConfiguration, ChineseDurationNumberWithUnitParserConfiguration
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseDurationParser(BaseDurationParser):
     def __init__(self):
-        super().__init__(ChineseDurationParserConfiguration())
+        super().__init__(ChineseDateTimeComponents.get(ChineseDurationParserConfiguration))
         self._internal_parser = NumberWithUnitParser(
-            ChineseDurationNumberWithUnitParserConfiguration())
+            ChineseDateTimeComponents.get(ChineseDurationNumberWithUnitParserConfiguration))
 
     def parse(self, source: ExtractResult, reference: datetime = None) -> Optional[DateTimeParseResult]:
         if reference is None:
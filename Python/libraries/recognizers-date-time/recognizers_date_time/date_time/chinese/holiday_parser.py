@@ -14,17 +14,19 @@ from ..parsers import DateTimeParseResult
 from .holiday_parser_config import ChineseHolidayParserConfiguration
 from ..constants import TimeTypeConstants
 from ..utilities import DateTimeFormatUtil, DateTimeResolutionResult, RegExpUtility
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseHolidayParser(BaseHolidayParser):
     def __init__(self):
-        config = ChineseHolidayParserConfiguration()
+        config = ChineseDateTimeComponents.get(ChineseHolidayParserConfiguration)
         BaseHolidayParser.__init__(self, config)
         self.__lunar_holiday_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.LunarHolidayRegex)
-        self.__integer_extractor = ChineseIntegerExtractor()
+        self.__integer_extractor = ChineseDateTimeComponents.get(ChineseIntegerExtractor)
         self.__number_parser = AgnosticNumberParserFactory.get_parser(
-            AgnosticNumberParserType.INTEGER, ChineseNumberParserConfiguration())
+            AgnosticNumberParserType.INTEGER, ChineseDateTimeComponents.get(
+                ChineseNumberParserConfiguration))
         self.__fixed_holiday_dictionary = dict([
             ('元旦', ChineseHolidayParser.new_year),
             ('元旦节', ChineseHolidayParser.new_year),
@@ -6,41 +6,48 @@ from datetime import datetime
 import regex
 
 from recognizers_text import RegExpUtility
+from recognizers_text.extraction_context import in_extraction_context
 
 from ..base_merged import BaseMergedExtractor
-from ..utilities import DateTimeOptions, ExtractResult, RegExpUtility
+from ..utilities import DateTimeOptions, ExtractResult, RegExpUtility, ResultIntervals
 from .merged_extractor_config import ChineseMergedExtractorConfiguration
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseMergedExtractor(BaseMergedExtractor):
     def __init__(self, options: DateTimeOptions):
-        super().__init__(ChineseMergedExtractorConfiguration(), options)
+        super().__init__(ChineseDateTimeComponents.get(
+            ChineseMergedExtractorConfiguration), options)
         self.day_of_month_regex = RegExpUtility.get_safe_reg_exp(
             '^\\d{1,2}号', regex.I)
 
+    @in_extraction_context
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
             reference = datetime.now()
 
+        if (self.options & DateTimeOptions.FAIL_FAST) != 0 and self.is_fail_fast_case(source):
+            return self.extract_fail_fast(source, reference)
+
         result: List[ExtractResult] = list()
         result = self.add_to(
-            result, self.config.date_extractor.extract(source, reference), source)
+            result, self.extract_triggered('date_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.time_extractor.extract(source, reference), source)
+            result, self.extract_triggered('time_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.duration_extractor.extract(source, reference), source)
+            result, self.extract_triggered('duration_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.date_period_extractor.extract(source, reference), source)
+            result, self.extract_triggered('date_period_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.date_time_extractor.extract(source, reference), source)
+            result, self.extract_triggered('date_time_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.time_period_extractor.extract(source, reference), source)
-        result = self.add_to(result, self.config.date_time_period_extractor.extract(
-            source, reference), source)
+            result, self.extract_triggered('time_period_extractor', source, reference), source)
+        result = self.add_to(result, self.extract_triggered(
+            'date_time_period_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.set_extractor.extract(source, reference), source)
+            result, self.extract_triggered('set_extractor', source, reference), source)
         result = self.add_to(
-            result, self.config.holiday_extractor.extract(source, reference), source)
+            result, self.extract_triggered('holiday_extractor', source, reference), source)
 
         result = self._filter_ambiguity(result, source)
 
@@ -95,6 +102,8 @@ class ChineseMergedExtractor(BaseMergedExtractor):
                 extract_result.start -= mod_len
                 extract_result.text = source[extract_result.start:extract_result.length]
 
+        return extract_results
+
     def _filter_ambiguity(self, extract_results: List[ExtractResult], text: str, ) -> List[ExtractResult]:
 
         if self.config.ambiguity_filters_dict is not None:
@@ -122,29 +131,31 @@ class ChineseMergedExtractor(BaseMergedExtractor):
         return extract_results
 
     def add_to(self, destination: List[ExtractResult], source: List[ExtractResult], text: str) -> List[ExtractResult]:
+        intervals = ResultIntervals(destination)
         for value in source:
-            is_found = False
-            rm_index = -1
-            rm_len = 1
-
-            for index, dest in enumerate(destination):
-                if dest.overlap(value):
-                    is_found = True
-                    if value.length > dest.length:
-                        rm_index = index
-                        j = index + 1
-                        while j < len(destination) and destination[j].overlap(value):
-                            rm_len = rm_len + 1
-                            j = j + 1
-                    break
-
-            if not is_found:
-                destination.append(value)
-            elif rm_index >= 0:
-                del destination[rm_index:rm_index + rm_len]
-                destination = self.move_overlap(destination, value)
-                destination.insert(rm_index, value)
-        return destination
+            overlapping = intervals.overlapping(value)
+
+            if not overlapping:
+                intervals.append(value)
+                continue
+
+            first_rank, first = overlapping[0]
+            if value.length > first.length:
+                # remove the first overlapping result and the ones right after it that overlap too
+                rank = first_rank
+                while rank is not None and intervals[rank].overlap(value):
+                    next_rank = intervals.next_rank(rank)
+                    intervals.remove(rank)
+                    rank = next_rank
+
+                # only results starting around value can share one of its boundaries
+                candidates = intervals.starting_between(value.start, value.end + 1)
+                kept = set(id(result) for result in self.move_overlap([result for _, result in candidates], value))
+                for rank, result in candidates:
+                    if id(result) not in kept:
+                        intervals.remove(rank)
+                intervals.insert(first_rank, value)
+        return intervals.results()
 
     def move_overlap(self, destination: List[ExtractResult], source: ExtractResult) -> List[ExtractResult]:
         duplicated: List[int] = list()
@@ -18,6 +18,7 @@ from .dateperiod_extractor import ChineseDatePeriodExtractor
 from .datetimeperiod_extractor import ChineseDateTimePeriodExtractor
 from .set_extractor import ChineseSetExtractor
 from .holiday_extractor_config import ChineseHolidayExtractorConfiguration
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseMergedExtractorConfiguration(MergedExtractorConfiguration):
@@ -174,16 +175,17 @@ class ChineseMergedExtractorConfiguration(MergedExtractorConfiguration):
             ChineseDateTime.BeforeRegex
         )
         self._ambiguity_filters_dict = ChineseDateTime.AmbiguityFiltersDict
-        self._date_extractor = ChineseDateExtractor()
-        self._time_extractor = ChineseTimeExtractor()
-        self._date_time_extractor = ChineseDateTimeExtractor()
-        self._date_period_extractor = ChineseDatePeriodExtractor()
-        self._time_period_extractor = ChineseTimePeriodExtractor()
-        self._date_time_period_extractor = ChineseDateTimePeriodExtractor()
-        self._holiday_extractor = BaseHolidayExtractor(
-            ChineseHolidayExtractorConfiguration())
-        self._duration_extractor = ChineseDurationExtractor()
-        self._set_extractor = ChineseSetExtractor()
+        self._date_extractor = ChineseDateTimeComponents.get(ChineseDateExtractor)
+        self._time_extractor = ChineseDateTimeComponents.get(ChineseTimeExtractor)
+        self._date_time_extractor = ChineseDateTimeComponents.get(ChineseDateTimeExtractor)
+        self._date_period_extractor = ChineseDateTimeComponents.get(ChineseDatePeriodExtractor)
+        self._time_period_extractor = ChineseDateTimeComponents.get(ChineseTimePeriodExtractor)
+        self._date_time_period_extractor = ChineseDateTimeComponents.get(
+            ChineseDateTimePeriodExtractor)
+        self._holiday_extractor = ChineseDateTimeComponents.get(
+            BaseHolidayExtractor, ChineseHolidayExtractorConfiguration)
+        self._duration_extractor = ChineseDateTimeComponents.get(ChineseDurationExtractor)
+        self._set_extractor = ChineseDateTimeComponents.get(ChineseSetExtractor)
         # TODO When the implementation for these properties is added, change the None values to their respective Regexps
         self._superfluous_word_matcher = None
         self._fail_fast_regex = None
@@ -11,11 +11,13 @@ from ..constants import Constants, TimeTypeConstants
 from ..parsers import DateTimeParseResult
 from ..base_merged import BaseMergedParser
 from .merged_parser_config import ChineseMergedParserConfiguration
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseMergedParser(BaseMergedParser):
     def __init__(self):
-        super().__init__(ChineseMergedParserConfiguration(), DateTimeOptions.NONE)
+        super().__init__(ChineseDateTimeComponents.get(
+            ChineseMergedParserConfiguration), DateTimeOptions.NONE)
 
     def parse(self, source: ExtractResult, reference: datetime = None) -> Optional[DateTimeParseResult]:
         if not reference:
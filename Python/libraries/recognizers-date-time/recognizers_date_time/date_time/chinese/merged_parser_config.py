@@ -17,6 +17,7 @@ from .datetime_parser import ChineseDateTimeParser
 from .datetimeperiod_parser import ChineseDateTimePeriodParser
 from .holiday_parser import ChineseHolidayParser
 from .set_parser import ChineseSetParser
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseMergedParserConfiguration(MergedParserConfiguration):
@@ -95,15 +96,15 @@ class ChineseMergedParserConfiguration(MergedParserConfiguration):
             ChineseDateTime.MergedAfterRegex)
         self._since_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.MergedAfterRegex)
-        self._date_parser = ChineseDateParser()
-        self._holiday_parser = ChineseHolidayParser()
-        self._time_parser = ChineseTimeParser()
-        self._date_time_parser = ChineseDateTimeParser()
-        self._date_period_parser = ChineseDatePeriodParser()
-        self._time_period_parser = ChineseTimePeriodParser()
-        self._date_time_period_parser = ChineseDateTimePeriodParser()
-        self._duration_parser = ChineseDurationParser()
-        self._set_parser = ChineseSetParser()
+        self._date_parser = ChineseDateTimeComponents.get(ChineseDateParser)
+        self._holiday_parser = ChineseDateTimeComponents.get(ChineseHolidayParser)
+        self._time_parser = ChineseDateTimeComponents.get(ChineseTimeParser)
+        self._date_time_parser = ChineseDateTimeComponents.get(ChineseDateTimeParser)
+        self._date_period_parser = ChineseDateTimeComponents.get(ChineseDatePeriodParser)
+        self._time_period_parser = ChineseDateTimeComponents.get(ChineseTimePeriodParser)
+        self._date_time_period_parser = ChineseDateTimeComponents.get(ChineseDateTimePeriodParser)
+        self._duration_parser = ChineseDateTimeComponents.get(ChineseDurationParser)
+        self._set_parser = ChineseDateTimeComponents.get(ChineseSetParser)
         # TODO When the implementation for these properties is added, change the None values to their respective Regexps
         self._around_regex = None
         self._suffix_after = None
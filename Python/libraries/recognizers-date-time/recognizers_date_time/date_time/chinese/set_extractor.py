@@ -7,16 +7,18 @@ import regex
 
 from recognizers_text import ExtractResult
 
-from ..extractors import DateTimeExtractor
+from ..extractors import DateTimeExtractor, memoized_extract
 from ..utilities import Token, merge_all_tokens
 from ..base_set import BaseSetExtractor
 from .set_extractor_config import ChineseSetExtractorConfiguration
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseSetExtractor(BaseSetExtractor):
     def __init__(self):
-        super().__init__(ChineseSetExtractorConfiguration())
+        super().__init__(ChineseDateTimeComponents.get(ChineseSetExtractorConfiguration))
 
+    @memoized_extract
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:
         if reference is None:
             reference = datetime.now()
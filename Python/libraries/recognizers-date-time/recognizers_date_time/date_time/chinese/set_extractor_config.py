@@ -11,6 +11,7 @@ from .duration_extractor import ChineseDurationExtractor
 from .time_extractor import ChineseTimeExtractor
 from .date_extractor import ChineseDateExtractor
 from .datetime_extractor import ChineseDateTimeExtractor
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseSetExtractorConfiguration(SetExtractorConfiguration):
@@ -85,7 +86,7 @@ class ChineseSetExtractorConfiguration(SetExtractorConfiguration):
             ChineseDateTime.SetEachDayRegex)
         self._before_each_day_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.SetEachDayRegex)
-        self._duration_extractor = ChineseDurationExtractor()
-        self._time_extractor = ChineseTimeExtractor()
-        self._date_extractor = ChineseDateExtractor()
-        self._date_time_extractor = ChineseDateTimeExtractor()
+        self._duration_extractor = ChineseDateTimeComponents.get(ChineseDurationExtractor)
+        self._time_extractor = ChineseDateTimeComponents.get(ChineseTimeExtractor)
+        self._date_extractor = ChineseDateTimeComponents.get(ChineseDateExtractor)
+        self._date_time_extractor = ChineseDateTimeComponents.get(ChineseDateTimeExtractor)
@@ -12,11 +12,12 @@ from ..base_set import BaseSetParser
 from ..parsers import DateTimeParser, DateTimeParseResult
 from ..extractors import DateTimeExtractor
 from .set_parser_config import ChineseSetParserConfiguration
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseSetParser(BaseSetParser):
     def __init__(self):
-        config = ChineseSetParserConfiguration()
+        config = ChineseDateTimeComponents.get(ChineseSetParserConfiguration)
         BaseSetParser.__init__(self, config)
 
     def parse(self, source: ExtractResult, reference: datetime = None) -> Optional[DateTimeParseResult]:
@@ -16,6 +16,7 @@ from .date_parser import ChineseDateParser
 from .time_parser import ChineseTimeParser
 from .duration_parser import ChineseDurationParser
 from .datetime_parser import ChineseDateTimeParser
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseSetParserConfiguration(SetParserConfiguration):
@@ -104,14 +105,14 @@ class ChineseSetParserConfiguration(SetParserConfiguration):
         raise NotImplementedError()
 
     def __init__(self):
-        self._date_extractor = ChineseDateExtractor()
-        self._time_extractor = ChineseTimeExtractor()
-        self._duration_extractor = ChineseDurationExtractor()
-        self._date_time_extractor = ChineseDateTimeExtractor()
-        self._date_parser = ChineseDateParser()
-        self._time_parser = ChineseTimeParser()
-        self._duration_parser = ChineseDurationParser()
-        self._date_time_parser = ChineseDateTimeParser()
+        self._date_extractor = ChineseDateTimeComponents.get(ChineseDateExtractor)
+        self._time_extractor = ChineseDateTimeComponents.get(ChineseTimeExtractor)
+        self._duration_extractor = ChineseDateTimeComponents.get(ChineseDurationExtractor)
+        self._date_time_extractor = ChineseDateTimeComponents.get(ChineseDateTimeExtractor)
+        self._date_parser = ChineseDateTimeComponents.get(ChineseDateParser)
+        self._time_parser = ChineseDateTimeComponents.get(ChineseTimeParser)
+        self._duration_parser = ChineseDateTimeComponents.get(ChineseDurationParser)
+        self._date_time_parser = ChineseDateTimeComponents.get(ChineseDateTimeParser)
         self._unit_map = ChineseDateTime.ParserConfigurationUnitMap
         self._each_unit_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.SetEachUnitRegex)
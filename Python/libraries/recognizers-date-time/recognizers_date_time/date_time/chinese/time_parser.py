@@ -14,6 +14,7 @@ from ..parsers import DateTimeParseResult
 from ..base_time import BaseTimeParser
 from .base_date_time_extractor import DateTimeExtra, TimeResult, TimeResolutionUtils
 from .time_extractor import ChineseTimeExtractor, TimeType
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseTimeParser(BaseTimeParser):
@@ -27,7 +28,7 @@ class ChineseTimeParser(BaseTimeParser):
             TimeType.DigitTime: self.handle_digit,
             TimeType.LessTime: self.handle_less
         }
-        self.inner_extractor = ChineseTimeExtractor()
+        self.inner_extractor = ChineseDateTimeComponents.get(ChineseTimeExtractor)
 
     def parse(self, source: ExtractResult, reference: datetime = None) -> Optional[DateTimeParseResult]:
         if reference is None:
@@ -15,11 +15,12 @@ from ..base_timeperiod import BaseTimePeriodParser
 from .base_date_time_extractor import DateTimeExtra, TimeResult, TimeResolutionUtils
 from .timeperiod_extractor import TimePeriodType
 from .timeperiod_parser_config import ChineseTimePeriodParserConfiguration
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseTimePeriodParser(BaseTimePeriodParser):
     def __init__(self):
-        super().__init__(ChineseTimePeriodParserConfiguration())
+        super().__init__(ChineseDateTimeComponents.get(ChineseTimePeriodParserConfiguration))
         self.day_description_regex = RegExpUtility.get_safe_reg_exp(
             ChineseDateTime.TimeDayDescRegex)
         self.only_digit_match = RegExpUtility.get_safe_reg_exp(r'\d+')
@@ -7,6 +7,7 @@ from recognizers_number import ChineseIntegerExtractor
 from ..parsers import DateTimeParser
 from ..base_timeperiod import TimePeriodParserConfiguration
 from .time_parser import ChineseTimeParser
+from ..component_container import ChineseDateTimeComponents
 
 
 class ChineseTimePeriodParserConfiguration(TimePeriodParserConfiguration):
@@ -47,8 +48,8 @@ class ChineseTimePeriodParserConfiguration(TimePeriodParserConfiguration):
         return None
 
     def __init__(self):
-        self._time_parser = ChineseTimeParser()
-        self._integer_extractor = ChineseIntegerExtractor()
+        self._time_parser = ChineseDateTimeComponents.get(ChineseTimeParser)
+        self._integer_extractor = ChineseDateTimeComponents.get(ChineseIntegerExtractor)
 
     def get_matched_timex_range(self, source: str):
         return None
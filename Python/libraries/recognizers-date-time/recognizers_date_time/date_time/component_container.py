@@ -0,0 +1,60 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from threading import RLock
+from typing import Callable, Dict
+
+from recognizers_text import Culture
+
+
+class ComponentContainer:
+    """
+    Builds each configuration, extractor and parser of a culture once and hands the same
+    instance to every model and configuration asking for it, instead of each of them
+    compiling its own copy of the culture's patterns.
+    """
+    __enabled: bool = True
+
+    def __init__(self, culture: str):
+        self.culture = culture
+        self.__components: Dict[tuple, object] = dict()
+        self.__lock = RLock()
+
+    @staticmethod
+    def set_enabled(enabled: bool):
+        ComponentContainer.__enabled = enabled
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return ComponentContainer.__enabled
+
+    def get(self, factory: Callable, *dependencies: Callable):
+        """
+        The result of factory(*dependencies), each dependency being itself taken from the container.
+        """
+        if not ComponentContainer.__enabled:
+            return factory(*(self.get(dependency) for dependency in dependencies))
+
+        key = (factory,) + dependencies
+        with self.__lock:
+            component = self.__components.get(key, None)
+            if component is None:
+                component = factory(*(self.get(dependency) for dependency in dependencies))
+                self.__components[key] = component
+            return component
+
+    def __len__(self) -> int:
+        return len(self.__components)
+
+    def clear(self):
+        with self.__lock:
+            self.__components.clear()
+
+
+EnglishDateTimeComponents = ComponentContainer(Culture.English)
+SpanishDateTimeComponents = ComponentContainer(Culture.Spanish)
+FrenchDateTimeComponents = ComponentContainer(Culture.French)
+PortugueseDateTimeComponents = ComponentContainer(Culture.Portuguese)
+ItalianDateTimeComponents = ComponentContainer(Culture.Italian)
+GermanDateTimeComponents = ComponentContainer(Culture.German)
+ChineseDateTimeComponents = ComponentContainer(Culture.Chinese)
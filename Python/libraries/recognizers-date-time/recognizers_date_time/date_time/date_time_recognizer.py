@@ -3,7 +3,7 @@
 
 from datetime import datetime
 from typing import List
-from recognizers_text import Culture, Recognizer
+from recognizers_text import Culture, Recognizer, RecognizerRegistry
 from recognizers_text.model import Model, ModelResult
 from .utilities import DateTimeOptions
 from .models import DateTimeModel
@@ -92,6 +92,6 @@ class DateTimeRecognizer(Recognizer[DateTimeOptions]):
 
 def recognize_datetime(query: str, culture: str, options: DateTimeOptions = DateTimeOptions.NONE,
                        reference: datetime = None, fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = DateTimeRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(DateTimeRecognizer, culture, options)
     model = recognizer.get_datetime_model(culture, fallback_to_default_culture)
     return model.parse(query, reference)
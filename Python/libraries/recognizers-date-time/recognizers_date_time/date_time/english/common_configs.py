@@ -36,6 +36,7 @@ from .datetime_parser_config import EnglishDateTimeParserConfiguration
 from .datetimeperiod_extractor_config import EnglishDateTimePeriodExtractorConfiguration
 from .datetimeperiod_parser_config import EnglishDateTimePeriodParserConfiguration
 from ..base_timezone import BaseTimeZoneParser
+from ..component_container import EnglishDateTimeComponents
 
 
 class EnglishCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
@@ -158,7 +159,8 @@ class EnglishCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
     def __init__(self):
         BaseDateParserConfiguration.__init__(self)
 
-        self._utility_configuration = EnglishDateTimeUtilityConfiguration()
+        self._utility_configuration = EnglishDateTimeComponents.get(
+            EnglishDateTimeUtilityConfiguration)
         self._unit_map = EnglishDateTime.UnitMap
         self._unit_value_map = EnglishDateTime.UnitValueMap
         self._season_map = EnglishDateTime.SeasonMap
@@ -167,29 +169,29 @@ class EnglishCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
         self._month_of_year = EnglishDateTime.MonthOfYear
         self._numbers = EnglishDateTime.Numbers
         self._double_numbers = EnglishDateTime.DoubleNumbers
-        self._cardinal_extractor = EnglishCardinalExtractor()
-        self._integer_extractor = EnglishIntegerExtractor()
-        self._ordinal_extractor = EnglishOrdinalExtractor()
+        self._cardinal_extractor = EnglishDateTimeComponents.get(EnglishCardinalExtractor)
+        self._integer_extractor = EnglishDateTimeComponents.get(EnglishIntegerExtractor)
+        self._ordinal_extractor = EnglishDateTimeComponents.get(EnglishOrdinalExtractor)
         self._check_both_before_after = EnglishDateTime.CheckBothBeforeAfter
         self._day_of_month = {
             **BaseDateTime.DayOfMonthDictionary, **EnglishDateTime.DayOfMonth}
-        self._time_zone_parser = BaseTimeZoneParser()
-        self._number_parser = BaseNumberParser(
-            EnglishNumberParserConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            EnglishDateExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            EnglishTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            EnglishDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            EnglishTimePeriodExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            EnglishDateTimeExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            EnglishDateTimePeriodExtractorConfiguration())
+        self._time_zone_parser = EnglishDateTimeComponents.get(BaseTimeZoneParser)
+        self._number_parser = EnglishDateTimeComponents.get(
+            BaseNumberParser, EnglishNumberParserConfiguration)
+        self._date_extractor = EnglishDateTimeComponents.get(
+            BaseDateExtractor, EnglishDateExtractorConfiguration)
+        self._time_extractor = EnglishDateTimeComponents.get(
+            BaseTimeExtractor, EnglishTimeExtractorConfiguration)
+        self._duration_extractor = EnglishDateTimeComponents.get(
+            BaseDurationExtractor, EnglishDurationExtractorConfiguration)
+        self._date_period_extractor = EnglishDateTimeComponents.get(
+            BaseDatePeriodExtractor, EnglishDatePeriodExtractorConfiguration)
+        self._time_period_extractor = EnglishDateTimeComponents.get(
+            BaseTimePeriodExtractor, EnglishTimePeriodExtractorConfiguration)
+        self._date_time_extractor = EnglishDateTimeComponents.get(
+            BaseDateTimeExtractor, EnglishDateTimeExtractorConfiguration)
+        self._date_time_period_extractor = EnglishDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, EnglishDateTimePeriodExtractorConfiguration)
         self._duration_parser = BaseDurationParser(
             EnglishDurationParserConfiguration(self))
         self._date_parser = BaseDateParser(
@@ -13,6 +13,7 @@ from ..utilities import DateTimeUtilityConfiguration
 from .duration_extractor_config import EnglishDurationExtractorConfiguration
 from .base_configs import EnglishDateTimeUtilityConfiguration
 from ...resources.base_date_time import BaseDateTime
+from ..component_container import EnglishDateTimeComponents
 
 
 class EnglishDateExtractorConfiguration(DateExtractorConfiguration):
@@ -200,13 +201,14 @@ class EnglishDateExtractorConfiguration(DateExtractorConfiguration):
         self._week_day_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.WeekDayRegex)
         self._day_of_week = EnglishDateTime.DayOfWeek
-        self._ordinal_extractor = EnglishOrdinalExtractor()
-        self._integer_extractor = EnglishIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            EnglishNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
-        self._utility_configuration = EnglishDateTimeUtilityConfiguration()
+        self._ordinal_extractor = EnglishDateTimeComponents.get(EnglishOrdinalExtractor)
+        self._integer_extractor = EnglishDateTimeComponents.get(EnglishIntegerExtractor)
+        self._number_parser = EnglishDateTimeComponents.get(
+            BaseNumberParser, EnglishNumberParserConfiguration)
+        self._duration_extractor = EnglishDateTimeComponents.get(
+            BaseDurationExtractor, EnglishDurationExtractorConfiguration)
+        self._utility_configuration = EnglishDateTimeComponents.get(
+            EnglishDateTimeUtilityConfiguration)
         self._range_connector_symbol_regex = RegExpUtility.get_safe_reg_exp(
             BaseDateTime.RangeConnectorSymbolRegex
         )
@@ -17,6 +17,7 @@ from ..base_dateperiod import DatePeriodExtractorConfiguration, MatchedIndex
 from .duration_extractor_config import EnglishDurationExtractorConfiguration
 from .date_extractor_config import EnglishDateExtractorConfiguration
 from .common_configs import EnglishOrdinalExtractor, EnglishCardinalExtractor
+from ..component_container import EnglishDateTimeComponents
 
 
 class EnglishDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
@@ -223,13 +224,13 @@ class EnglishDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
             EnglishDateTime.InConnectorRegex)
         self._range_unit_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.RangeUnitRegex)
-        self._date_point_extractor = BaseDateExtractor(
-            EnglishDateExtractorConfiguration())
-        self._integer_extractor = EnglishIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            EnglishNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
+        self._date_point_extractor = EnglishDateTimeComponents.get(
+            BaseDateExtractor, EnglishDateExtractorConfiguration)
+        self._integer_extractor = EnglishDateTimeComponents.get(EnglishIntegerExtractor)
+        self._number_parser = EnglishDateTimeComponents.get(
+            BaseNumberParser, EnglishNumberParserConfiguration)
+        self._duration_extractor = EnglishDateTimeComponents.get(
+            BaseDurationExtractor, EnglishDurationExtractorConfiguration)
         self._range_connector_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.RangeConnectorRegex)
         self._now_regex = RegExpUtility.get_safe_reg_exp(
@@ -269,11 +270,11 @@ class EnglishDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
         self._century_suffix_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.CenturySuffixRegex
         )
-        self._ordinal_extractor = EnglishOrdinalExtractor()
+        self._ordinal_extractor = EnglishDateTimeComponents.get(EnglishOrdinalExtractor)
         self._previous_prefix_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.PreviousPrefixRegex
         )
-        self._cardinal_extractor = EnglishCardinalExtractor()
+        self._cardinal_extractor = EnglishDateTimeComponents.get(EnglishCardinalExtractor)
 
     def get_from_token_index(self, source: str) -> MatchedIndex:
         return MatchedIndex(True, source.rfind('from')) if source.endswith('from') else MatchedIndex(False, -1)
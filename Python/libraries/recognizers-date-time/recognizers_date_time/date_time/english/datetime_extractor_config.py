@@ -15,6 +15,7 @@ from .base_configs import EnglishDateTimeUtilityConfiguration
 from .date_extractor_config import EnglishDateExtractorConfiguration
 from .time_extractor_config import EnglishTimeExtractorConfiguration
 from .duration_extractor_config import EnglishDurationExtractorConfiguration
+from ..component_container import EnglishDateTimeComponents
 
 
 class EnglishDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
@@ -108,13 +109,14 @@ class EnglishDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
 
     def __init__(self):
         super().__init__()
-        self._date_point_extractor = BaseDateExtractor(
-            EnglishDateExtractorConfiguration())
-        self._time_point_extractor = BaseTimeExtractor(
-            EnglishTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
-        self._utility_configuration = EnglishDateTimeUtilityConfiguration()
+        self._date_point_extractor = EnglishDateTimeComponents.get(
+            BaseDateExtractor, EnglishDateExtractorConfiguration)
+        self._time_point_extractor = EnglishDateTimeComponents.get(
+            BaseTimeExtractor, EnglishTimeExtractorConfiguration)
+        self._duration_extractor = EnglishDateTimeComponents.get(
+            BaseDurationExtractor, EnglishDurationExtractorConfiguration)
+        self._utility_configuration = EnglishDateTimeComponents.get(
+            EnglishDateTimeUtilityConfiguration)
         self.preposition_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.PrepositionRegex)
         self._now_regex = RegExpUtility.get_safe_reg_exp(
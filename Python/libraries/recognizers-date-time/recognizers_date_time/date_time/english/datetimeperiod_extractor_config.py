@@ -22,6 +22,7 @@ from .timeperiod_extractor_config import EnglishTimePeriodExtractorConfiguration
 from .datetime_extractor_config import EnglishDateTimeExtractorConfiguration
 from .timezone_extractor_config import EnglishTimeZoneExtractorConfiguration
 from ..utilities import DateTimeOptions
+from ..component_container import EnglishDateTimeComponents
 
 
 class EnglishDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfiguration):
@@ -168,19 +169,19 @@ class EnglishDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfigu
             EnglishDateTime.WeekDayRegex
         )
         self._check_both_before_after = EnglishDateTime.CheckBothBeforeAfter
-        self._cardinal_extractor = EnglishCardinalExtractor()
-        self._single_date_extractor = BaseDateExtractor(
-            EnglishDateExtractorConfiguration())
-        self._single_time_extractor = BaseTimeExtractor(
-            EnglishTimeExtractorConfiguration())
-        self._single_date_time_extractor = BaseDateTimeExtractor(
-            EnglishDateTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            EnglishTimePeriodExtractorConfiguration())
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            EnglishTimeZoneExtractorConfiguration())
+        self._cardinal_extractor = EnglishDateTimeComponents.get(EnglishCardinalExtractor)
+        self._single_date_extractor = EnglishDateTimeComponents.get(
+            BaseDateExtractor, EnglishDateExtractorConfiguration)
+        self._single_time_extractor = EnglishDateTimeComponents.get(
+            BaseTimeExtractor, EnglishTimeExtractorConfiguration)
+        self._single_date_time_extractor = EnglishDateTimeComponents.get(
+            BaseDateTimeExtractor, EnglishDateTimeExtractorConfiguration)
+        self._duration_extractor = EnglishDateTimeComponents.get(
+            BaseDurationExtractor, EnglishDurationExtractorConfiguration)
+        self._time_period_extractor = EnglishDateTimeComponents.get(
+            BaseTimePeriodExtractor, EnglishTimePeriodExtractorConfiguration)
+        self._time_zone_extractor = EnglishDateTimeComponents.get(
+            BaseTimeZoneExtractor, EnglishTimeZoneExtractorConfiguration)
         self._simple_cases_regexes = [
             RegExpUtility.get_safe_reg_exp(EnglishDateTime.PureNumFromTo),
             RegExpUtility.get_safe_reg_exp(EnglishDateTime.PureNumBetweenAnd)
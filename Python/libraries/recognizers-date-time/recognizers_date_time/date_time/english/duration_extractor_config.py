@@ -8,6 +8,7 @@ from recognizers_number.number.extractors import BaseNumberExtractor
 from recognizers_number.number.english.extractors import EnglishCardinalExtractor
 from ...resources.english_date_time import EnglishDateTime
 from ..base_duration import DurationExtractorConfiguration
+from ..component_container import EnglishDateTimeComponents
 
 
 class EnglishDurationExtractorConfiguration(DurationExtractorConfiguration):
@@ -115,7 +116,8 @@ class EnglishDurationExtractorConfiguration(DurationExtractorConfiguration):
         self._during_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.DuringRegex
         )
-        self._cardinal_extractor: BaseNumberExtractor = EnglishCardinalExtractor()
+        self._cardinal_extractor: BaseNumberExtractor = EnglishDateTimeComponents.get(
+            EnglishCardinalExtractor)
         self._unit_map = EnglishDateTime.UnitMap
         self._unit_value_map = EnglishDateTime.UnitValueMap
         self._duration_unit_regex = RegExpUtility.get_safe_reg_exp(
@@ -12,6 +12,7 @@ from ...resources.english_date_time import EnglishDateTime
 from ..extractors import DateTimeExtractor
 from ..base_duration import DurationParserConfiguration, BaseDurationExtractor
 from .duration_extractor_config import EnglishDurationExtractorConfiguration
+from ..component_container import EnglishDateTimeComponents
 
 
 class EnglishDurationParserConfiguration(DurationParserConfiguration):
@@ -73,10 +74,11 @@ class EnglishDurationParserConfiguration(DurationParserConfiguration):
 
     def __init__(self, config):
         self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration(), False)
-        self._cardinal_extractor: BaseNumberExtractor = EnglishCardinalExtractor()
-        self._number_parser: BaseNumberParser = BaseNumberParser(
-            EnglishNumberParserConfiguration())
+            EnglishDateTimeComponents.get(EnglishDurationExtractorConfiguration), False)
+        self._cardinal_extractor: BaseNumberExtractor = EnglishDateTimeComponents.get(
+            EnglishCardinalExtractor)
+        self._number_parser: BaseNumberParser = EnglishDateTimeComponents.get(
+            BaseNumberParser, EnglishNumberParserConfiguration)
         self._followed_unit: Pattern = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.DurationFollowedUnit)
         self._suffix_and_regex: Pattern = RegExpUtility.get_safe_reg_exp(
@@ -30,6 +30,7 @@ from .holiday_extractor_config import EnglishHolidayExtractorConfiguration
 from ...resources.base_date_time import BaseDateTime
 from ..base_timezone import BaseTimeZoneExtractor
 from .timezone_extractor_config import EnglishTimeZoneExtractorConfiguration
+from ..component_container import EnglishDateTimeComponents
 
 
 class EnglishMergedExtractorConfiguration(MergedExtractorConfiguration):
@@ -154,25 +155,25 @@ class EnglishMergedExtractorConfiguration(MergedExtractorConfiguration):
         return self._term_filter_regexes
 
     def __init__(self):
-        self._integer_extractor = EnglishIntegerExtractor()
-        self._date_extractor = BaseDateExtractor(
-            EnglishDateExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            EnglishTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            EnglishDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            EnglishTimePeriodExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            EnglishDateTimeExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            EnglishDateTimePeriodExtractorConfiguration())
-        self._set_extractor = BaseSetExtractor(
-            EnglishSetExtractorConfiguration())
-        self._holiday_extractor = BaseHolidayExtractor(
-            EnglishHolidayExtractorConfiguration())
+        self._integer_extractor = EnglishDateTimeComponents.get(EnglishIntegerExtractor)
+        self._date_extractor = EnglishDateTimeComponents.get(
+            BaseDateExtractor, EnglishDateExtractorConfiguration)
+        self._time_extractor = EnglishDateTimeComponents.get(
+            BaseTimeExtractor, EnglishTimeExtractorConfiguration)
+        self._duration_extractor = EnglishDateTimeComponents.get(
+            BaseDurationExtractor, EnglishDurationExtractorConfiguration)
+        self._date_period_extractor = EnglishDateTimeComponents.get(
+            BaseDatePeriodExtractor, EnglishDatePeriodExtractorConfiguration)
+        self._time_period_extractor = EnglishDateTimeComponents.get(
+            BaseTimePeriodExtractor, EnglishTimePeriodExtractorConfiguration)
+        self._date_time_extractor = EnglishDateTimeComponents.get(
+            BaseDateTimeExtractor, EnglishDateTimeExtractorConfiguration)
+        self._date_time_period_extractor = EnglishDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, EnglishDateTimePeriodExtractorConfiguration)
+        self._set_extractor = EnglishDateTimeComponents.get(
+            BaseSetExtractor, EnglishSetExtractorConfiguration)
+        self._holiday_extractor = EnglishDateTimeComponents.get(
+            BaseHolidayExtractor, EnglishHolidayExtractorConfiguration)
         self._after_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.AfterRegex)
         self._before_regex = RegExpUtility.get_safe_reg_exp(
@@ -207,7 +208,7 @@ class EnglishMergedExtractorConfiguration(MergedExtractorConfiguration):
             EnglishDateTime.FailFastRegex
         )
         self._check_both_before_after = EnglishDateTime.CheckBothBeforeAfter
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            EnglishTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = EnglishDateTimeComponents.get(
+            BaseTimeZoneExtractor, EnglishTimeZoneExtractorConfiguration)
         # TODO When the implementation for these properties is added, change the None values to their respective Regexps
         self._datetime_alt_extractor = None
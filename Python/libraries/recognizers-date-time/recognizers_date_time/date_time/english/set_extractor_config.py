@@ -21,6 +21,7 @@ from .dateperiod_extractor_config import EnglishDatePeriodExtractorConfiguration
 from .timeperiod_extractor_config import EnglishTimePeriodExtractorConfiguration
 from .datetime_extractor_config import EnglishDateTimeExtractorConfiguration
 from .datetimeperiod_extractor_config import EnglishDateTimePeriodExtractorConfiguration
+from ..component_container import EnglishDateTimeComponents
 
 
 class EnglishSetExtractorConfiguration(SetExtractorConfiguration):
@@ -89,20 +90,20 @@ class EnglishSetExtractorConfiguration(SetExtractorConfiguration):
         return self._duration_unit_regex
 
     def __init__(self):
-        self._duration_extractor = BaseDurationExtractor(
-            EnglishDurationExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            EnglishTimeExtractorConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            EnglishDateExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            EnglishDateTimeExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            EnglishDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            EnglishTimePeriodExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            EnglishDateTimePeriodExtractorConfiguration())
+        self._duration_extractor = EnglishDateTimeComponents.get(
+            BaseDurationExtractor, EnglishDurationExtractorConfiguration)
+        self._time_extractor = EnglishDateTimeComponents.get(
+            BaseTimeExtractor, EnglishTimeExtractorConfiguration)
+        self._date_extractor = EnglishDateTimeComponents.get(
+            BaseDateExtractor, EnglishDateExtractorConfiguration)
+        self._date_time_extractor = EnglishDateTimeComponents.get(
+            BaseDateTimeExtractor, EnglishDateTimeExtractorConfiguration)
+        self._date_period_extractor = EnglishDateTimeComponents.get(
+            BaseDatePeriodExtractor, EnglishDatePeriodExtractorConfiguration)
+        self._time_period_extractor = EnglishDateTimeComponents.get(
+            BaseTimePeriodExtractor, EnglishTimePeriodExtractorConfiguration)
+        self._date_time_period_extractor = EnglishDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, EnglishDateTimePeriodExtractorConfiguration)
         self._last_regex = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.SetLastRegex)
         self._each_prefix_regex = RegExpUtility.get_safe_reg_exp(
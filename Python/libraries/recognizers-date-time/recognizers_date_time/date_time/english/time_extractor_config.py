@@ -9,6 +9,7 @@ from ..base_time import TimeExtractorConfiguration
 from ..base_timezone import BaseTimeZoneExtractor
 from ..extractors import DateTimeExtractor
 from .timezone_extractor_config import EnglishTimeZoneExtractorConfiguration
+from ..component_container import EnglishDateTimeComponents
 
 
 class EnglishTimeExtractorConfiguration(TimeExtractorConfiguration):
@@ -173,5 +174,5 @@ class EnglishTimeExtractorConfiguration(TimeExtractorConfiguration):
             EnglishDateTime.IshRegex)
         self._time_before_after_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.TimeBeforeAfterRegex)
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            EnglishTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = EnglishDateTimeComponents.get(
+            BaseTimeZoneExtractor, EnglishTimeZoneExtractorConfiguration)
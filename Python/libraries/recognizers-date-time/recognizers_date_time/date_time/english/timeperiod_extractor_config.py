@@ -14,6 +14,7 @@ from ..base_timezone import BaseTimeZoneExtractor
 from .time_extractor_config import EnglishTimeExtractorConfiguration
 from .timezone_extractor_config import EnglishTimeZoneExtractorConfiguration
 from ..utilities import DateTimeOptions
+from ..component_container import EnglishDateTimeComponents
 
 
 class EnglishTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
@@ -117,11 +118,11 @@ class EnglishTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
             EnglishDateTime.TimeOfDayRegex)
         self._general_ending_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             EnglishDateTime.GeneralEndingRegex)
-        self._single_time_extractor = BaseTimeExtractor(
-            EnglishTimeExtractorConfiguration())
-        self._integer_extractor = EnglishIntegerExtractor()
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            EnglishTimeZoneExtractorConfiguration())
+        self._single_time_extractor = EnglishDateTimeComponents.get(
+            BaseTimeExtractor, EnglishTimeExtractorConfiguration)
+        self._integer_extractor = EnglishDateTimeComponents.get(EnglishIntegerExtractor)
+        self._time_zone_extractor = EnglishDateTimeComponents.get(
+            BaseTimeZoneExtractor, EnglishTimeZoneExtractorConfiguration)
         self._token_before_date = EnglishDateTime.TokenBeforeDate
         self._pure_number_regex = [EnglishDateTime.PureNumFromTo, EnglishDateTime.PureNumFromTo]
         self._options = DateTimeOptions.NONE
@@ -2,10 +2,12 @@
 #  Licensed under the MIT License.
 
 from abc import abstractmethod
+from functools import wraps
 from typing import List
 from datetime import datetime
 
 from recognizers_text.extractor import Extractor, ExtractResult
+from recognizers_text.extraction_context import ExtractionContext
 
 
 class DateTimeExtractor(Extractor):
@@ -17,3 +19,19 @@ class DateTimeExtractor(Extractor):
     @abstractmethod
     def extract(self, source: str, reference: datetime = None) -> List[ExtractResult]:  # pylint: disable=W0221
         raise NotImplementedError
+
+
+def memoized_extract(extract):
+    """
+    Decorator for DateTimeExtractor.extract implementations. Inside an ExtractionContext an
+    extractor runs once per source and reference, however many composite extractors ask for
+    it, and the other calls get copies of its results.
+    """
+    @wraps(extract)
+    def wrapper(self, source: str, reference: datetime = None) -> List[ExtractResult]:
+        context = ExtractionContext.current()
+        if context is None:
+            return extract(self, source, reference)
+        return context.get_or_extract(self, (extract, self, reference), source,
+                                      lambda text: extract(self, text, reference))
+    return wrapper
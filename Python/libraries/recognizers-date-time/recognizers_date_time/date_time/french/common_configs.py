@@ -33,6 +33,7 @@ from .dateperiod_parser_config import FrenchDatePeriodParserConfiguration
 from .timeperiod_parser_config import FrenchTimePeriodParserConfiguration
 from .datetimeperiod_parser_config import FrenchDateTimePeriodParserConfiguration
 from .parsers import FrenchTimeParser
+from ..component_container import FrenchDateTimeComponents
 
 
 class FrenchCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
@@ -154,8 +155,9 @@ class FrenchCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
 
     def __init__(self):
         super().__init__()
-        self._time_zone_parser = BaseTimeZoneParser()
-        self._utility_configuration = FrenchDateTimeUtilityConfiguration()
+        self._time_zone_parser = FrenchDateTimeComponents.get(BaseTimeZoneParser)
+        self._utility_configuration = FrenchDateTimeComponents.get(
+            FrenchDateTimeUtilityConfiguration)
         self._unit_map = FrenchDateTime.UnitMap
         self._unit_value_map = FrenchDateTime.UnitValueMap
         self._season_map = FrenchDateTime.SeasonMap
@@ -166,28 +168,28 @@ class FrenchCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
         self._double_numbers = FrenchDateTime.DoubleNumbers
         self._check_both_before_after = FrenchDateTime.CheckBothBeforeAfter
 
-        self._cardinal_extractor = FrenchCardinalExtractor()
-        self._integer_extractor = FrenchIntegerExtractor()
-        self._ordinal_extractor = FrenchOrdinalExtractor()
+        self._cardinal_extractor = FrenchDateTimeComponents.get(FrenchCardinalExtractor)
+        self._integer_extractor = FrenchDateTimeComponents.get(FrenchIntegerExtractor)
+        self._ordinal_extractor = FrenchDateTimeComponents.get(FrenchOrdinalExtractor)
 
         self._day_of_month = {
             **BaseDateTime.DayOfMonthDictionary, **FrenchDateTime.DayOfMonth}
-        self._number_parser = BaseNumberParser(
-            FrenchNumberParserConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            FrenchDateExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            FrenchTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            FrenchDurationExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            FrenchDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            FrenchTimePeriodExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            FrenchDateTimeExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            FrenchDateTimePeriodExtractorConfiguration())
+        self._number_parser = FrenchDateTimeComponents.get(
+            BaseNumberParser, FrenchNumberParserConfiguration)
+        self._date_extractor = FrenchDateTimeComponents.get(
+            BaseDateExtractor, FrenchDateExtractorConfiguration)
+        self._time_extractor = FrenchDateTimeComponents.get(
+            BaseTimeExtractor, FrenchTimeExtractorConfiguration)
+        self._duration_extractor = FrenchDateTimeComponents.get(
+            BaseDurationExtractor, FrenchDurationExtractorConfiguration)
+        self._date_period_extractor = FrenchDateTimeComponents.get(
+            BaseDatePeriodExtractor, FrenchDatePeriodExtractorConfiguration)
+        self._time_period_extractor = FrenchDateTimeComponents.get(
+            BaseTimePeriodExtractor, FrenchTimePeriodExtractorConfiguration)
+        self._date_time_extractor = FrenchDateTimeComponents.get(
+            BaseDateTimeExtractor, FrenchDateTimeExtractorConfiguration)
+        self._date_time_period_extractor = FrenchDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, FrenchDateTimePeriodExtractorConfiguration)
         self._duration_parser = BaseDurationParser(
             FrenchDurationParserConfiguration(self))
         self._date_parser = BaseDateParser(FrenchDateParserConfiguration(self))
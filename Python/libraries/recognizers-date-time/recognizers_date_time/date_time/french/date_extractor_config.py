@@ -15,6 +15,7 @@ from .base_configs import FrenchDateTimeUtilityConfiguration
 from ..constants import Constants
 from ...resources.base_date_time import BaseDateTime
 from ..utilities import DateTimeOptions
+from ..component_container import FrenchDateTimeComponents
 
 
 class FrenchDateExtractorConfiguration(DateExtractorConfiguration):
@@ -186,13 +187,14 @@ class FrenchDateExtractorConfiguration(DateExtractorConfiguration):
         self._week_day_regex = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.WeekDayRegex)
         self._day_of_week = FrenchDateTime.DayOfWeek
-        self._ordinal_extractor = FrenchOrdinalExtractor()
-        self._integer_extractor = FrenchIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            FrenchNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            FrenchDurationExtractorConfiguration())
-        self._utility_configuration = FrenchDateTimeUtilityConfiguration()
+        self._ordinal_extractor = FrenchDateTimeComponents.get(FrenchOrdinalExtractor)
+        self._integer_extractor = FrenchDateTimeComponents.get(FrenchIntegerExtractor)
+        self._number_parser = FrenchDateTimeComponents.get(
+            BaseNumberParser, FrenchNumberParserConfiguration)
+        self._duration_extractor = FrenchDateTimeComponents.get(
+            BaseDurationExtractor, FrenchDurationExtractorConfiguration)
+        self._utility_configuration = FrenchDateTimeComponents.get(
+            FrenchDateTimeUtilityConfiguration)
         self._range_connector_symbol_regex = RegExpUtility.get_safe_reg_exp(
             BaseDateTime.RangeConnectorSymbolRegex
         )
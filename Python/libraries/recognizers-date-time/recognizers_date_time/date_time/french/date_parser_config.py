@@ -13,6 +13,7 @@ from ..utilities import DateTimeUtilityConfiguration
 from ..base_date import DateParserConfiguration
 from ..base_configs import BaseDateParserConfiguration
 from .date_extractor_config import FrenchDateExtractorConfiguration
+from ..component_container import FrenchDateTimeComponents
 
 
 class FrenchDateParserConfiguration(DateParserConfiguration):
@@ -145,7 +146,8 @@ class FrenchDateParserConfiguration(DateParserConfiguration):
         self._day_of_week = config.day_of_week
         self._unit_map = config.unit_map
         self._cardinal_map = config.cardinal_map
-        self._date_regex = (FrenchDateExtractorConfiguration()).date_regex_list
+        self._date_regex = (FrenchDateTimeComponents.get(
+            FrenchDateExtractorConfiguration)).date_regex_list
         self._on_regex = RegExpUtility.get_safe_reg_exp(FrenchDateTime.OnRegex)
         self._special_day_regex = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.SpecialDayRegex)
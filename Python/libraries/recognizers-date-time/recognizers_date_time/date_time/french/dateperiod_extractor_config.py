@@ -17,6 +17,7 @@ from .duration_extractor_config import FrenchDurationExtractorConfiguration
 from .date_extractor_config import FrenchDateExtractorConfiguration
 from recognizers_text.extractor import Extractor
 from recognizers_number import FrenchOrdinalExtractor, BaseNumberExtractor, FrenchCardinalExtractor
+from ..component_container import FrenchDateTimeComponents
 
 
 class FrenchDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
@@ -292,13 +293,13 @@ class FrenchDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
         self.before_regex = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.BeforeRegex2)
 
-        self._date_point_extractor = BaseDateExtractor(
-            FrenchDateExtractorConfiguration())
-        self._integer_extractor = FrenchIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            FrenchNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            FrenchDurationExtractorConfiguration())
+        self._date_point_extractor = FrenchDateTimeComponents.get(
+            BaseDateExtractor, FrenchDateExtractorConfiguration)
+        self._integer_extractor = FrenchDateTimeComponents.get(FrenchIntegerExtractor)
+        self._number_parser = FrenchDateTimeComponents.get(
+            BaseNumberParser, FrenchNumberParserConfiguration)
+        self._duration_extractor = FrenchDateTimeComponents.get(
+            BaseDurationExtractor, FrenchDurationExtractorConfiguration)
         self._now_regex = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.NowRegex)
         self._future_suffix_regex = RegExpUtility.get_safe_reg_exp(
@@ -326,12 +327,12 @@ class FrenchDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
         self._century_suffix_regex = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.CenturySuffixRegex
         )
-        self._ordinal_extractor = FrenchOrdinalExtractor()
-        self._cardinal_extractor = FrenchCardinalExtractor()
+        self._ordinal_extractor = FrenchDateTimeComponents.get(FrenchOrdinalExtractor)
+        self._cardinal_extractor = FrenchDateTimeComponents.get(FrenchCardinalExtractor)
         self._previous_prefix_regex = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.PreviousPrefixRegex
         )
-        self._cardinal_extractor = FrenchCardinalExtractor()
+        self._cardinal_extractor = FrenchDateTimeComponents.get(FrenchCardinalExtractor)
         # TODO When the implementation for these properties is added, change the None values to their respective Regexps
         self._time_unit_regex = None
 
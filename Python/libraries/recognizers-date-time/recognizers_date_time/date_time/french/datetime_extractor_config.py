@@ -15,6 +15,7 @@ from .base_configs import FrenchDateTimeUtilityConfiguration
 from .date_extractor_config import FrenchDateExtractorConfiguration
 from .time_extractor_config import FrenchTimeExtractorConfiguration
 from .duration_extractor_config import FrenchDurationExtractorConfiguration
+from ..component_container import FrenchDateTimeComponents
 
 
 class FrenchDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
@@ -149,13 +150,14 @@ class FrenchDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
             FrenchDateTime.YearRegex
         )
 
-        self._date_point_extractor = BaseDateExtractor(
-            FrenchDateExtractorConfiguration())
-        self._time_point_extractor = BaseTimeExtractor(
-            FrenchTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            FrenchDurationExtractorConfiguration())
-        self._utility_configuration = FrenchDateTimeUtilityConfiguration()
+        self._date_point_extractor = FrenchDateTimeComponents.get(
+            BaseDateExtractor, FrenchDateExtractorConfiguration)
+        self._time_point_extractor = FrenchDateTimeComponents.get(
+            BaseTimeExtractor, FrenchTimeExtractorConfiguration)
+        self._duration_extractor = FrenchDateTimeComponents.get(
+            BaseDurationExtractor, FrenchDurationExtractorConfiguration)
+        self._utility_configuration = FrenchDateTimeComponents.get(
+            FrenchDateTimeUtilityConfiguration)
 
     def is_connector_token(self, source: str) -> bool:
         return (
@@ -20,6 +20,7 @@ from .duration_extractor_config import FrenchDurationExtractorConfiguration
 from .timeperiod_extractor_config import FrenchTimePeriodExtractorConfiguration
 from .timezone_extractor_config import FrenchTimeZoneExtractorConfiguration
 from .datetime_extractor_config import FrenchDateTimeExtractorConfiguration
+from ..component_container import FrenchDateTimeComponents
 
 
 class FrenchDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfiguration):
@@ -205,20 +206,20 @@ class FrenchDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfigur
         self.connector_and_regex = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.ConnectorAndRegex)
 
-        self._cardinal_extractor = FrenchCardinalExtractor()
-
-        self._single_date_extractor = BaseDateExtractor(
-            FrenchDateExtractorConfiguration())
-        self._single_time_extractor = BaseTimeExtractor(
-            FrenchTimeExtractorConfiguration())
-        self._single_date_time_extractor = BaseDateTimeExtractor(
-            FrenchDateTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            FrenchDurationExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            FrenchTimePeriodExtractorConfiguration())
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            FrenchTimeZoneExtractorConfiguration())
+        self._cardinal_extractor = FrenchDateTimeComponents.get(FrenchCardinalExtractor)
+
+        self._single_date_extractor = FrenchDateTimeComponents.get(
+            BaseDateExtractor, FrenchDateExtractorConfiguration)
+        self._single_time_extractor = FrenchDateTimeComponents.get(
+            BaseTimeExtractor, FrenchTimeExtractorConfiguration)
+        self._single_date_time_extractor = FrenchDateTimeComponents.get(
+            BaseDateTimeExtractor, FrenchDateTimeExtractorConfiguration)
+        self._duration_extractor = FrenchDateTimeComponents.get(
+            BaseDurationExtractor, FrenchDurationExtractorConfiguration)
+        self._time_period_extractor = FrenchDateTimeComponents.get(
+            BaseTimePeriodExtractor, FrenchTimePeriodExtractorConfiguration)
+        self._time_zone_extractor = FrenchDateTimeComponents.get(
+            BaseTimeZoneExtractor, FrenchTimeZoneExtractorConfiguration)
         self._within_next_prefix_regex = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.WithinNextPrefixRegex
         )
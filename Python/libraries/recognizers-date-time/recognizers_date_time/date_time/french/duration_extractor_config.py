@@ -8,6 +8,7 @@ from recognizers_number.number.extractors import BaseNumberExtractor
 from recognizers_number.number.french.extractors import FrenchCardinalExtractor
 from ...resources.french_date_time import FrenchDateTime
 from ..base_duration import DurationExtractorConfiguration
+from ..component_container import FrenchDateTimeComponents
 
 
 class FrenchDurationExtractorConfiguration(DurationExtractorConfiguration):
@@ -121,7 +122,8 @@ class FrenchDurationExtractorConfiguration(DurationExtractorConfiguration):
             FrenchDateTime.MoreThanRegex)
         self._less_than_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.LessThanOneHour)
-        self._cardinal_extractor: BaseNumberExtractor = FrenchCardinalExtractor()
+        self._cardinal_extractor: BaseNumberExtractor = FrenchDateTimeComponents.get(
+            FrenchCardinalExtractor)
         self._during_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.DuringRegex
         )
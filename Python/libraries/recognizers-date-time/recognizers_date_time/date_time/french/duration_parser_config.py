@@ -11,6 +11,7 @@ from ...resources.french_date_time import FrenchDateTime
 from ..extractors import DateTimeExtractor
 from ..base_duration import DurationParserConfiguration, BaseDurationExtractor
 from .duration_extractor_config import FrenchDurationExtractorConfiguration
+from ..component_container import FrenchDateTimeComponents
 
 
 class FrenchDurationParserConfiguration(DurationParserConfiguration):
@@ -67,7 +68,7 @@ class FrenchDurationParserConfiguration(DurationParserConfiguration):
 
     def __init__(self, config):
         self.duration_extractor = BaseDurationExtractor(
-            FrenchDurationExtractorConfiguration(), False)
+            FrenchDateTimeComponents.get(FrenchDurationExtractorConfiguration), False)
         self._cardinal_extractor = config.cardinal_extractor
         self._number_parser = config.number_parser
         self._followed_unit = RegExpUtility.get_safe_reg_exp(
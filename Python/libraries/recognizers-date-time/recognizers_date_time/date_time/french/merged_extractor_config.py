@@ -28,6 +28,7 @@ from .datetimeperiod_extractor_config import FrenchDateTimePeriodExtractorConfig
 from .set_extractor_config import FrenchSetExtractorConfiguration
 from .holiday_extractor_config import FrenchHolidayExtractorConfiguration
 from ...resources.base_date_time import BaseDateTime
+from ..component_container import FrenchDateTimeComponents
 
 
 class FrenchMergedExtractorConfiguration(MergedExtractorConfiguration):
@@ -173,25 +174,25 @@ class FrenchMergedExtractorConfiguration(MergedExtractorConfiguration):
         self._number_ending_pattern = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.NumberEndingPattern)
 
-        self._date_extractor = BaseDateExtractor(
-            FrenchDateExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            FrenchTimeExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            FrenchDateTimeExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            FrenchDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            FrenchTimePeriodExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            FrenchDateTimePeriodExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            FrenchDurationExtractorConfiguration())
-        self._set_extractor = BaseSetExtractor(
-            FrenchSetExtractorConfiguration())
-        self._holiday_extractor = BaseHolidayExtractor(
-            FrenchHolidayExtractorConfiguration())
-        self._integer_extractor = FrenchIntegerExtractor()
+        self._date_extractor = FrenchDateTimeComponents.get(
+            BaseDateExtractor, FrenchDateExtractorConfiguration)
+        self._time_extractor = FrenchDateTimeComponents.get(
+            BaseTimeExtractor, FrenchTimeExtractorConfiguration)
+        self._date_time_extractor = FrenchDateTimeComponents.get(
+            BaseDateTimeExtractor, FrenchDateTimeExtractorConfiguration)
+        self._date_period_extractor = FrenchDateTimeComponents.get(
+            BaseDatePeriodExtractor, FrenchDatePeriodExtractorConfiguration)
+        self._time_period_extractor = FrenchDateTimeComponents.get(
+            BaseTimePeriodExtractor, FrenchTimePeriodExtractorConfiguration)
+        self._date_time_period_extractor = FrenchDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, FrenchDateTimePeriodExtractorConfiguration)
+        self._duration_extractor = FrenchDateTimeComponents.get(
+            BaseDurationExtractor, FrenchDurationExtractorConfiguration)
+        self._set_extractor = FrenchDateTimeComponents.get(
+            BaseSetExtractor, FrenchSetExtractorConfiguration)
+        self._holiday_extractor = FrenchDateTimeComponents.get(
+            BaseHolidayExtractor, FrenchHolidayExtractorConfiguration)
+        self._integer_extractor = FrenchDateTimeComponents.get(FrenchIntegerExtractor)
         self._filter_word_regex_list = []
         self._unspecified_date_period_regex = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.UnspecificDatePeriodRegex
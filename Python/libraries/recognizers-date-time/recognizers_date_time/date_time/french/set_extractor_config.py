@@ -21,6 +21,7 @@ from .dateperiod_extractor_config import FrenchDatePeriodExtractorConfiguration
 from .timeperiod_extractor_config import FrenchTimePeriodExtractorConfiguration
 from .datetime_extractor_config import FrenchDateTimeExtractorConfiguration
 from .datetimeperiod_extractor_config import FrenchDateTimePeriodExtractorConfiguration
+from ..component_container import FrenchDateTimeComponents
 
 
 class FrenchSetExtractorConfiguration(SetExtractorConfiguration):
@@ -101,17 +102,17 @@ class FrenchSetExtractorConfiguration(SetExtractorConfiguration):
         self._set_week_day_regex = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.SetWeekDayRegex)
 
-        self._duration_extractor = BaseDurationExtractor(
-            FrenchDurationExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            FrenchTimeExtractorConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            FrenchDateExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            FrenchDateTimeExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            FrenchDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            FrenchTimePeriodExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            FrenchDateTimePeriodExtractorConfiguration())
+        self._duration_extractor = FrenchDateTimeComponents.get(
+            BaseDurationExtractor, FrenchDurationExtractorConfiguration)
+        self._time_extractor = FrenchDateTimeComponents.get(
+            BaseTimeExtractor, FrenchTimeExtractorConfiguration)
+        self._date_extractor = FrenchDateTimeComponents.get(
+            BaseDateExtractor, FrenchDateExtractorConfiguration)
+        self._date_time_extractor = FrenchDateTimeComponents.get(
+            BaseDateTimeExtractor, FrenchDateTimeExtractorConfiguration)
+        self._date_period_extractor = FrenchDateTimeComponents.get(
+            BaseDatePeriodExtractor, FrenchDatePeriodExtractorConfiguration)
+        self._time_period_extractor = FrenchDateTimeComponents.get(
+            BaseTimePeriodExtractor, FrenchTimePeriodExtractorConfiguration)
+        self._date_time_period_extractor = FrenchDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, FrenchDateTimePeriodExtractorConfiguration)
@@ -9,6 +9,7 @@ from ..base_time import TimeExtractorConfiguration
 from ..utilities import DateTimeOptions
 from ..base_timezone import BaseTimeZoneExtractor
 from .timezone_extractor_config import FrenchTimeZoneExtractorConfiguration
+from ..component_container import FrenchDateTimeComponents
 
 
 class FrenchTimeExtractorConfiguration(TimeExtractorConfiguration):
@@ -43,8 +44,8 @@ class FrenchTimeExtractorConfiguration(TimeExtractorConfiguration):
         self._time_before_after_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             FrenchDateTime.TimeBeforeAfterRegex)
         self._options = DateTimeOptions.NONE
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            FrenchTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = FrenchDateTimeComponents.get(
+            BaseTimeZoneExtractor, FrenchTimeZoneExtractorConfiguration)
 
     @staticmethod
     def get_time_regex_list() -> List[Pattern]:
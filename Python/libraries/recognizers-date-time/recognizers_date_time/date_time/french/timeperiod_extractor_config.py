@@ -14,6 +14,7 @@ from ..base_timezone import BaseTimeZoneExtractor
 from .time_extractor_config import FrenchTimeExtractorConfiguration
 from .base_configs import FrenchDateTimeUtilityConfiguration
 from .timezone_extractor_config import FrenchTimeZoneExtractorConfiguration
+from ..component_container import FrenchDateTimeComponents
 
 
 class FrenchTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
@@ -60,10 +61,11 @@ class FrenchTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
     def __init__(self):
         super().__init__()
         self._check_both_before_after = FrenchDateTime.CheckBothBeforeAfter
-        self._single_time_extractor = BaseTimeExtractor(
-            FrenchTimeExtractorConfiguration())
-        self._integer_extractor = FrenchIntegerExtractor()
-        self.utility_configuration = FrenchDateTimeUtilityConfiguration()
+        self._single_time_extractor = FrenchDateTimeComponents.get(
+            BaseTimeExtractor, FrenchTimeExtractorConfiguration)
+        self._integer_extractor = FrenchDateTimeComponents.get(FrenchIntegerExtractor)
+        self.utility_configuration = FrenchDateTimeComponents.get(
+            FrenchDateTimeUtilityConfiguration)
 
         self._simple_cases_regex: List[Pattern] = [
             RegExpUtility.get_safe_reg_exp(FrenchDateTime.PureNumFromTo),
@@ -87,8 +89,8 @@ class FrenchTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
             FrenchDateTime.BeforeRegex2)
         self._token_before_date = FrenchDateTime.TokenBeforeDate
         self._pure_number_regex = [FrenchDateTime.PureNumFromTo, FrenchDateTime.PureNumFromTo]
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            FrenchTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = FrenchDateTimeComponents.get(
+            BaseTimeZoneExtractor, FrenchTimeZoneExtractorConfiguration)
 
     def get_from_token_index(self, source: str) -> MatchedIndex:
         match = self.from_regex.search(source)
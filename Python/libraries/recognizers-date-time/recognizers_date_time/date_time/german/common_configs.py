@@ -33,6 +33,7 @@ from .dateperiod_parser_config import GermanDatePeriodParserConfiguration
 from .timeperiod_parser_config import GermanTimePeriodParserConfiguration
 from .datetimeperiod_parser_config import GermanDateTimePeriodParserConfiguration
 from .parsers import GermanTimeParser
+from ..component_container import GermanDateTimeComponents
 
 
 class GermanCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
@@ -154,8 +155,9 @@ class GermanCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
 
     def __init__(self):
         super().__init__()
-        self._time_zone_parser = BaseTimeZoneParser()
-        self._utility_configuration = GermanDateTimeUtilityConfiguration()
+        self._time_zone_parser = GermanDateTimeComponents.get(BaseTimeZoneParser)
+        self._utility_configuration = GermanDateTimeComponents.get(
+            GermanDateTimeUtilityConfiguration)
         self._unit_map = GermanDateTime.UnitMap
         self._unit_value_map = GermanDateTime.UnitValueMap
         self._season_map = GermanDateTime.SeasonMap
@@ -166,28 +168,28 @@ class GermanCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
         self._double_numbers = GermanDateTime.DoubleNumbers
         self._check_both_before_after = GermanDateTime.CheckBothBeforeAfter
 
-        self._cardinal_extractor = GermanCardinalExtractor()
-        self._integer_extractor = GermanIntegerExtractor()
-        self._ordinal_extractor = GermanOrdinalExtractor()
+        self._cardinal_extractor = GermanDateTimeComponents.get(GermanCardinalExtractor)
+        self._integer_extractor = GermanDateTimeComponents.get(GermanIntegerExtractor)
+        self._ordinal_extractor = GermanDateTimeComponents.get(GermanOrdinalExtractor)
 
         self._day_of_month = {
             **BaseDateTime.DayOfMonthDictionary, **GermanDateTime.DayOfMonth}
-        self._number_parser = BaseNumberParser(
-            GermanNumberParserConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            GermanDateExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            GermanTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            GermanDurationExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            GermanDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            GermanTimePeriodExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            GermanDateTimeExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            GermanDateTimePeriodExtractorConfiguration())
+        self._number_parser = GermanDateTimeComponents.get(
+            BaseNumberParser, GermanNumberParserConfiguration)
+        self._date_extractor = GermanDateTimeComponents.get(
+            BaseDateExtractor, GermanDateExtractorConfiguration)
+        self._time_extractor = GermanDateTimeComponents.get(
+            BaseTimeExtractor, GermanTimeExtractorConfiguration)
+        self._duration_extractor = GermanDateTimeComponents.get(
+            BaseDurationExtractor, GermanDurationExtractorConfiguration)
+        self._date_period_extractor = GermanDateTimeComponents.get(
+            BaseDatePeriodExtractor, GermanDatePeriodExtractorConfiguration)
+        self._time_period_extractor = GermanDateTimeComponents.get(
+            BaseTimePeriodExtractor, GermanTimePeriodExtractorConfiguration)
+        self._date_time_extractor = GermanDateTimeComponents.get(
+            BaseDateTimeExtractor, GermanDateTimeExtractorConfiguration)
+        self._date_time_period_extractor = GermanDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, GermanDateTimePeriodExtractorConfiguration)
         self._duration_parser = BaseDurationParser(
             GermanDurationParserConfiguration(self))
         self._date_parser = BaseDateParser(GermanDateParserConfiguration(self))
@@ -14,6 +14,7 @@ from .duration_extractor_config import GermanDurationExtractorConfiguration
 from .base_configs import GermanDateTimeUtilityConfiguration
 from ..constants import Constants
 from ...resources.base_date_time import BaseDateTime
+from ..component_container import GermanDateTimeComponents
 
 
 class GermanDateExtractorConfiguration(DateExtractorConfiguration):
@@ -185,13 +186,14 @@ class GermanDateExtractorConfiguration(DateExtractorConfiguration):
         self._week_day_regex = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.WeekDayRegex)
         self._day_of_week = GermanDateTime.DayOfWeek
-        self._ordinal_extractor = GermanOrdinalExtractor()
-        self._integer_extractor = GermanIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            GermanNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            GermanDurationExtractorConfiguration())
-        self._utility_configuration = GermanDateTimeUtilityConfiguration()
+        self._ordinal_extractor = GermanDateTimeComponents.get(GermanOrdinalExtractor)
+        self._integer_extractor = GermanDateTimeComponents.get(GermanIntegerExtractor)
+        self._number_parser = GermanDateTimeComponents.get(
+            BaseNumberParser, GermanNumberParserConfiguration)
+        self._duration_extractor = GermanDateTimeComponents.get(
+            BaseDurationExtractor, GermanDurationExtractorConfiguration)
+        self._utility_configuration = GermanDateTimeComponents.get(
+            GermanDateTimeUtilityConfiguration)
         self._range_connector_symbol_regex = RegExpUtility.get_safe_reg_exp(
             BaseDateTime.RangeConnectorSymbolRegex
         )
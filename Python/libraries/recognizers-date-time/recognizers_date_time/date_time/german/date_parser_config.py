@@ -13,6 +13,7 @@ from ..utilities import DateTimeUtilityConfiguration
 from ..base_date import DateParserConfiguration
 from ..base_configs import BaseDateParserConfiguration
 from .date_extractor_config import GermanDateExtractorConfiguration
+from ..component_container import GermanDateTimeComponents
 
 
 class GermanDateParserConfiguration(DateParserConfiguration):
@@ -152,7 +153,8 @@ class GermanDateParserConfiguration(DateParserConfiguration):
         self._day_of_week = config.day_of_week
         self._unit_map = config.unit_map
         self._cardinal_map = config.cardinal_map
-        self._date_regex = (GermanDateExtractorConfiguration()).date_regex_list
+        self._date_regex = (GermanDateTimeComponents.get(
+            GermanDateExtractorConfiguration)).date_regex_list
         self._on_regex = RegExpUtility.get_safe_reg_exp(GermanDateTime.OnRegex)
         self._special_day_regex = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.SpecialDayRegex)
@@ -17,6 +17,7 @@ from .duration_extractor_config import GermanDurationExtractorConfiguration
 from .date_extractor_config import GermanDateExtractorConfiguration
 from recognizers_text.extractor import Extractor
 from recognizers_number import GermanOrdinalExtractor, BaseNumberExtractor, GermanCardinalExtractor
+from ..component_container import GermanDateTimeComponents
 
 
 class GermanDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
@@ -285,13 +286,13 @@ class GermanDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
         self.before_regex = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.BeforeRegex)
 
-        self._date_point_extractor = BaseDateExtractor(
-            GermanDateExtractorConfiguration())
-        self._integer_extractor = GermanIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            GermanNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            GermanDurationExtractorConfiguration())
+        self._date_point_extractor = GermanDateTimeComponents.get(
+            BaseDateExtractor, GermanDateExtractorConfiguration)
+        self._integer_extractor = GermanDateTimeComponents.get(GermanIntegerExtractor)
+        self._number_parser = GermanDateTimeComponents.get(
+            BaseNumberParser, GermanNumberParserConfiguration)
+        self._duration_extractor = GermanDateTimeComponents.get(
+            BaseDurationExtractor, GermanDurationExtractorConfiguration)
         self._now_regex = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.NowRegex)
         self._future_suffix_regex = RegExpUtility.get_safe_reg_exp(
@@ -322,12 +323,12 @@ class GermanDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
         self._decade_with_century_regex = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.DecadeWithCenturyRegex
         )
-        self._ordinal_extractor = GermanOrdinalExtractor()
-        self._cardinal_extractor = GermanCardinalExtractor()
+        self._ordinal_extractor = GermanDateTimeComponents.get(GermanOrdinalExtractor)
+        self._cardinal_extractor = GermanDateTimeComponents.get(GermanCardinalExtractor)
         self._previous_prefix_regex = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.PreviousPrefixRegex
         )
-        self._cardinal_extractor = GermanCardinalExtractor()
+        self._cardinal_extractor = GermanDateTimeComponents.get(GermanCardinalExtractor)
         # TODO When the implementation for these properties is added, change the None values to their respective Regexps
         self._time_unit_regex = None
 
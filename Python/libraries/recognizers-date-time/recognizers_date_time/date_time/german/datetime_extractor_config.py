@@ -15,6 +15,7 @@ from .base_configs import GermanDateTimeUtilityConfiguration
 from .date_extractor_config import GermanDateExtractorConfiguration
 from .time_extractor_config import GermanTimeExtractorConfiguration
 from .duration_extractor_config import GermanDurationExtractorConfiguration
+from ..component_container import GermanDateTimeComponents
 
 
 class GermanDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
@@ -149,13 +150,14 @@ class GermanDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
             GermanDateTime.YearRegex
         )
 
-        self._date_point_extractor = BaseDateExtractor(
-            GermanDateExtractorConfiguration())
-        self._time_point_extractor = BaseTimeExtractor(
-            GermanTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            GermanDurationExtractorConfiguration())
-        self._utility_configuration = GermanDateTimeUtilityConfiguration()
+        self._date_point_extractor = GermanDateTimeComponents.get(
+            BaseDateExtractor, GermanDateExtractorConfiguration)
+        self._time_point_extractor = GermanDateTimeComponents.get(
+            BaseTimeExtractor, GermanTimeExtractorConfiguration)
+        self._duration_extractor = GermanDateTimeComponents.get(
+            BaseDurationExtractor, GermanDurationExtractorConfiguration)
+        self._utility_configuration = GermanDateTimeComponents.get(
+            GermanDateTimeUtilityConfiguration)
 
     def is_connector_token(self, source: str) -> bool:
         return source.strip() == '' or regex.search(self.connector_regex, source) is not None or regex.search(self.preposition_regex, source) is not None
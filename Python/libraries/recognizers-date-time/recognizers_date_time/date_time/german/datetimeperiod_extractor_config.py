@@ -20,6 +20,7 @@ from .duration_extractor_config import GermanDurationExtractorConfiguration
 from .timeperiod_extractor_config import GermanTimePeriodExtractorConfiguration
 from .timezone_extractor_config import GermanTimeZoneExtractorConfiguration
 from .datetime_extractor_config import GermanDateTimeExtractorConfiguration
+from ..component_container import GermanDateTimeComponents
 
 
 class GermanDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfiguration):
@@ -205,20 +206,20 @@ class GermanDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfigur
         self.range_connector_regex = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.RangeConnectorRegex)
 
-        self._cardinal_extractor = GermanCardinalExtractor()
-
-        self._single_date_extractor = BaseDateExtractor(
-            GermanDateExtractorConfiguration())
-        self._single_time_extractor = BaseTimeExtractor(
-            GermanTimeExtractorConfiguration())
-        self._single_date_time_extractor = BaseDateTimeExtractor(
-            GermanDateTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            GermanDurationExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            GermanTimePeriodExtractorConfiguration())
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            GermanTimeZoneExtractorConfiguration())
+        self._cardinal_extractor = GermanDateTimeComponents.get(GermanCardinalExtractor)
+
+        self._single_date_extractor = GermanDateTimeComponents.get(
+            BaseDateExtractor, GermanDateExtractorConfiguration)
+        self._single_time_extractor = GermanDateTimeComponents.get(
+            BaseTimeExtractor, GermanTimeExtractorConfiguration)
+        self._single_date_time_extractor = GermanDateTimeComponents.get(
+            BaseDateTimeExtractor, GermanDateTimeExtractorConfiguration)
+        self._duration_extractor = GermanDateTimeComponents.get(
+            BaseDurationExtractor, GermanDurationExtractorConfiguration)
+        self._time_period_extractor = GermanDateTimeComponents.get(
+            BaseTimePeriodExtractor, GermanTimePeriodExtractorConfiguration)
+        self._time_zone_extractor = GermanDateTimeComponents.get(
+            BaseTimeZoneExtractor, GermanTimeZoneExtractorConfiguration)
         self._within_next_prefix_regex = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.WithinNextPrefixRegex
         )
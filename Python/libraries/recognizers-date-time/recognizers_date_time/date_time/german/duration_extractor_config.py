@@ -8,6 +8,7 @@ from recognizers_number.number.extractors import BaseNumberExtractor
 from recognizers_number.number.german.extractors import GermanCardinalExtractor
 from ...resources.german_date_time import GermanDateTime
 from ..base_duration import DurationExtractorConfiguration
+from ..component_container import GermanDateTimeComponents
 
 
 class GermanDurationExtractorConfiguration(DurationExtractorConfiguration):
@@ -121,7 +122,8 @@ class GermanDurationExtractorConfiguration(DurationExtractorConfiguration):
             GermanDateTime.MoreThanRegex)
         self._less_than_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.LessThanOneHour)
-        self._cardinal_extractor: BaseNumberExtractor = GermanCardinalExtractor()
+        self._cardinal_extractor: BaseNumberExtractor = GermanDateTimeComponents.get(
+            GermanCardinalExtractor)
         self._during_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.DuringRegex
         )
@@ -11,6 +11,7 @@ from ...resources.german_date_time import GermanDateTime
 from ..extractors import DateTimeExtractor
 from ..base_duration import DurationParserConfiguration, BaseDurationExtractor
 from .duration_extractor_config import GermanDurationExtractorConfiguration
+from ..component_container import GermanDateTimeComponents
 
 
 class GermanDurationParserConfiguration(DurationParserConfiguration):
@@ -67,7 +68,7 @@ class GermanDurationParserConfiguration(DurationParserConfiguration):
 
     def __init__(self, config):
         self._duration_extractor = BaseDurationExtractor(
-            GermanDurationExtractorConfiguration(), False)
+            GermanDateTimeComponents.get(GermanDurationExtractorConfiguration), False)
         self._cardinal_extractor = config.cardinal_extractor
         self._number_parser = config.number_parser
         self._followed_unit = RegExpUtility.get_safe_reg_exp(
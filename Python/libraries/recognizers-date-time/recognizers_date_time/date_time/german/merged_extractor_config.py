@@ -28,6 +28,7 @@ from .datetimeperiod_extractor_config import GermanDateTimePeriodExtractorConfig
 from .set_extractor_config import GermanSetExtractorConfiguration
 from .holiday_extractor_config import GermanHolidayExtractorConfiguration
 from ...resources.base_date_time import BaseDateTime
+from ..component_container import GermanDateTimeComponents
 
 
 class GermanMergedExtractorConfiguration(MergedExtractorConfiguration):
@@ -173,25 +174,25 @@ class GermanMergedExtractorConfiguration(MergedExtractorConfiguration):
         self._number_ending_pattern = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.NumberEndingPattern)
 
-        self._date_extractor = BaseDateExtractor(
-            GermanDateExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            GermanTimeExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            GermanDateTimeExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            GermanDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            GermanTimePeriodExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            GermanDateTimePeriodExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            GermanDurationExtractorConfiguration())
-        self._set_extractor = BaseSetExtractor(
-            GermanSetExtractorConfiguration())
-        self._holiday_extractor = BaseHolidayExtractor(
-            GermanHolidayExtractorConfiguration())
-        self._integer_extractor = GermanIntegerExtractor()
+        self._date_extractor = GermanDateTimeComponents.get(
+            BaseDateExtractor, GermanDateExtractorConfiguration)
+        self._time_extractor = GermanDateTimeComponents.get(
+            BaseTimeExtractor, GermanTimeExtractorConfiguration)
+        self._date_time_extractor = GermanDateTimeComponents.get(
+            BaseDateTimeExtractor, GermanDateTimeExtractorConfiguration)
+        self._date_period_extractor = GermanDateTimeComponents.get(
+            BaseDatePeriodExtractor, GermanDatePeriodExtractorConfiguration)
+        self._time_period_extractor = GermanDateTimeComponents.get(
+            BaseTimePeriodExtractor, GermanTimePeriodExtractorConfiguration)
+        self._date_time_period_extractor = GermanDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, GermanDateTimePeriodExtractorConfiguration)
+        self._duration_extractor = GermanDateTimeComponents.get(
+            BaseDurationExtractor, GermanDurationExtractorConfiguration)
+        self._set_extractor = GermanDateTimeComponents.get(
+            BaseSetExtractor, GermanSetExtractorConfiguration)
+        self._holiday_extractor = GermanDateTimeComponents.get(
+            BaseHolidayExtractor, GermanHolidayExtractorConfiguration)
+        self._integer_extractor = GermanDateTimeComponents.get(GermanIntegerExtractor)
         self._filter_word_regex_list = []
         self._unspecified_date_period_regex = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.UnspecificDatePeriodRegex
@@ -21,6 +21,7 @@ from .dateperiod_extractor_config import GermanDatePeriodExtractorConfiguration
 from .timeperiod_extractor_config import GermanTimePeriodExtractorConfiguration
 from .datetime_extractor_config import GermanDateTimeExtractorConfiguration
 from .datetimeperiod_extractor_config import GermanDateTimePeriodExtractorConfiguration
+from ..component_container import GermanDateTimeComponents
 
 
 class GermanSetExtractorConfiguration(SetExtractorConfiguration):
@@ -101,17 +102,17 @@ class GermanSetExtractorConfiguration(SetExtractorConfiguration):
         self._set_week_day_regex = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.SetWeekDayRegex)
 
-        self._duration_extractor = BaseDurationExtractor(
-            GermanDurationExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            GermanTimeExtractorConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            GermanDateExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            GermanDateTimeExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            GermanDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            GermanTimePeriodExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            GermanDateTimePeriodExtractorConfiguration())
+        self._duration_extractor = GermanDateTimeComponents.get(
+            BaseDurationExtractor, GermanDurationExtractorConfiguration)
+        self._time_extractor = GermanDateTimeComponents.get(
+            BaseTimeExtractor, GermanTimeExtractorConfiguration)
+        self._date_extractor = GermanDateTimeComponents.get(
+            BaseDateExtractor, GermanDateExtractorConfiguration)
+        self._date_time_extractor = GermanDateTimeComponents.get(
+            BaseDateTimeExtractor, GermanDateTimeExtractorConfiguration)
+        self._date_period_extractor = GermanDateTimeComponents.get(
+            BaseDatePeriodExtractor, GermanDatePeriodExtractorConfiguration)
+        self._time_period_extractor = GermanDateTimeComponents.get(
+            BaseTimePeriodExtractor, GermanTimePeriodExtractorConfiguration)
+        self._date_time_period_extractor = GermanDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, GermanDateTimePeriodExtractorConfiguration)
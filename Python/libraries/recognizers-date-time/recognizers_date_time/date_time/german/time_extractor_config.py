@@ -9,6 +9,7 @@ from ..base_time import TimeExtractorConfiguration
 from ..utilities import DateTimeOptions
 from ..base_timezone import BaseTimeZoneExtractor
 from .timezone_extractor_config import GermanTimeZoneExtractorConfiguration
+from ..component_container import GermanDateTimeComponents
 
 
 class GermanTimeExtractorConfiguration(TimeExtractorConfiguration):
@@ -43,8 +44,8 @@ class GermanTimeExtractorConfiguration(TimeExtractorConfiguration):
         self._time_before_after_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             GermanDateTime.TimeBeforeAfterRegex)
         self._options = DateTimeOptions.NONE
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            GermanTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = GermanDateTimeComponents.get(
+            BaseTimeZoneExtractor, GermanTimeZoneExtractorConfiguration)
 
     @staticmethod
     def get_time_regex_list() -> List[Pattern]:
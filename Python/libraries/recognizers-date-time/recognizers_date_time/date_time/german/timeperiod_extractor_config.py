@@ -14,6 +14,7 @@ from ..base_timezone import BaseTimeZoneExtractor
 from .time_extractor_config import GermanTimeExtractorConfiguration
 from .base_configs import GermanDateTimeUtilityConfiguration
 from .timezone_extractor_config import GermanTimeZoneExtractorConfiguration
+from ..component_container import GermanDateTimeComponents
 
 
 class GermanTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
@@ -60,10 +61,11 @@ class GermanTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
     def __init__(self):
         super().__init__()
         self._check_both_before_after = GermanDateTime.CheckBothBeforeAfter
-        self._single_time_extractor = BaseTimeExtractor(
-            GermanTimeExtractorConfiguration())
-        self._integer_extractor = GermanIntegerExtractor()
-        self.utility_configuration = GermanDateTimeUtilityConfiguration()
+        self._single_time_extractor = GermanDateTimeComponents.get(
+            BaseTimeExtractor, GermanTimeExtractorConfiguration)
+        self._integer_extractor = GermanDateTimeComponents.get(GermanIntegerExtractor)
+        self.utility_configuration = GermanDateTimeComponents.get(
+            GermanDateTimeUtilityConfiguration)
 
         self._simple_cases_regex: List[Pattern] = [
             RegExpUtility.get_safe_reg_exp(GermanDateTime.PureNumFromTo),
@@ -87,8 +89,8 @@ class GermanTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
             GermanDateTime.BeforeRegex)
         self._token_before_date = GermanDateTime.TokenBeforeDate
         self._pure_number_regex = [GermanDateTime.PureNumFromTo, GermanDateTime.PureNumFromTo]
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            GermanTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = GermanDateTimeComponents.get(
+            BaseTimeZoneExtractor, GermanTimeZoneExtractorConfiguration)
 
     def get_from_token_index(self, source: str) -> MatchedIndex:
         match = self.from_regex.search(source)
@@ -33,6 +33,7 @@ from .dateperiod_parser_config import ItalianDatePeriodParserConfiguration
 from .timeperiod_parser_config import ItalianTimePeriodParserConfiguration
 from .datetimeperiod_parser_config import ItalianDateTimePeriodParserConfiguration
 from .parsers import ItalianTimeParser
+from ..component_container import ItalianDateTimeComponents
 
 
 class ItalianCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
@@ -154,8 +155,9 @@ class ItalianCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
 
     def __init__(self):
         super().__init__()
-        self._time_zone_parser = BaseTimeZoneParser()
-        self._utility_configuration = ItalianDateTimeUtilityConfiguration()
+        self._time_zone_parser = ItalianDateTimeComponents.get(BaseTimeZoneParser)
+        self._utility_configuration = ItalianDateTimeComponents.get(
+            ItalianDateTimeUtilityConfiguration)
         self._unit_map = ItalianDateTime.UnitMap
         self._unit_value_map = ItalianDateTime.UnitValueMap
         self._season_map = ItalianDateTime.SeasonMap
@@ -166,28 +168,28 @@ class ItalianCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
         self._double_numbers = ItalianDateTime.DoubleNumbers
         self._check_both_before_after = ItalianDateTime.CheckBothBeforeAfter
 
-        self._cardinal_extractor = ItalianCardinalExtractor()
-        self._integer_extractor = ItalianIntegerExtractor()
-        self._ordinal_extractor = ItalianOrdinalExtractor()
+        self._cardinal_extractor = ItalianDateTimeComponents.get(ItalianCardinalExtractor)
+        self._integer_extractor = ItalianDateTimeComponents.get(ItalianIntegerExtractor)
+        self._ordinal_extractor = ItalianDateTimeComponents.get(ItalianOrdinalExtractor)
 
         self._day_of_month = {
             **BaseDateTime.DayOfMonthDictionary, **ItalianDateTime.DayOfMonth}
-        self._number_parser = BaseNumberParser(
-            ItalianNumberParserConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            ItalianDateExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            ItalianTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            ItalianDurationExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            ItalianDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            ItalianTimePeriodExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            ItalianDateTimeExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            ItalianDateTimePeriodExtractorConfiguration())
+        self._number_parser = ItalianDateTimeComponents.get(
+            BaseNumberParser, ItalianNumberParserConfiguration)
+        self._date_extractor = ItalianDateTimeComponents.get(
+            BaseDateExtractor, ItalianDateExtractorConfiguration)
+        self._time_extractor = ItalianDateTimeComponents.get(
+            BaseTimeExtractor, ItalianTimeExtractorConfiguration)
+        self._duration_extractor = ItalianDateTimeComponents.get(
+            BaseDurationExtractor, ItalianDurationExtractorConfiguration)
+        self._date_period_extractor = ItalianDateTimeComponents.get(
+            BaseDatePeriodExtractor, ItalianDatePeriodExtractorConfiguration)
+        self._time_period_extractor = ItalianDateTimeComponents.get(
+            BaseTimePeriodExtractor, ItalianTimePeriodExtractorConfiguration)
+        self._date_time_extractor = ItalianDateTimeComponents.get(
+            BaseDateTimeExtractor, ItalianDateTimeExtractorConfiguration)
+        self._date_time_period_extractor = ItalianDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, ItalianDateTimePeriodExtractorConfiguration)
         self._duration_parser = BaseDurationParser(
             ItalianDurationParserConfiguration(self))
         self._date_parser = BaseDateParser(ItalianDateParserConfiguration(self))
@@ -15,6 +15,7 @@ from .base_configs import ItalianDateTimeUtilityConfiguration
 from ..constants import Constants
 from ...resources.base_date_time import BaseDateTime
 from ..utilities import DateTimeOptions
+from ..component_container import ItalianDateTimeComponents
 
 
 class ItalianDateExtractorConfiguration(DateExtractorConfiguration):
@@ -186,13 +187,14 @@ class ItalianDateExtractorConfiguration(DateExtractorConfiguration):
         self._week_day_regex = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.WeekDayRegex)
         self._day_of_week = ItalianDateTime.DayOfWeek
-        self._ordinal_extractor = ItalianOrdinalExtractor()
-        self._integer_extractor = ItalianIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            ItalianNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            ItalianDurationExtractorConfiguration())
-        self._utility_configuration = ItalianDateTimeUtilityConfiguration()
+        self._ordinal_extractor = ItalianDateTimeComponents.get(ItalianOrdinalExtractor)
+        self._integer_extractor = ItalianDateTimeComponents.get(ItalianIntegerExtractor)
+        self._number_parser = ItalianDateTimeComponents.get(
+            BaseNumberParser, ItalianNumberParserConfiguration)
+        self._duration_extractor = ItalianDateTimeComponents.get(
+            BaseDurationExtractor, ItalianDurationExtractorConfiguration)
+        self._utility_configuration = ItalianDateTimeComponents.get(
+            ItalianDateTimeUtilityConfiguration)
         self._range_connector_symbol_regex = RegExpUtility.get_safe_reg_exp(
             BaseDateTime.RangeConnectorSymbolRegex
         )
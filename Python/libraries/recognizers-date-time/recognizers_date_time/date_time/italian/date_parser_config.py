@@ -13,6 +13,7 @@ from ..utilities import DateTimeUtilityConfiguration
 from ..base_date import DateParserConfiguration
 from ..base_configs import BaseDateParserConfiguration
 from .date_extractor_config import ItalianDateExtractorConfiguration
+from ..component_container import ItalianDateTimeComponents
 
 
 class ItalianDateParserConfiguration(DateParserConfiguration):
@@ -152,7 +153,8 @@ class ItalianDateParserConfiguration(DateParserConfiguration):
         self._day_of_week = config.day_of_week
         self._unit_map = config.unit_map
         self._cardinal_map = config.cardinal_map
-        self._date_regex = (ItalianDateExtractorConfiguration()).date_regex_list
+        self._date_regex = (ItalianDateTimeComponents.get(
+            ItalianDateExtractorConfiguration)).date_regex_list
         self._on_regex = RegExpUtility.get_safe_reg_exp(ItalianDateTime.OnRegex)
         self._special_day_regex = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.SpecialDayRegex)
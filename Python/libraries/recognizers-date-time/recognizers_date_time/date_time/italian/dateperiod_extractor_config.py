@@ -17,6 +17,7 @@ from .duration_extractor_config import ItalianDurationExtractorConfiguration
 from .date_extractor_config import ItalianDateExtractorConfiguration
 from recognizers_text.extractor import Extractor
 from recognizers_number import ItalianOrdinalExtractor, BaseNumberExtractor, ItalianCardinalExtractor
+from ..component_container import ItalianDateTimeComponents
 
 
 class ItalianDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
@@ -287,13 +288,13 @@ class ItalianDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
         self.before_regex = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.BeforeRegex2)
 
-        self._date_point_extractor = BaseDateExtractor(
-            ItalianDateExtractorConfiguration())
-        self._integer_extractor = ItalianIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            ItalianNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            ItalianDurationExtractorConfiguration())
+        self._date_point_extractor = ItalianDateTimeComponents.get(
+            BaseDateExtractor, ItalianDateExtractorConfiguration)
+        self._integer_extractor = ItalianDateTimeComponents.get(ItalianIntegerExtractor)
+        self._number_parser = ItalianDateTimeComponents.get(
+            BaseNumberParser, ItalianNumberParserConfiguration)
+        self._duration_extractor = ItalianDateTimeComponents.get(
+            BaseDurationExtractor, ItalianDurationExtractorConfiguration)
         self._now_regex = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.NowRegex)
         self._future_suffix_regex = RegExpUtility.get_safe_reg_exp(
@@ -321,12 +322,12 @@ class ItalianDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
         self._century_suffix_regex = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.CenturySuffixRegex
         )
-        self._ordinal_extractor = ItalianOrdinalExtractor()
-        self._cardinal_extractor = ItalianCardinalExtractor()
+        self._ordinal_extractor = ItalianDateTimeComponents.get(ItalianOrdinalExtractor)
+        self._cardinal_extractor = ItalianDateTimeComponents.get(ItalianCardinalExtractor)
         self._previous_prefix_regex = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.PreviousPrefixRegex
         )
-        self._cardinal_extractor = ItalianCardinalExtractor()
+        self._cardinal_extractor = ItalianDateTimeComponents.get(ItalianCardinalExtractor)
         # TODO When the implementation for these properties is added, change the None values to their respective Regexps
         self._time_unit_regex = None
 
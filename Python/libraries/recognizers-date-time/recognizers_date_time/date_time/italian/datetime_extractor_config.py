@@ -15,6 +15,7 @@ from .base_configs import ItalianDateTimeUtilityConfiguration
 from .date_extractor_config import ItalianDateExtractorConfiguration
 from .time_extractor_config import ItalianTimeExtractorConfiguration
 from .duration_extractor_config import ItalianDurationExtractorConfiguration
+from ..component_container import ItalianDateTimeComponents
 
 
 class ItalianDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
@@ -149,13 +150,14 @@ class ItalianDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
             ItalianDateTime.YearRegex
         )
 
-        self._date_point_extractor = BaseDateExtractor(
-            ItalianDateExtractorConfiguration())
-        self._time_point_extractor = BaseTimeExtractor(
-            ItalianTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            ItalianDurationExtractorConfiguration())
-        self._utility_configuration = ItalianDateTimeUtilityConfiguration()
+        self._date_point_extractor = ItalianDateTimeComponents.get(
+            BaseDateExtractor, ItalianDateExtractorConfiguration)
+        self._time_point_extractor = ItalianDateTimeComponents.get(
+            BaseTimeExtractor, ItalianTimeExtractorConfiguration)
+        self._duration_extractor = ItalianDateTimeComponents.get(
+            BaseDurationExtractor, ItalianDurationExtractorConfiguration)
+        self._utility_configuration = ItalianDateTimeComponents.get(
+            ItalianDateTimeUtilityConfiguration)
 
     def is_connector_token(self, source: str) -> bool:
         return source.strip() == '' or regex.search(self.connector_regex, source) is not None or regex.search(self.preposition_regex, source) is not None
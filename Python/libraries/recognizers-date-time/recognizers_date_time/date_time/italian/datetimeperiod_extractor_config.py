@@ -20,6 +20,7 @@ from .duration_extractor_config import ItalianDurationExtractorConfiguration
 from .timeperiod_extractor_config import ItalianTimePeriodExtractorConfiguration
 from .timezone_extractor_config import ItalianTimeZoneExtractorConfiguration
 from .datetime_extractor_config import ItalianDateTimeExtractorConfiguration
+from ..component_container import ItalianDateTimeComponents
 
 
 class ItalianDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfiguration):
@@ -205,20 +206,20 @@ class ItalianDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfigu
         self.connector_and_regex = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.ConnectorAndRegex)
 
-        self._cardinal_extractor = ItalianCardinalExtractor()
-
-        self._single_date_extractor = BaseDateExtractor(
-            ItalianDateExtractorConfiguration())
-        self._single_time_extractor = BaseTimeExtractor(
-            ItalianTimeExtractorConfiguration())
-        self._single_date_time_extractor = BaseDateTimeExtractor(
-            ItalianDateTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            ItalianDurationExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            ItalianTimePeriodExtractorConfiguration())
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            ItalianTimeZoneExtractorConfiguration())
+        self._cardinal_extractor = ItalianDateTimeComponents.get(ItalianCardinalExtractor)
+
+        self._single_date_extractor = ItalianDateTimeComponents.get(
+            BaseDateExtractor, ItalianDateExtractorConfiguration)
+        self._single_time_extractor = ItalianDateTimeComponents.get(
+            BaseTimeExtractor, ItalianTimeExtractorConfiguration)
+        self._single_date_time_extractor = ItalianDateTimeComponents.get(
+            BaseDateTimeExtractor, ItalianDateTimeExtractorConfiguration)
+        self._duration_extractor = ItalianDateTimeComponents.get(
+            BaseDurationExtractor, ItalianDurationExtractorConfiguration)
+        self._time_period_extractor = ItalianDateTimeComponents.get(
+            BaseTimePeriodExtractor, ItalianTimePeriodExtractorConfiguration)
+        self._time_zone_extractor = ItalianDateTimeComponents.get(
+            BaseTimeZoneExtractor, ItalianTimeZoneExtractorConfiguration)
         self._within_next_prefix_regex = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.WithinNextPrefixRegex
         )
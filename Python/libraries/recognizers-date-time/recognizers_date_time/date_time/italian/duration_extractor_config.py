@@ -8,6 +8,7 @@ from recognizers_number.number.extractors import BaseNumberExtractor
 from recognizers_number.number.italian.extractors import ItalianCardinalExtractor
 from ...resources.italian_date_time import ItalianDateTime
 from ..base_duration import DurationExtractorConfiguration
+from ..component_container import ItalianDateTimeComponents
 
 
 class ItalianDurationExtractorConfiguration(DurationExtractorConfiguration):
@@ -121,7 +122,8 @@ class ItalianDurationExtractorConfiguration(DurationExtractorConfiguration):
             ItalianDateTime.MoreThanRegex)
         self._less_than_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.LessThanOneHour)
-        self._cardinal_extractor: BaseNumberExtractor = ItalianCardinalExtractor()
+        self._cardinal_extractor: BaseNumberExtractor = ItalianDateTimeComponents.get(
+            ItalianCardinalExtractor)
         self._during_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.DuringRegex
         )
@@ -11,6 +11,7 @@ from ...resources.italian_date_time import ItalianDateTime
 from ..extractors import DateTimeExtractor
 from ..base_duration import DurationParserConfiguration, BaseDurationExtractor
 from .duration_extractor_config import ItalianDurationExtractorConfiguration
+from ..component_container import ItalianDateTimeComponents
 
 
 class ItalianDurationParserConfiguration(DurationParserConfiguration):
@@ -67,7 +68,7 @@ class ItalianDurationParserConfiguration(DurationParserConfiguration):
 
     def __init__(self, config):
         self.duration_extractor = BaseDurationExtractor(
-            ItalianDurationExtractorConfiguration(), False)
+            ItalianDateTimeComponents.get(ItalianDurationExtractorConfiguration), False)
         self._cardinal_extractor = config.cardinal_extractor
         self._number_parser = config.number_parser
         self._followed_unit = RegExpUtility.get_safe_reg_exp(
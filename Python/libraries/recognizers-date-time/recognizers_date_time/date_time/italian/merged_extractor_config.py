@@ -28,6 +28,7 @@ from .datetimeperiod_extractor_config import ItalianDateTimePeriodExtractorConfi
 from .set_extractor_config import ItalianSetExtractorConfiguration
 from .holiday_extractor_config import ItalianHolidayExtractorConfiguration
 from ...resources.base_date_time import BaseDateTime
+from ..component_container import ItalianDateTimeComponents
 
 
 class ItalianMergedExtractorConfiguration(MergedExtractorConfiguration):
@@ -173,25 +174,25 @@ class ItalianMergedExtractorConfiguration(MergedExtractorConfiguration):
         self._number_ending_pattern = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.NumberEndingPattern)
 
-        self._date_extractor = BaseDateExtractor(
-            ItalianDateExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            ItalianTimeExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            ItalianDateTimeExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            ItalianDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            ItalianTimePeriodExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            ItalianDateTimePeriodExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            ItalianDurationExtractorConfiguration())
-        self._set_extractor = BaseSetExtractor(
-            ItalianSetExtractorConfiguration())
-        self._holiday_extractor = BaseHolidayExtractor(
-            ItalianHolidayExtractorConfiguration())
-        self._integer_extractor = ItalianIntegerExtractor()
+        self._date_extractor = ItalianDateTimeComponents.get(
+            BaseDateExtractor, ItalianDateExtractorConfiguration)
+        self._time_extractor = ItalianDateTimeComponents.get(
+            BaseTimeExtractor, ItalianTimeExtractorConfiguration)
+        self._date_time_extractor = ItalianDateTimeComponents.get(
+            BaseDateTimeExtractor, ItalianDateTimeExtractorConfiguration)
+        self._date_period_extractor = ItalianDateTimeComponents.get(
+            BaseDatePeriodExtractor, ItalianDatePeriodExtractorConfiguration)
+        self._time_period_extractor = ItalianDateTimeComponents.get(
+            BaseTimePeriodExtractor, ItalianTimePeriodExtractorConfiguration)
+        self._date_time_period_extractor = ItalianDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, ItalianDateTimePeriodExtractorConfiguration)
+        self._duration_extractor = ItalianDateTimeComponents.get(
+            BaseDurationExtractor, ItalianDurationExtractorConfiguration)
+        self._set_extractor = ItalianDateTimeComponents.get(
+            BaseSetExtractor, ItalianSetExtractorConfiguration)
+        self._holiday_extractor = ItalianDateTimeComponents.get(
+            BaseHolidayExtractor, ItalianHolidayExtractorConfiguration)
+        self._integer_extractor = ItalianDateTimeComponents.get(ItalianIntegerExtractor)
         self._filter_word_regex_list = []
         self._unspecified_date_period_regex = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.UnspecificDatePeriodRegex
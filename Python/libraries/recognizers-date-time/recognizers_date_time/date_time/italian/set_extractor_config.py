@@ -21,6 +21,7 @@ from .dateperiod_extractor_config import ItalianDatePeriodExtractorConfiguration
 from .timeperiod_extractor_config import ItalianTimePeriodExtractorConfiguration
 from .datetime_extractor_config import ItalianDateTimeExtractorConfiguration
 from .datetimeperiod_extractor_config import ItalianDateTimePeriodExtractorConfiguration
+from ..component_container import ItalianDateTimeComponents
 
 
 class ItalianSetExtractorConfiguration(SetExtractorConfiguration):
@@ -101,17 +102,17 @@ class ItalianSetExtractorConfiguration(SetExtractorConfiguration):
         self._set_week_day_regex = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.SetWeekDayRegex)
 
-        self._duration_extractor = BaseDurationExtractor(
-            ItalianDurationExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            ItalianTimeExtractorConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            ItalianDateExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            ItalianDateTimeExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            ItalianDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            ItalianTimePeriodExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            ItalianDateTimePeriodExtractorConfiguration())
+        self._duration_extractor = ItalianDateTimeComponents.get(
+            BaseDurationExtractor, ItalianDurationExtractorConfiguration)
+        self._time_extractor = ItalianDateTimeComponents.get(
+            BaseTimeExtractor, ItalianTimeExtractorConfiguration)
+        self._date_extractor = ItalianDateTimeComponents.get(
+            BaseDateExtractor, ItalianDateExtractorConfiguration)
+        self._date_time_extractor = ItalianDateTimeComponents.get(
+            BaseDateTimeExtractor, ItalianDateTimeExtractorConfiguration)
+        self._date_period_extractor = ItalianDateTimeComponents.get(
+            BaseDatePeriodExtractor, ItalianDatePeriodExtractorConfiguration)
+        self._time_period_extractor = ItalianDateTimeComponents.get(
+            BaseTimePeriodExtractor, ItalianTimePeriodExtractorConfiguration)
+        self._date_time_period_extractor = ItalianDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, ItalianDateTimePeriodExtractorConfiguration)
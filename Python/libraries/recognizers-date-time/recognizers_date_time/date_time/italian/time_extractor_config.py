@@ -9,6 +9,7 @@ from ..base_time import TimeExtractorConfiguration
 from ..utilities import DateTimeOptions
 from ..base_timezone import BaseTimeZoneExtractor
 from .timezone_extractor_config import ItalianTimeZoneExtractorConfiguration
+from ..component_container import ItalianDateTimeComponents
 
 
 class ItalianTimeExtractorConfiguration(TimeExtractorConfiguration):
@@ -43,8 +44,8 @@ class ItalianTimeExtractorConfiguration(TimeExtractorConfiguration):
         self._time_before_after_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             ItalianDateTime.TimeBeforeAfterRegex)
         self._options = DateTimeOptions.NONE
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            ItalianTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = ItalianDateTimeComponents.get(
+            BaseTimeZoneExtractor, ItalianTimeZoneExtractorConfiguration)
 
     @staticmethod
     def get_time_regex_list() -> List[Pattern]:
@@ -14,6 +14,7 @@ from ..base_timezone import BaseTimeZoneExtractor
 from .time_extractor_config import ItalianTimeExtractorConfiguration
 from .base_configs import ItalianDateTimeUtilityConfiguration
 from .timezone_extractor_config import ItalianTimeZoneExtractorConfiguration
+from ..component_container import ItalianDateTimeComponents
 
 
 class ItalianTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
@@ -60,10 +61,11 @@ class ItalianTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
     def __init__(self):
         super().__init__()
         self._check_both_before_after = ItalianDateTime.CheckBothBeforeAfter
-        self._single_time_extractor = BaseTimeExtractor(
-            ItalianTimeExtractorConfiguration())
-        self._integer_extractor = ItalianIntegerExtractor()
-        self.utility_configuration = ItalianDateTimeUtilityConfiguration()
+        self._single_time_extractor = ItalianDateTimeComponents.get(
+            BaseTimeExtractor, ItalianTimeExtractorConfiguration)
+        self._integer_extractor = ItalianDateTimeComponents.get(ItalianIntegerExtractor)
+        self.utility_configuration = ItalianDateTimeComponents.get(
+            ItalianDateTimeUtilityConfiguration)
 
         self._simple_cases_regex: List[Pattern] = [
             RegExpUtility.get_safe_reg_exp(ItalianDateTime.PureNumFromTo),
@@ -87,8 +89,8 @@ class ItalianTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
             ItalianDateTime.BeforeRegex2)
         self._token_before_date = ItalianDateTime.TokenBeforeDate
         self._pure_number_regex = [ItalianDateTime.PureNumFromTo, ItalianDateTime.PureNumFromTo]
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            ItalianTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = ItalianDateTimeComponents.get(
+            BaseTimeZoneExtractor, ItalianTimeZoneExtractorConfiguration)
 
     def get_from_token_index(self, source: str) -> MatchedIndex:
         match = self.from_regex.search(source)
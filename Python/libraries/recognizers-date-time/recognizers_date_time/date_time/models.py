@@ -6,6 +6,7 @@ from datetime import datetime
 
 from recognizers_text.model import Model, ModelResult
 from recognizers_text.utilities import QueryProcessor
+from recognizers_text.extraction_context import in_extraction_context
 from .extractors import DateTimeExtractor
 from .parsers import DateTimeParser
 
@@ -24,6 +25,7 @@ class DateTimeModel(Model):
         self.parser = parser
         self.extractor = extractor
 
+    @in_extraction_context
     def parse(self, query: str, reference: datetime = None) -> List[ModelResult]:  # pylint: disable=W0221
         query = QueryProcessor.preprocess(query)
         parser_dates = []
@@ -36,6 +36,7 @@ from .datetime_parser_config import PortugueseDateTimeParserConfiguration
 from .datetimeperiod_extractor_config import PortugueseDateTimePeriodExtractorConfiguration
 from .datetimeperiod_parser_config import PortugueseDateTimePeriodParserConfiguration
 from ..base_timezone import BaseTimeZoneParser
+from ..component_container import PortugueseDateTimeComponents
 
 
 class PortugueseCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
@@ -162,7 +163,8 @@ class PortugueseCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
     def __init__(self):
         BaseDateParserConfiguration.__init__(self)
 
-        self._utility_configuration = PortugueseDateTimeUtilityConfiguration()
+        self._utility_configuration = PortugueseDateTimeComponents.get(
+            PortugueseDateTimeUtilityConfiguration)
         self._unit_map = PortugueseDateTime.UnitMap
         self._unit_value_map = PortugueseDateTime.UnitValueMap
         self._season_map = PortugueseDateTime.SeasonMap
@@ -171,27 +173,27 @@ class PortugueseCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
         self._month_of_year = PortugueseDateTime.MonthOfYear
         self._numbers = PortugueseDateTime.Numbers
         self._double_numbers = PortugueseDateTime.DoubleNumbers
-        self._cardinal_extractor = PortugueseCardinalExtractor()
-        self._integer_extractor = PortugueseIntegerExtractor()
-        self._ordinal_extractor = PortugueseOrdinalExtractor()
+        self._cardinal_extractor = PortugueseDateTimeComponents.get(PortugueseCardinalExtractor)
+        self._integer_extractor = PortugueseDateTimeComponents.get(PortugueseIntegerExtractor)
+        self._ordinal_extractor = PortugueseDateTimeComponents.get(PortugueseOrdinalExtractor)
         self._check_both_before_after = PortugueseDateTime.CheckBothBeforeAfter
-        self._time_zone_parser = BaseTimeZoneParser()
-        self._number_parser = BaseNumberParser(
-            PortugueseNumberParserConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            PortugueseDateExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            PortugueseTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            PortugueseDurationExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            PortugueseDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            PortugueseTimePeriodExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            PortugueseDateTimeExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            PortugueseDateTimePeriodExtractorConfiguration())
+        self._time_zone_parser = PortugueseDateTimeComponents.get(BaseTimeZoneParser)
+        self._number_parser = PortugueseDateTimeComponents.get(
+            BaseNumberParser, PortugueseNumberParserConfiguration)
+        self._date_extractor = PortugueseDateTimeComponents.get(
+            BaseDateExtractor, PortugueseDateExtractorConfiguration)
+        self._time_extractor = PortugueseDateTimeComponents.get(
+            BaseTimeExtractor, PortugueseTimeExtractorConfiguration)
+        self._duration_extractor = PortugueseDateTimeComponents.get(
+            BaseDurationExtractor, PortugueseDurationExtractorConfiguration)
+        self._date_period_extractor = PortugueseDateTimeComponents.get(
+            BaseDatePeriodExtractor, PortugueseDatePeriodExtractorConfiguration)
+        self._time_period_extractor = PortugueseDateTimeComponents.get(
+            BaseTimePeriodExtractor, PortugueseTimePeriodExtractorConfiguration)
+        self._date_time_extractor = PortugueseDateTimeComponents.get(
+            BaseDateTimeExtractor, PortugueseDateTimeExtractorConfiguration)
+        self._date_time_period_extractor = PortugueseDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, PortugueseDateTimePeriodExtractorConfiguration)
         self._duration_parser = BaseDurationParser(
             PortugueseDurationParserConfiguration(self))
         self._date_parser = BaseDateParser(
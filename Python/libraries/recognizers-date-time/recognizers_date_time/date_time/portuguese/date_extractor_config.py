@@ -14,6 +14,7 @@ from .duration_extractor_config import PortugueseDurationExtractorConfiguration
 from .base_configs import PortugueseDateTimeUtilityConfiguration
 from ..constants import Constants
 from ...resources.base_date_time import BaseDateTime
+from ..component_container import PortugueseDateTimeComponents
 
 
 class PortugueseDateExtractorConfiguration(DateExtractorConfiguration):
@@ -190,13 +191,14 @@ class PortugueseDateExtractorConfiguration(DateExtractorConfiguration):
         self._week_day_regex = RegExpUtility.get_safe_reg_exp(
             PortugueseDateTime.WeekDayRegex)
         self._day_of_week = PortugueseDateTime.DayOfWeek
-        self._ordinal_extractor = PortugueseOrdinalExtractor()
-        self._integer_extractor = PortugueseIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            PortugueseNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            PortugueseDurationExtractorConfiguration())
-        self._utility_configuration = PortugueseDateTimeUtilityConfiguration()
+        self._ordinal_extractor = PortugueseDateTimeComponents.get(PortugueseOrdinalExtractor)
+        self._integer_extractor = PortugueseDateTimeComponents.get(PortugueseIntegerExtractor)
+        self._number_parser = PortugueseDateTimeComponents.get(
+            BaseNumberParser, PortugueseNumberParserConfiguration)
+        self._duration_extractor = PortugueseDateTimeComponents.get(
+            BaseDurationExtractor, PortugueseDurationExtractorConfiguration)
+        self._utility_configuration = PortugueseDateTimeComponents.get(
+            PortugueseDateTimeUtilityConfiguration)
         self._range_connector_symbol_regex = RegExpUtility.get_safe_reg_exp(
             BaseDateTime.RangeConnectorSymbolRegex
         )
@@ -13,6 +13,7 @@ from ..utilities import DateTimeUtilityConfiguration
 from ..base_date import DateParserConfiguration
 from ..base_configs import BaseDateParserConfiguration
 from .date_extractor_config import PortugueseDateExtractorConfiguration
+from ..component_container import PortugueseDateTimeComponents
 
 
 class PortugueseDateParserConfiguration(DateParserConfiguration):
@@ -152,7 +153,7 @@ class PortugueseDateParserConfiguration(DateParserConfiguration):
         self._unit_map = config.unit_map
         self._cardinal_map = config.cardinal_map
         self._date_regex = (
-            PortugueseDateExtractorConfiguration()).date_regex_list
+            PortugueseDateTimeComponents.get(PortugueseDateExtractorConfiguration)).date_regex_list
         self._on_regex = RegExpUtility.get_safe_reg_exp(
             PortugueseDateTime.OnRegex)
         self._special_day_regex = RegExpUtility.get_safe_reg_exp(
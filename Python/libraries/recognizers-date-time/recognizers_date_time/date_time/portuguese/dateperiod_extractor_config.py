@@ -17,6 +17,7 @@ from ..base_dateperiod import DatePeriodExtractorConfiguration, MatchedIndex
 from .duration_extractor_config import PortugueseDurationExtractorConfiguration
 from .date_extractor_config import PortugueseDateExtractorConfiguration
 from .common_configs import PortugueseOrdinalExtractor, PortugueseCardinalExtractor
+from ..component_container import PortugueseDateTimeComponents
 
 
 class PortugueseDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
@@ -223,13 +224,13 @@ class PortugueseDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguratio
             PortugueseDateTime.InConnectorRegex)
         self._range_unit_regex = RegExpUtility.get_safe_reg_exp(
             PortugueseDateTime.RangeUnitRegex)
-        self._date_point_extractor = BaseDateExtractor(
-            PortugueseDateExtractorConfiguration())
-        self._integer_extractor = PortugueseIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            PortugueseNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            PortugueseDurationExtractorConfiguration())
+        self._date_point_extractor = PortugueseDateTimeComponents.get(
+            BaseDateExtractor, PortugueseDateExtractorConfiguration)
+        self._integer_extractor = PortugueseDateTimeComponents.get(PortugueseIntegerExtractor)
+        self._number_parser = PortugueseDateTimeComponents.get(
+            BaseNumberParser, PortugueseNumberParserConfiguration)
+        self._duration_extractor = PortugueseDateTimeComponents.get(
+            BaseDurationExtractor, PortugueseDurationExtractorConfiguration)
         self._range_connector_regex = RegExpUtility.get_safe_reg_exp(
             PortugueseDateTime.RangeConnectorRegex)
         self._now_regex = RegExpUtility.get_safe_reg_exp(
@@ -269,11 +270,11 @@ class PortugueseDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguratio
         self._century_suffix_regex = RegExpUtility.get_safe_reg_exp(
             PortugueseDateTime.CenturySuffixRegex
         )
-        self._ordinal_extractor = PortugueseOrdinalExtractor()
+        self._ordinal_extractor = PortugueseDateTimeComponents.get(PortugueseOrdinalExtractor)
         self._previous_prefix_regex = RegExpUtility.get_safe_reg_exp(
             PortugueseDateTime.PreviousPrefixRegex
         )
-        self._cardinal_extractor = PortugueseCardinalExtractor()
+        self._cardinal_extractor = PortugueseDateTimeComponents.get(PortugueseCardinalExtractor)
 
     def get_from_token_index(self, source: str) -> MatchedIndex:
         return MatchedIndex(True, source.rfind('from')) if source.endswith('from') else MatchedIndex(False, -1)
@@ -15,6 +15,7 @@ from .base_configs import PortugueseDateTimeUtilityConfiguration
 from .date_extractor_config import PortugueseDateExtractorConfiguration
 from .time_extractor_config import PortugueseTimeExtractorConfiguration
 from .duration_extractor_config import PortugueseDurationExtractorConfiguration
+from ..component_container import PortugueseDateTimeComponents
 
 
 class PortugueseDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
@@ -108,13 +109,14 @@ class PortugueseDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
 
     def __init__(self):
         super().__init__()
-        self._date_point_extractor = BaseDateExtractor(
-            PortugueseDateExtractorConfiguration())
-        self._time_point_extractor = BaseTimeExtractor(
-            PortugueseTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            PortugueseDurationExtractorConfiguration())
-        self._utility_configuration = PortugueseDateTimeUtilityConfiguration()
+        self._date_point_extractor = PortugueseDateTimeComponents.get(
+            BaseDateExtractor, PortugueseDateExtractorConfiguration)
+        self._time_point_extractor = PortugueseDateTimeComponents.get(
+            BaseTimeExtractor, PortugueseTimeExtractorConfiguration)
+        self._duration_extractor = PortugueseDateTimeComponents.get(
+            BaseDurationExtractor, PortugueseDurationExtractorConfiguration)
+        self._utility_configuration = PortugueseDateTimeComponents.get(
+            PortugueseDateTimeUtilityConfiguration)
         self.preposition_regex = RegExpUtility.get_safe_reg_exp(
             PortugueseDateTime.PrepositionRegex)
         self._now_regex = RegExpUtility.get_safe_reg_exp(
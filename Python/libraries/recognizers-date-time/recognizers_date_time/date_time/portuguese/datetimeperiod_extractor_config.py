@@ -22,6 +22,7 @@ from .timeperiod_extractor_config import PortugueseTimePeriodExtractorConfigurat
 from .datetime_extractor_config import PortugueseDateTimeExtractorConfiguration
 from .timezone_extractor_config import PortugueseTimeZoneExtractorConfiguration
 from ..utilities import DateTimeOptions
+from ..component_container import PortugueseDateTimeComponents
 
 
 class PortugueseDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfiguration):
@@ -183,19 +184,19 @@ class PortugueseDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConf
             PortugueseDateTime.WeekDayRegex
         )
         self._check_both_before_after = PortugueseDateTime.CheckBothBeforeAfter
-        self._cardinal_extractor = PortugueseCardinalExtractor()
-        self._single_date_extractor = BaseDateExtractor(
-            PortugueseDateExtractorConfiguration())
-        self._single_time_extractor = BaseTimeExtractor(
-            PortugueseTimeExtractorConfiguration())
-        self._single_date_time_extractor = BaseDateTimeExtractor(
-            PortugueseDateTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            PortugueseDurationExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            PortugueseTimePeriodExtractorConfiguration())
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            PortugueseTimeZoneExtractorConfiguration())
+        self._cardinal_extractor = PortugueseDateTimeComponents.get(PortugueseCardinalExtractor)
+        self._single_date_extractor = PortugueseDateTimeComponents.get(
+            BaseDateExtractor, PortugueseDateExtractorConfiguration)
+        self._single_time_extractor = PortugueseDateTimeComponents.get(
+            BaseTimeExtractor, PortugueseTimeExtractorConfiguration)
+        self._single_date_time_extractor = PortugueseDateTimeComponents.get(
+            BaseDateTimeExtractor, PortugueseDateTimeExtractorConfiguration)
+        self._duration_extractor = PortugueseDateTimeComponents.get(
+            BaseDurationExtractor, PortugueseDurationExtractorConfiguration)
+        self._time_period_extractor = PortugueseDateTimeComponents.get(
+            BaseTimePeriodExtractor, PortugueseTimePeriodExtractorConfiguration)
+        self._time_zone_extractor = PortugueseDateTimeComponents.get(
+            BaseTimeZoneExtractor, PortugueseTimeZoneExtractorConfiguration)
         self._simple_cases_regexes = [
             RegExpUtility.get_safe_reg_exp(PortugueseDateTime.PureNumFromTo),
             RegExpUtility.get_safe_reg_exp(PortugueseDateTime.PureNumBetweenAnd)
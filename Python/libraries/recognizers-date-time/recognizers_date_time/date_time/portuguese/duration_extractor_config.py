@@ -8,6 +8,7 @@ from recognizers_number.number.extractors import BaseNumberExtractor
 from recognizers_number.number.portuguese.extractors import PortugueseCardinalExtractor
 from ...resources.portuguese_date_time import PortugueseDateTime
 from ..base_duration import DurationExtractorConfiguration
+from ..component_container import PortugueseDateTimeComponents
 
 
 class PortugueseDurationExtractorConfiguration(DurationExtractorConfiguration):
@@ -115,7 +116,8 @@ class PortugueseDurationExtractorConfiguration(DurationExtractorConfiguration):
         self._during_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             PortugueseDateTime.DuringRegex
         )
-        self._cardinal_extractor: BaseNumberExtractor = PortugueseCardinalExtractor()
+        self._cardinal_extractor: BaseNumberExtractor = PortugueseDateTimeComponents.get(
+            PortugueseCardinalExtractor)
         self._unit_map = PortugueseDateTime.UnitMap
         self._unit_value_map = PortugueseDateTime.UnitValueMap
         self._duration_unit_regex = RegExpUtility.get_safe_reg_exp(
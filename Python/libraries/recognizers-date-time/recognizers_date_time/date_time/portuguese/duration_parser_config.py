@@ -12,6 +12,7 @@ from ...resources.portuguese_date_time import PortugueseDateTime
 from ..extractors import DateTimeExtractor
 from ..base_duration import DurationParserConfiguration, BaseDurationExtractor
 from .duration_extractor_config import PortugueseDurationExtractorConfiguration
+from ..component_container import PortugueseDateTimeComponents
 
 
 class PortugueseDurationParserConfiguration(DurationParserConfiguration):
@@ -73,10 +74,11 @@ class PortugueseDurationParserConfiguration(DurationParserConfiguration):
 
     def __init__(self, config):
         self._duration_extractor = BaseDurationExtractor(
-            PortugueseDurationExtractorConfiguration(), False)
-        self._cardinal_extractor: BaseNumberExtractor = PortugueseCardinalExtractor()
-        self._number_parser: BaseNumberParser = BaseNumberParser(
-            PortugueseNumberParserConfiguration())
+            PortugueseDateTimeComponents.get(PortugueseDurationExtractorConfiguration), False)
+        self._cardinal_extractor: BaseNumberExtractor = PortugueseDateTimeComponents.get(
+            PortugueseCardinalExtractor)
+        self._number_parser: BaseNumberParser = PortugueseDateTimeComponents.get(
+            BaseNumberParser, PortugueseNumberParserConfiguration)
         self._followed_unit: Pattern = RegExpUtility.get_safe_reg_exp(
             PortugueseDateTime.FollowedUnit)
         self._suffix_and_regex: Pattern = RegExpUtility.get_safe_reg_exp(
@@ -30,6 +30,7 @@ from .holiday_extractor_config import PortugueseHolidayExtractorConfiguration
 from ...resources.base_date_time import BaseDateTime
 from ..base_timezone import BaseTimeZoneExtractor
 from .timezone_extractor_config import PortugueseTimeZoneExtractorConfiguration
+from ..component_container import PortugueseDateTimeComponents
 
 
 class PortugueseMergedExtractorConfiguration(MergedExtractorConfiguration):
@@ -154,25 +155,25 @@ class PortugueseMergedExtractorConfiguration(MergedExtractorConfiguration):
         return self._term_filter_regexes
 
     def __init__(self):
-        self._integer_extractor = PortugueseIntegerExtractor()
-        self._date_extractor = BaseDateExtractor(
-            PortugueseDateExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            PortugueseTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            PortugueseDurationExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            PortugueseDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            PortugueseTimePeriodExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            PortugueseDateTimeExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            PortugueseDateTimePeriodExtractorConfiguration())
-        self._set_extractor = BaseSetExtractor(
-            PortugueseSetExtractorConfiguration())
-        self._holiday_extractor = BaseHolidayExtractor(
-            PortugueseHolidayExtractorConfiguration())
+        self._integer_extractor = PortugueseDateTimeComponents.get(PortugueseIntegerExtractor)
+        self._date_extractor = PortugueseDateTimeComponents.get(
+            BaseDateExtractor, PortugueseDateExtractorConfiguration)
+        self._time_extractor = PortugueseDateTimeComponents.get(
+            BaseTimeExtractor, PortugueseTimeExtractorConfiguration)
+        self._duration_extractor = PortugueseDateTimeComponents.get(
+            BaseDurationExtractor, PortugueseDurationExtractorConfiguration)
+        self._date_period_extractor = PortugueseDateTimeComponents.get(
+            BaseDatePeriodExtractor, PortugueseDatePeriodExtractorConfiguration)
+        self._time_period_extractor = PortugueseDateTimeComponents.get(
+            BaseTimePeriodExtractor, PortugueseTimePeriodExtractorConfiguration)
+        self._date_time_extractor = PortugueseDateTimeComponents.get(
+            BaseDateTimeExtractor, PortugueseDateTimeExtractorConfiguration)
+        self._date_time_period_extractor = PortugueseDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, PortugueseDateTimePeriodExtractorConfiguration)
+        self._set_extractor = PortugueseDateTimeComponents.get(
+            BaseSetExtractor, PortugueseSetExtractorConfiguration)
+        self._holiday_extractor = PortugueseDateTimeComponents.get(
+            BaseHolidayExtractor, PortugueseHolidayExtractorConfiguration)
         self._after_regex = RegExpUtility.get_safe_reg_exp(
             PortugueseDateTime.AfterRegex)
         self._before_regex = RegExpUtility.get_safe_reg_exp(
@@ -202,7 +203,7 @@ class PortugueseMergedExtractorConfiguration(MergedExtractorConfiguration):
         self._superfluous_word_matcher = None
         self._fail_fast_regex = None
         self._check_both_before_after = PortugueseDateTime.CheckBothBeforeAfter
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            PortugueseTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = PortugueseDateTimeComponents.get(
+            BaseTimeZoneExtractor, PortugueseTimeZoneExtractorConfiguration)
         # TODO When the implementation for these properties is added, change the None values to their respective Regexps
         self._datetime_alt_extractor = None
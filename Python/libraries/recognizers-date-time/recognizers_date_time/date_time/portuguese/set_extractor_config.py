@@ -21,6 +21,7 @@ from .dateperiod_extractor_config import PortugueseDatePeriodExtractorConfigurat
 from .timeperiod_extractor_config import PortugueseTimePeriodExtractorConfiguration
 from .datetime_extractor_config import PortugueseDateTimeExtractorConfiguration
 from .datetimeperiod_extractor_config import PortugueseDateTimePeriodExtractorConfiguration
+from ..component_container import PortugueseDateTimeComponents
 
 
 class PortugueseSetExtractorConfiguration(SetExtractorConfiguration):
@@ -89,20 +90,20 @@ class PortugueseSetExtractorConfiguration(SetExtractorConfiguration):
         return self._duration_unit_regex
 
     def __init__(self):
-        self._duration_extractor = BaseDurationExtractor(
-            PortugueseDurationExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            PortugueseTimeExtractorConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            PortugueseDateExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            PortugueseDateTimeExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            PortugueseDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            PortugueseTimePeriodExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            PortugueseDateTimePeriodExtractorConfiguration())
+        self._duration_extractor = PortugueseDateTimeComponents.get(
+            BaseDurationExtractor, PortugueseDurationExtractorConfiguration)
+        self._time_extractor = PortugueseDateTimeComponents.get(
+            BaseTimeExtractor, PortugueseTimeExtractorConfiguration)
+        self._date_extractor = PortugueseDateTimeComponents.get(
+            BaseDateExtractor, PortugueseDateExtractorConfiguration)
+        self._date_time_extractor = PortugueseDateTimeComponents.get(
+            BaseDateTimeExtractor, PortugueseDateTimeExtractorConfiguration)
+        self._date_period_extractor = PortugueseDateTimeComponents.get(
+            BaseDatePeriodExtractor, PortugueseDatePeriodExtractorConfiguration)
+        self._time_period_extractor = PortugueseDateTimeComponents.get(
+            BaseTimePeriodExtractor, PortugueseTimePeriodExtractorConfiguration)
+        self._date_time_period_extractor = PortugueseDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, PortugueseDateTimePeriodExtractorConfiguration)
         self._last_regex = RegExpUtility.get_safe_reg_exp(
             PortugueseDateTime.LastDateRegex)
         self._each_prefix_regex = RegExpUtility.get_safe_reg_exp(
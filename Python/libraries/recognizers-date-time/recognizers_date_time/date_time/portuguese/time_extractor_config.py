@@ -9,6 +9,7 @@ from ..base_time import TimeExtractorConfiguration
 from ..base_timezone import BaseTimeZoneExtractor
 from ..extractors import DateTimeExtractor
 from .timezone_extractor_config import PortugueseTimeZoneExtractorConfiguration
+from ..component_container import PortugueseDateTimeComponents
 
 
 class PortugueseTimeExtractorConfiguration(TimeExtractorConfiguration):
@@ -120,5 +121,5 @@ class PortugueseTimeExtractorConfiguration(TimeExtractorConfiguration):
         self._ish_regex: Pattern = None
         self._time_before_after_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             PortugueseDateTime.TimeBeforeAfterRegex)
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            PortugueseTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = PortugueseDateTimeComponents.get(
+            BaseTimeZoneExtractor, PortugueseTimeZoneExtractorConfiguration)
@@ -15,6 +15,7 @@ from .base_configs import PortugueseDateTimeUtilityConfiguration
 from .time_extractor_config import PortugueseTimeExtractorConfiguration
 from .timezone_extractor_config import PortugueseTimeZoneExtractorConfiguration
 from ..utilities import DateTimeOptions
+from ..component_container import PortugueseDateTimeComponents
 
 
 class PortugueseTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
@@ -69,10 +70,11 @@ class PortugueseTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguratio
 
     def __init__(self):
         super().__init__()
-        self._single_time_extractor = BaseTimeExtractor(
-            PortugueseTimeExtractorConfiguration())
-        self._integer_extractor = PortugueseIntegerExtractor()
-        self.utility_configuration = PortugueseDateTimeUtilityConfiguration()
+        self._single_time_extractor = PortugueseDateTimeComponents.get(
+            BaseTimeExtractor, PortugueseTimeExtractorConfiguration)
+        self._integer_extractor = PortugueseDateTimeComponents.get(PortugueseIntegerExtractor)
+        self.utility_configuration = PortugueseDateTimeComponents.get(
+            PortugueseDateTimeUtilityConfiguration)
 
         self._simple_cases_regex: List[Pattern] = [
             RegExpUtility.get_safe_reg_exp(PortugueseDateTime.PureNumFromTo),
@@ -97,8 +99,8 @@ class PortugueseTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguratio
         self._token_before_date = PortugueseDateTime.TokenBeforeDate
         self._pure_number_regex = [PortugueseDateTime.PureNumFromTo, PortugueseDateTime.PureNumFromTo]
         self._options = DateTimeOptions.NONE
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            PortugueseTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = PortugueseDateTimeComponents.get(
+            BaseTimeZoneExtractor, PortugueseTimeZoneExtractorConfiguration)
         self._check_both_before_after = PortugueseDateTime.CheckBothBeforeAfter
 
     def get_from_token_index(self, source: str) -> MatchedIndex:
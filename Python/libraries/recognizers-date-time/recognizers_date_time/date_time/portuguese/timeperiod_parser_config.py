@@ -13,6 +13,7 @@ from ..base_configs import BaseDateParserConfiguration, DateTimeUtilityConfigura
 from ..base_timeperiod import TimePeriodParserConfiguration, MatchedTimeRegex
 from ..utilities import TimexUtil
 from ..constants import Constants
+from ..component_container import PortugueseDateTimeComponents
 
 
 class PortugueseTimePeriodParserConfiguration(TimePeriodParserConfiguration):
@@ -68,7 +69,7 @@ class PortugueseTimePeriodParserConfiguration(TimePeriodParserConfiguration):
         self._time_extractor = config.time_extractor
         self._time_parser = config.time_parser
         self._time_zone_parser = config.time_zone_parser
-        self._integer_extractor = PortugueseIntegerExtractor()
+        self._integer_extractor = PortugueseDateTimeComponents.get(PortugueseIntegerExtractor)
         self._pure_number_from_to_regex = RegExpUtility.get_safe_reg_exp(
             PortugueseDateTime.PureNumFromTo)
         self._pure_number_between_and_regex = RegExpUtility.get_safe_reg_exp(
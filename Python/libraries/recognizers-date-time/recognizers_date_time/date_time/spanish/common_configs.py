@@ -34,6 +34,7 @@ from .datetime_extractor_config import SpanishDateTimeExtractorConfiguration
 from .datetime_parser_config import SpanishDateTimeParserConfiguration
 from .datetimeperiod_extractor_config import SpanishDateTimePeriodExtractorConfiguration
 from .datetimeperiod_parser_config import SpanishDateTimePeriodParserConfiguration
+from ..component_container import SpanishDateTimeComponents
 
 
 class SpanishCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
@@ -160,8 +161,9 @@ class SpanishCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
     def __init__(self):
         BaseDateParserConfiguration.__init__(self)
 
-        self._utility_configuration = SpanishDateTimeUtilityConfiguration()
-        self._time_zone_parser = BaseTimeZoneParser()
+        self._utility_configuration = SpanishDateTimeComponents.get(
+            SpanishDateTimeUtilityConfiguration)
+        self._time_zone_parser = SpanishDateTimeComponents.get(BaseTimeZoneParser)
         self._unit_map = SpanishDateTime.UnitMap
         self._unit_value_map = SpanishDateTime.UnitValueMap
         self._season_map = SpanishDateTime.SeasonMap
@@ -171,26 +173,26 @@ class SpanishCommonDateTimeParserConfiguration(BaseDateParserConfiguration):
         self._numbers = SpanishDateTime.Numbers
         self._double_numbers = SpanishDateTime.DoubleNumbers
         self._check_both_before_after = SpanishDateTime.CheckBothBeforeAfter
-        self._cardinal_extractor = SpanishCardinalExtractor()
-        self._integer_extractor = SpanishIntegerExtractor()
-        self._ordinal_extractor = SpanishOrdinalExtractor()
-
-        self._number_parser = BaseNumberParser(
-            SpanishNumberParserConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            SpanishDateExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            SpanishTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            SpanishDurationExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            SpanishDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            SpanishTimePeriodExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            SpanishDateTimeExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            SpanishDateTimePeriodExtractorConfiguration())
+        self._cardinal_extractor = SpanishDateTimeComponents.get(SpanishCardinalExtractor)
+        self._integer_extractor = SpanishDateTimeComponents.get(SpanishIntegerExtractor)
+        self._ordinal_extractor = SpanishDateTimeComponents.get(SpanishOrdinalExtractor)
+
+        self._number_parser = SpanishDateTimeComponents.get(
+            BaseNumberParser, SpanishNumberParserConfiguration)
+        self._date_extractor = SpanishDateTimeComponents.get(
+            BaseDateExtractor, SpanishDateExtractorConfiguration)
+        self._time_extractor = SpanishDateTimeComponents.get(
+            BaseTimeExtractor, SpanishTimeExtractorConfiguration)
+        self._duration_extractor = SpanishDateTimeComponents.get(
+            BaseDurationExtractor, SpanishDurationExtractorConfiguration)
+        self._date_period_extractor = SpanishDateTimeComponents.get(
+            BaseDatePeriodExtractor, SpanishDatePeriodExtractorConfiguration)
+        self._time_period_extractor = SpanishDateTimeComponents.get(
+            BaseTimePeriodExtractor, SpanishTimePeriodExtractorConfiguration)
+        self._date_time_extractor = SpanishDateTimeComponents.get(
+            BaseDateTimeExtractor, SpanishDateTimeExtractorConfiguration)
+        self._date_time_period_extractor = SpanishDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, SpanishDateTimePeriodExtractorConfiguration)
         self._duration_parser = BaseDurationParser(
             SpanishDurationParserConfiguration(self))
         self._date_parser = BaseDateParser(
@@ -14,6 +14,7 @@ from .duration_extractor_config import SpanishDurationExtractorConfiguration
 from .base_configs import SpanishDateTimeUtilityConfiguration
 from ..constants import Constants
 from ...resources.base_date_time import BaseDateTime
+from ..component_container import SpanishDateTimeComponents
 
 
 class SpanishDateExtractorConfiguration(DateExtractorConfiguration):
@@ -190,13 +191,14 @@ class SpanishDateExtractorConfiguration(DateExtractorConfiguration):
         self._week_day_regex = RegExpUtility.get_safe_reg_exp(
             SpanishDateTime.WeekDayRegex)
         self._day_of_week = SpanishDateTime.DayOfWeek
-        self._ordinal_extractor = SpanishOrdinalExtractor()
-        self._integer_extractor = SpanishIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            SpanishNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            SpanishDurationExtractorConfiguration())
-        self._utility_configuration = SpanishDateTimeUtilityConfiguration()
+        self._ordinal_extractor = SpanishDateTimeComponents.get(SpanishOrdinalExtractor)
+        self._integer_extractor = SpanishDateTimeComponents.get(SpanishIntegerExtractor)
+        self._number_parser = SpanishDateTimeComponents.get(
+            BaseNumberParser, SpanishNumberParserConfiguration)
+        self._duration_extractor = SpanishDateTimeComponents.get(
+            BaseDurationExtractor, SpanishDurationExtractorConfiguration)
+        self._utility_configuration = SpanishDateTimeComponents.get(
+            SpanishDateTimeUtilityConfiguration)
         self._range_connector_symbol_regex = RegExpUtility.get_safe_reg_exp(
             BaseDateTime.RangeConnectorSymbolRegex
         )
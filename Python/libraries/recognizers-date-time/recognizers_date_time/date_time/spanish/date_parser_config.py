@@ -13,6 +13,7 @@ from ..utilities import DateTimeUtilityConfiguration
 from ..base_date import DateParserConfiguration
 from ..base_configs import BaseDateParserConfiguration
 from .date_extractor_config import SpanishDateExtractorConfiguration
+from ..component_container import SpanishDateTimeComponents
 
 
 class SpanishDateParserConfiguration(DateParserConfiguration):
@@ -156,7 +157,7 @@ class SpanishDateParserConfiguration(DateParserConfiguration):
         self._unit_map = config.unit_map
         self._cardinal_map = config.cardinal_map
         self._date_regex = (
-            SpanishDateExtractorConfiguration()).date_regex_list
+            SpanishDateTimeComponents.get(SpanishDateExtractorConfiguration)).date_regex_list
         self._on_regex = RegExpUtility.get_safe_reg_exp(
             SpanishDateTime.OnRegex)
         self._special_day_regex = RegExpUtility.get_safe_reg_exp(
@@ -17,6 +17,7 @@ from ..base_date import BaseDateExtractor
 from ..base_dateperiod import DatePeriodExtractorConfiguration, MatchedIndex
 from .duration_extractor_config import SpanishDurationExtractorConfiguration
 from .date_extractor_config import SpanishDateExtractorConfiguration
+from ..component_container import SpanishDateTimeComponents
 
 
 class SpanishDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
@@ -232,13 +233,13 @@ class SpanishDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
         self.between_regex = RegExpUtility.get_safe_reg_exp(
             SpanishDateTime.BetweenRegex)
 
-        self._date_point_extractor = BaseDateExtractor(
-            SpanishDateExtractorConfiguration())
-        self._integer_extractor = SpanishIntegerExtractor()
-        self._number_parser = BaseNumberParser(
-            SpanishNumberParserConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            SpanishDurationExtractorConfiguration())
+        self._date_point_extractor = SpanishDateTimeComponents.get(
+            BaseDateExtractor, SpanishDateExtractorConfiguration)
+        self._integer_extractor = SpanishDateTimeComponents.get(SpanishIntegerExtractor)
+        self._number_parser = SpanishDateTimeComponents.get(
+            BaseNumberParser, SpanishNumberParserConfiguration)
+        self._duration_extractor = SpanishDateTimeComponents.get(
+            BaseDurationExtractor, SpanishDurationExtractorConfiguration)
         self._now_regex = RegExpUtility.get_safe_reg_exp(
             SpanishDateTime.NowRegex)
         self._future_suffix_regex = RegExpUtility.get_safe_reg_exp(
@@ -264,8 +265,8 @@ class SpanishDatePeriodExtractorConfiguration(DatePeriodExtractorConfiguration):
             SpanishDateTime.CenturySuffixRegex
         )
         self._check_both_before_after = False
-        self._cardinal_extractor = SpanishCardinalExtractor()
-        self._ordinal_extractor = SpanishOrdinalExtractor()
+        self._cardinal_extractor = SpanishDateTimeComponents.get(SpanishCardinalExtractor)
+        self._ordinal_extractor = SpanishDateTimeComponents.get(SpanishOrdinalExtractor)
         self._decade_with_century_regex = RegExpUtility.get_safe_reg_exp(
             SpanishDateTime.DecadeWithCenturyRegex)
         self._previous_prefix_regex = RegExpUtility.get_safe_reg_exp(
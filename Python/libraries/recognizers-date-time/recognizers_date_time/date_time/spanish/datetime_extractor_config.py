@@ -16,6 +16,7 @@ from .date_extractor_config import SpanishDateExtractorConfiguration
 from .time_extractor_config import SpanishTimeExtractorConfiguration
 from .duration_extractor_config import SpanishDurationExtractorConfiguration
 from ..utilities import DateTimeOptions
+from ..component_container import SpanishDateTimeComponents
 
 
 class SpanishDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
@@ -153,13 +154,14 @@ class SpanishDateTimeExtractorConfiguration(DateTimeExtractorConfiguration):
             SpanishDateTime.YearRegex
         )
 
-        self._date_point_extractor = BaseDateExtractor(
-            SpanishDateExtractorConfiguration())
-        self._time_point_extractor = BaseTimeExtractor(
-            SpanishTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            SpanishDurationExtractorConfiguration())
-        self._utility_configuration = SpanishDateTimeUtilityConfiguration()
+        self._date_point_extractor = SpanishDateTimeComponents.get(
+            BaseDateExtractor, SpanishDateExtractorConfiguration)
+        self._time_point_extractor = SpanishDateTimeComponents.get(
+            BaseTimeExtractor, SpanishTimeExtractorConfiguration)
+        self._duration_extractor = SpanishDateTimeComponents.get(
+            BaseDurationExtractor, SpanishDurationExtractorConfiguration)
+        self._utility_configuration = SpanishDateTimeComponents.get(
+            SpanishDateTimeUtilityConfiguration)
         self._options = DateTimeOptions.NONE
 
     def is_connector_token(self, source: str) -> bool:
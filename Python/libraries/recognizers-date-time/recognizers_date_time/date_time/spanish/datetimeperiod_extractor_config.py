@@ -21,6 +21,7 @@ from .timeperiod_extractor_config import SpanishTimePeriodExtractorConfiguration
 from .datetime_extractor_config import SpanishDateTimeExtractorConfiguration
 from ..utilities import DateTimeOptions
 from .timezone_extractor_config import SpanishTimeZoneExtractorConfiguration
+from ..component_container import SpanishDateTimeComponents
 
 
 class SpanishDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfiguration):
@@ -221,20 +222,20 @@ class SpanishDateTimePeriodExtractorConfiguration(DateTimePeriodExtractorConfigu
         self.between_regex = RegExpUtility.get_safe_reg_exp(
             SpanishDateTime.BetweenRegex)
 
-        self._cardinal_extractor = SpanishCardinalExtractor()
-
-        self._single_date_extractor = BaseDateExtractor(
-            SpanishDateExtractorConfiguration())
-        self._single_time_extractor = BaseTimeExtractor(
-            SpanishTimeExtractorConfiguration())
-        self._single_date_time_extractor = BaseDateTimeExtractor(
-            SpanishDateTimeExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            SpanishDurationExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            SpanishTimePeriodExtractorConfiguration())
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            SpanishTimeZoneExtractorConfiguration())
+        self._cardinal_extractor = SpanishDateTimeComponents.get(SpanishCardinalExtractor)
+
+        self._single_date_extractor = SpanishDateTimeComponents.get(
+            BaseDateExtractor, SpanishDateExtractorConfiguration)
+        self._single_time_extractor = SpanishDateTimeComponents.get(
+            BaseTimeExtractor, SpanishTimeExtractorConfiguration)
+        self._single_date_time_extractor = SpanishDateTimeComponents.get(
+            BaseDateTimeExtractor, SpanishDateTimeExtractorConfiguration)
+        self._duration_extractor = SpanishDateTimeComponents.get(
+            BaseDurationExtractor, SpanishDurationExtractorConfiguration)
+        self._time_period_extractor = SpanishDateTimeComponents.get(
+            BaseTimePeriodExtractor, SpanishTimePeriodExtractorConfiguration)
+        self._time_zone_extractor = SpanishDateTimeComponents.get(
+            BaseTimeZoneExtractor, SpanishTimeZoneExtractorConfiguration)
         self._within_next_prefix_regex = RegExpUtility.get_safe_reg_exp(
             SpanishDateTime.WithinNextPrefixRegex
         )
@@ -8,6 +8,7 @@ from recognizers_number.number.extractors import BaseNumberExtractor
 from recognizers_number.number.spanish.extractors import SpanishCardinalExtractor
 from ...resources.spanish_date_time import SpanishDateTime
 from ..base_duration import DurationExtractorConfiguration
+from ..component_container import SpanishDateTimeComponents
 
 
 class SpanishDurationExtractorConfiguration(DurationExtractorConfiguration):
@@ -110,7 +111,8 @@ class SpanishDurationExtractorConfiguration(DurationExtractorConfiguration):
             SpanishDateTime.SuffixAndRegex)
         self._relative_duration_unit_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             SpanishDateTime.RelativeDurationUnitRegex)
-        self._cardinal_extractor: BaseNumberExtractor = SpanishCardinalExtractor()
+        self._cardinal_extractor: BaseNumberExtractor = SpanishDateTimeComponents.get(
+            SpanishCardinalExtractor)
         self._during_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             SpanishDateTime.DuringRegex
         )
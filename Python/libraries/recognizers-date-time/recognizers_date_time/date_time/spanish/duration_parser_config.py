@@ -11,6 +11,7 @@ from ...resources.spanish_date_time import SpanishDateTime
 from ..extractors import DateTimeExtractor
 from ..base_duration import DurationParserConfiguration, BaseDurationExtractor
 from .duration_extractor_config import SpanishDurationExtractorConfiguration
+from ..component_container import SpanishDateTimeComponents
 
 
 class SpanishDurationParserConfiguration(DurationParserConfiguration):
@@ -68,7 +69,7 @@ class SpanishDurationParserConfiguration(DurationParserConfiguration):
     def __init__(self, config):
         self._duration_extractor = None
         self.duration_extractor = BaseDurationExtractor(
-            SpanishDurationExtractorConfiguration(), False)
+            SpanishDateTimeComponents.get(SpanishDurationExtractorConfiguration), False)
         self._cardinal_extractor: BaseNumberExtractor = config.cardinal_extractor
         self._number_parser: BaseNumberParser = config.number_parser
         self._followed_unit: Pattern = RegExpUtility.get_safe_reg_exp(
@@ -28,6 +28,7 @@ from .datetimeperiod_extractor_config import SpanishDateTimePeriodExtractorConfi
 from .set_extractor_config import SpanishSetExtractorConfiguration
 from .holiday_extractor_config import SpanishHolidayExtractorConfiguration
 from ...resources.base_date_time import BaseDateTime
+from ..component_container import SpanishDateTimeComponents
 
 
 class SpanishMergedExtractorConfiguration(MergedExtractorConfiguration):
@@ -179,25 +180,25 @@ class SpanishMergedExtractorConfiguration(MergedExtractorConfiguration):
         self._number_ending_pattern = RegExpUtility.get_safe_reg_exp(
             SpanishDateTime.NumberEndingPattern)
 
-        self._date_extractor = BaseDateExtractor(
-            SpanishDateExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            SpanishTimeExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            SpanishDateTimeExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            SpanishDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            SpanishTimePeriodExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            SpanishDateTimePeriodExtractorConfiguration())
-        self._duration_extractor = BaseDurationExtractor(
-            SpanishDurationExtractorConfiguration())
-        self._set_extractor = BaseSetExtractor(
-            SpanishSetExtractorConfiguration())
-        self._holiday_extractor = BaseHolidayExtractor(
-            SpanishHolidayExtractorConfiguration())
-        self._integer_extractor = SpanishIntegerExtractor()
+        self._date_extractor = SpanishDateTimeComponents.get(
+            BaseDateExtractor, SpanishDateExtractorConfiguration)
+        self._time_extractor = SpanishDateTimeComponents.get(
+            BaseTimeExtractor, SpanishTimeExtractorConfiguration)
+        self._date_time_extractor = SpanishDateTimeComponents.get(
+            BaseDateTimeExtractor, SpanishDateTimeExtractorConfiguration)
+        self._date_period_extractor = SpanishDateTimeComponents.get(
+            BaseDatePeriodExtractor, SpanishDatePeriodExtractorConfiguration)
+        self._time_period_extractor = SpanishDateTimeComponents.get(
+            BaseTimePeriodExtractor, SpanishTimePeriodExtractorConfiguration)
+        self._date_time_period_extractor = SpanishDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, SpanishDateTimePeriodExtractorConfiguration)
+        self._duration_extractor = SpanishDateTimeComponents.get(
+            BaseDurationExtractor, SpanishDurationExtractorConfiguration)
+        self._set_extractor = SpanishDateTimeComponents.get(
+            BaseSetExtractor, SpanishSetExtractorConfiguration)
+        self._holiday_extractor = SpanishDateTimeComponents.get(
+            BaseHolidayExtractor, SpanishHolidayExtractorConfiguration)
+        self._integer_extractor = SpanishDateTimeComponents.get(SpanishIntegerExtractor)
         self._filter_word_regex_list = []
         self._unspecified_date_period_regex = RegExpUtility.get_safe_reg_exp(
             SpanishDateTime.UnspecificDatePeriodRegex
@@ -23,6 +23,7 @@ from .datetime_extractor_config import SpanishDateTimeExtractorConfiguration
 from .datetimeperiod_extractor_config import SpanishDateTimePeriodExtractorConfiguration
 from recognizers_number import BaseNumberExtractor
 from recognizers_number.number.spanish.extractors import SpanishCardinalExtractor
+from ..component_container import SpanishDateTimeComponents
 
 
 class SpanishSetExtractorConfiguration(SetExtractorConfiguration):
@@ -108,18 +109,18 @@ class SpanishSetExtractorConfiguration(SetExtractorConfiguration):
         self._set_week_day_regex = RegExpUtility.get_safe_reg_exp(
             SpanishDateTime.SetWeekDayRegex)
 
-        self._duration_extractor = BaseDurationExtractor(
-            SpanishDurationExtractorConfiguration())
-        self._time_extractor = BaseTimeExtractor(
-            SpanishTimeExtractorConfiguration())
-        self._date_extractor = BaseDateExtractor(
-            SpanishDateExtractorConfiguration())
-        self._date_time_extractor = BaseDateTimeExtractor(
-            SpanishDateTimeExtractorConfiguration())
-        self._date_period_extractor = BaseDatePeriodExtractor(
-            SpanishDatePeriodExtractorConfiguration())
-        self._time_period_extractor = BaseTimePeriodExtractor(
-            SpanishTimePeriodExtractorConfiguration())
-        self._date_time_period_extractor = BaseDateTimePeriodExtractor(
-            SpanishDateTimePeriodExtractorConfiguration())
-        self._cardinal_extractor = SpanishCardinalExtractor()
+        self._duration_extractor = SpanishDateTimeComponents.get(
+            BaseDurationExtractor, SpanishDurationExtractorConfiguration)
+        self._time_extractor = SpanishDateTimeComponents.get(
+            BaseTimeExtractor, SpanishTimeExtractorConfiguration)
+        self._date_extractor = SpanishDateTimeComponents.get(
+            BaseDateExtractor, SpanishDateExtractorConfiguration)
+        self._date_time_extractor = SpanishDateTimeComponents.get(
+            BaseDateTimeExtractor, SpanishDateTimeExtractorConfiguration)
+        self._date_period_extractor = SpanishDateTimeComponents.get(
+            BaseDatePeriodExtractor, SpanishDatePeriodExtractorConfiguration)
+        self._time_period_extractor = SpanishDateTimeComponents.get(
+            BaseTimePeriodExtractor, SpanishTimePeriodExtractorConfiguration)
+        self._date_time_period_extractor = SpanishDateTimeComponents.get(
+            BaseDateTimePeriodExtractor, SpanishDateTimePeriodExtractorConfiguration)
+        self._cardinal_extractor = SpanishDateTimeComponents.get(SpanishCardinalExtractor)
@@ -7,6 +7,7 @@ from ...resources.spanish_date_time import SpanishDateTime
 from ..base_time import TimeExtractorConfiguration
 from ..base_timezone import BaseTimeZoneExtractor
 from .timezone_extractor_config import SpanishTimeZoneExtractorConfiguration
+from ..component_container import SpanishDateTimeComponents
 
 
 class SpanishTimeExtractorConfiguration(TimeExtractorConfiguration):
@@ -46,8 +47,8 @@ class SpanishTimeExtractorConfiguration(TimeExtractorConfiguration):
             SpanishDateTime.AtRegex)
         self._time_before_after_regex: Pattern = RegExpUtility.get_safe_reg_exp(
             SpanishDateTime.TimeBeforeAfterRegex)
-        self._time_zone_extractor = self._timezone_extractor = BaseTimeZoneExtractor(
-            SpanishTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = self._timezone_extractor = SpanishDateTimeComponents.get(
+            BaseTimeZoneExtractor, SpanishTimeZoneExtractorConfiguration)
         # TODO When the implementation for these properties is added, change the None values to the respective Regexps
         self._ish_regex: Pattern = None
 
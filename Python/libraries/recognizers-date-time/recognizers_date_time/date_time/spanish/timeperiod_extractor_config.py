@@ -15,6 +15,7 @@ from .time_extractor_config import SpanishTimeExtractorConfiguration
 from .base_configs import SpanishDateTimeUtilityConfiguration
 from ..utilities import DateTimeOptions
 from .timezone_extractor_config import SpanishTimeZoneExtractorConfiguration
+from ..component_container import SpanishDateTimeComponents
 
 
 class SpanishTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
@@ -69,10 +70,11 @@ class SpanishTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
 
     def __init__(self):
         super().__init__()
-        self._single_time_extractor = BaseTimeExtractor(
-            SpanishTimeExtractorConfiguration())
-        self._integer_extractor = SpanishIntegerExtractor()
-        self.utility_configuration = SpanishDateTimeUtilityConfiguration()
+        self._single_time_extractor = SpanishDateTimeComponents.get(
+            BaseTimeExtractor, SpanishTimeExtractorConfiguration)
+        self._integer_extractor = SpanishDateTimeComponents.get(SpanishIntegerExtractor)
+        self.utility_configuration = SpanishDateTimeComponents.get(
+            SpanishDateTimeUtilityConfiguration)
 
         self._simple_cases_regex: List[Pattern] = [
             RegExpUtility.get_safe_reg_exp(SpanishDateTime.PureNumFromTo),
@@ -97,8 +99,8 @@ class SpanishTimePeriodExtractorConfiguration(TimePeriodExtractorConfiguration):
         self._token_before_date = SpanishDateTime.TokenBeforeDate
         self._pure_number_regex = [SpanishDateTime.PureNumFromTo, SpanishDateTime.PureNumFromTo]
         self._options = DateTimeOptions.NONE
-        self._time_zone_extractor = BaseTimeZoneExtractor(
-            SpanishTimeZoneExtractorConfiguration())
+        self._time_zone_extractor = SpanishDateTimeComponents.get(
+            BaseTimeZoneExtractor, SpanishTimeZoneExtractorConfiguration)
         self._check_both_before_after = SpanishDateTime.CheckBothBeforeAfter
 
     def get_from_token_index(self, source: str) -> MatchedIndex:
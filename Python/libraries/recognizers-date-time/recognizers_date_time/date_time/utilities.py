@@ -1,9 +1,10 @@
 #  Copyright (c) Microsoft Corporation. All rights reserved.
 #  Licensed under the MIT License.
 
+from bisect import bisect_left, bisect_right, insort
 from enum import Enum, IntEnum, IntFlag
 from abc import ABC, abstractmethod
-from typing import List, Dict, Pattern, Union, Match
+from typing import List, Dict, Optional, Pattern, Tuple, Union, Match
 from datetime import datetime, timedelta
 import calendar
 
@@ -172,14 +173,17 @@ def merge_all_tokens(tokens: List[Token], source: str, extractor_name: str) -> L
     result = []
 
     merged_tokens: List[Token] = list()
+    # max_ends[i] is the largest start or end among merged_tokens[:i + 1]. Tokens come in by start, so
+    # a merged token ending before both ends of a new token can neither contain, overlap nor be covered
+    # by it, and the scan starts at the first one that might.
+    max_ends: List[int] = list()
     tokens_ = sorted(filter(None, tokens), key=lambda x: x.start)
 
     for token in tokens_:
         add = True
 
-        for index, m_token in enumerate(merged_tokens):
-            if not add:
-                break
+        for index in range(bisect_left(max_ends, min(token.start, token.end)), len(merged_tokens)):
+            m_token = merged_tokens[index]
 
             if token.start >= m_token.start and token.end <= m_token.end:
                 add = False
@@ -190,9 +194,18 @@ def merge_all_tokens(tokens: List[Token], source: str, extractor_name: str) -> L
             if token.start <= m_token.start and token.end >= m_token.end:
                 add = False
                 merged_tokens[index] = token
+                end = max(token.start, token.end)
+                for max_index in range(index, len(max_ends)):
+                    if max_ends[max_index] >= end:
+                        break
+                    max_ends[max_index] = end
+
+            if not add:
+                break
 
         if add:
             merged_tokens.append(token)
+            max_ends.append(max(token.start, token.end, max_ends[-1] if max_ends else token.start))
 
     for token in merged_tokens:
         start = token.start
@@ -212,6 +225,60 @@ def merge_all_tokens(tokens: List[Token], source: str, extractor_name: str) -> L
     return result
 
 
+class ResultIntervals:
+    """
+    Results being merged, kept in their list order and indexed by start so the ones
+    overlapping a new result are found without going through all of them.
+    """
+
+    def __init__(self, results: List[ExtractResult]):
+        self.__results: Dict[int, ExtractResult] = dict(enumerate(results))
+        # Ranks give the list order: appended results take a new highest rank, a result
+        # replacing others takes the rank of the first one.
+        self.__ranks: List[int] = list(range(len(results)))
+        self.__starts: List[Tuple[int, int]] = sorted((r.start, rank) for rank, r in enumerate(results))
+        self.__max_length: int = max([0] + [r.length for r in results])
+        self.__next_rank: int = len(results)
+
+    def __getitem__(self, rank: int) -> ExtractResult:
+        return self.__results[rank]
+
+    def results(self) -> List[ExtractResult]:
+        return [self.__results[rank] for rank in self.__ranks]
+
+    def starting_between(self, start: int, end: int) -> List[Tuple[int, ExtractResult]]:
+        """
+        (rank, result) in list order of the results that start between start minus the
+        longest length and end, i.e. every result overlapping or touching [start, end].
+        """
+        low = bisect_left(self.__starts, (start - self.__max_length,))
+        high = bisect_right(self.__starts, (end, self.__next_rank))
+        return [(rank, self.__results[rank]) for _, rank in sorted(self.__starts[low:high], key=lambda x: x[1])]
+
+    def overlapping(self, value: ExtractResult) -> List[Tuple[int, ExtractResult]]:
+        return [(rank, result) for rank, result in self.starting_between(value.start, value.end)
+                if result.overlap(value)]
+
+    def next_rank(self, rank: int) -> Optional[int]:
+        index = bisect_right(self.__ranks, rank)
+        return self.__ranks[index] if index < len(self.__ranks) else None
+
+    def append(self, value: ExtractResult):
+        self.insert(self.__next_rank, value)
+        self.__next_rank += 1
+
+    def insert(self, rank: int, value: ExtractResult):
+        self.__results[rank] = value
+        insort(self.__ranks, rank)
+        insort(self.__starts, (value.start, rank))
+        self.__max_length = max(self.__max_length, value.length)
+
+    def remove(self, rank: int):
+        value = self.__results.pop(rank)
+        del self.__ranks[bisect_left(self.__ranks, rank)]
+        del self.__starts[bisect_left(self.__starts, (value.start, rank))]
+
+
 def __token_to_result(token: Token, source: str, name: str) -> ExtractResult:
     result: ExtractResult = ExtractResult()
     result.start = token.start
@@ -8,6 +8,7 @@ from recognizers_text.model import Model, ModelResult
 from recognizers_text.extractor import Extractor
 from recognizers_text.parser import Parser
 from recognizers_text.utilities import QueryProcessor
+from recognizers_text.extraction_context import in_extraction_context
 from recognizers_number_with_unit.number_with_unit.parsers import UnitValue, CurrencyUnitValue
 
 
@@ -26,6 +27,7 @@ class AbstractNumberWithUnitModel(Model):
     def __init__(self, extractor_parser: List[ExtractorParserModel]):
         self.extractor_parser: List[ExtractorParserModel] = extractor_parser
 
+    @in_extraction_context
     def parse(self, query: str) -> List[ModelResult]:
 
         query = QueryProcessor.preprocess(query, True)
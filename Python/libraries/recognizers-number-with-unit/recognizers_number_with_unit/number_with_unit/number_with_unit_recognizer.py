@@ -3,7 +3,7 @@
 
 from enum import IntFlag
 from typing import List
-from recognizers_text import Culture, Recognizer
+from recognizers_text import Culture, Recognizer, RecognizerRegistry
 from recognizers_text.model import Model, ModelResult
 from recognizers_number.culture import CultureInfo
 from .models import CurrencyModel, TemperatureModel, DimensionModel, AgeModel, ExtractorParserModel
@@ -249,26 +249,26 @@ class NumberWithUnitRecognizer(Recognizer[NumberWithUnitOptions]):
 
 
 def recognize_age(query: str, culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = NumberWithUnitRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(NumberWithUnitRecognizer, culture, options)
     model = recognizer.get_age_model(culture, fallback_to_default_culture)
     return model.parse(query)
 
 
 def recognize_currency(query: str, culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = NumberWithUnitRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(NumberWithUnitRecognizer, culture, options)
     model = recognizer.get_currency_model(culture, fallback_to_default_culture)
     return model.parse(query)
 
 
 def recognize_dimension(query: str, culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = NumberWithUnitRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(NumberWithUnitRecognizer, culture, options)
     model = recognizer.get_dimension_model(
         culture, fallback_to_default_culture)
     return model.parse(query)
 
 
 def recognize_temperature(query: str, culture: str, options: NumberWithUnitOptions = NumberWithUnitOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = NumberWithUnitRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(NumberWithUnitRecognizer, culture, options)
     model = recognizer.get_temperature_model(
         culture, fallback_to_default_culture)
     return model.parse(query)
@@ -2,12 +2,15 @@
 #  Licensed under the MIT License.
 
 from abc import abstractmethod
+from itertools import count
 from typing import List, Pattern, Dict, Match
 from collections import namedtuple
 import regex
 
-from recognizers_text.utilities import RegExpUtility
+from recognizers_text.utilities import RegExpUtility, MatchedSpans
 from recognizers_text.extractor import Extractor, ExtractResult
+from recognizers_text.extraction_context import ExtractionContext
+from recognizers_text.regex_set import RegexSet
 from recognizers_number.resources.base_numbers import BaseNumbers
 from recognizers_number.number.models import LongFormatType
 from recognizers_number.number.constants import Constants
@@ -16,6 +19,13 @@ ReVal = namedtuple('ReVal', ['re', 'val'])
 ReRe = namedtuple('ReRe', ['reKey', 'reVal'])
 MatchesVal = namedtuple('MatchesVal', ['matches', 'val'])
 
+_extraction_keys: Dict[tuple, int] = dict()
+_extraction_key_counter = count()
+
+
+def _get_extraction_key(signature: tuple) -> int:
+    return _extraction_keys.setdefault(signature, next(_extraction_key_counter))
+
 
 class BaseNumberExtractor(Extractor):
     @property
@@ -36,54 +46,82 @@ class BaseNumberExtractor(Extractor):
     def _negative_number_terms(self) -> Pattern:
         pass
 
+    @property
+    def extraction_key(self) -> int:
+        """
+        Extractors of the same class built from the same patterns produce the same results,
+        so they share a key and reuse each other's output inside an ExtractionContext.
+        """
+        key = self.__dict__.get('_extraction_key', None)
+        if key is None:
+            def pattern_signature(pattern):
+                if pattern is None or isinstance(pattern, str):
+                    return pattern
+                return pattern.pattern, pattern.flags
+
+            signature = (type(self), self._extract_type,
+                         tuple((pattern_signature(x.re), x.val) for x in self.regexes),
+                         tuple((pattern_signature(x.reKey), pattern_signature(x.reVal))
+                               for x in self.ambiguity_filters_dict or []),
+                         pattern_signature(self._negative_number_terms))
+            key = _get_extraction_key(signature)
+            self._extraction_key = key
+        return key
+
+    @property
+    def regex_set(self) -> RegexSet:
+        regex_set = self.__dict__.get('_regex_set', None)
+        if regex_set is None:
+            regex_set = self._regex_set = RegexSet(self.regexes)
+        return regex_set
+
     def extract(self, source: str) -> List[ExtractResult]:
+        context = ExtractionContext.current()
+        if context is not None:
+            return context.get_or_extract(self, self.extraction_key, source, self._extract)
+        return self._extract(source)
+
+    def _extract(self, source: str) -> List[ExtractResult]:
         if source is None or len(source.strip()) is 0:
             return list()
         result: List[ExtractResult] = list()
-        match_source = dict()
-        matched: List[bool] = [False] * len(source)
-
-        matches_list = list(map(
-            lambda x: MatchesVal(matches=list(regex.finditer(x.re, source)),
-                                 val=x.val), self.regexes))
-        matches_list = list(filter(lambda x: len(x.matches) > 0, matches_list))
-        for ml in matches_list:
-            for m in ml.matches:
-                for j in range(len(m.group())):
-                    matched[m.start() + j] = True
-                # Keep Source Data for extra information
-                match_source[m] = ml.val
-
-        last = -1
-        for i in range(len(source)):
-            if not matched[i]:
-                last = i
-            else:
-                if i + 1 == len(source) or not matched[i + 1]:
-                    start = last + 1
-                    length = i - last
+        spans = MatchedSpans(len(source))
+
+        for m, val in self.regex_set.finditer(source):
+            # Keep Source Data for extra information
+            spans.add(m, val)
+
+        # The leftmost negative term in the whole source is also the leftmost one in every
+        # prefix that fully contains it, so the prefix is only searched again before that.
+        negative_term = None
+        if self._negative_number_terms is not None:
+            negative_term = regex.search(self._negative_number_terms, source)
+
+        for span in spans:
+            if span.match is None:
+                continue
+
+            start = span.start
+            length = span.length
+            substr = source[start:start + length].strip()
+
+            # extract negative numbers
+            if negative_term is not None:
+                match = negative_term
+                if match.end() > start:
+                    match = regex.search(self._negative_number_terms, source[0:start])
+                if match is not None:
+                    start = match.start()
+                    length = length + match.end() - match.start()
                     substr = source[start:start + length].strip()
-                    src_match = next((x for x in iter(match_source) if (
-                        x.start() == start and (
-                            x.end() - x.start()) == length)), None)
-
-                    # extract negative numbers
-                    if self._negative_number_terms is not None:
-                        match = regex.search(self._negative_number_terms,
-                                             source[0:start])
-                        if match is not None:
-                            start = match.start()
-                            length = length + match.end() - match.start()
-                            substr = source[start:start + length].strip()
-
-                    if src_match is not None:
-                        value = ExtractResult()
-                        value.start = start
-                        value.length = length
-                        value.text = substr
-                        value.type = self._extract_type
-                        value.data = match_source.get(src_match, None)
-                        result.append(value)
+
+            value = ExtractResult()
+            value.start = start
+            value.length = length
+            value.text = substr
+            value.type = self._extract_type
+            value.data = span.data
+            result.append(value)
 
         result = self._filter_ambiguity(result, source)
         return result
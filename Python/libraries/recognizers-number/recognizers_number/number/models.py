@@ -10,6 +10,7 @@ from recognizers_text import Model, ModelResult
 from recognizers_text.extractor import Extractor, ExtractResult
 from recognizers_text.parser import Parser
 from recognizers_text.utilities import QueryProcessor
+from recognizers_text.extraction_context import in_extraction_context
 from recognizers_number.number.constants import Constants
 
 
@@ -48,6 +49,7 @@ class AbstractNumberModel(Model):
         self.parser: Parser = parser
         self.extractor: Extractor = extractor
 
+    @in_extraction_context
     def parse(self, query: str) -> List[ModelResult]:
 
         query = QueryProcessor.preprocess(query, True)
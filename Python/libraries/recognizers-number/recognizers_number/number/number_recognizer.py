@@ -3,7 +3,7 @@
 
 from enum import IntFlag
 from typing import List
-from recognizers_text import Culture, Recognizer, Model
+from recognizers_text import Culture, Recognizer, RecognizerRegistry, Model
 from recognizers_number.culture import CultureInfo
 from recognizers_number.number.models import NumberMode, NumberModel, OrdinalModel, PercentModel, ModelResult
 from recognizers_number.number.parser_factory import ParserType, AgnosticNumberParserFactory
@@ -209,19 +209,19 @@ class NumberRecognizer(Recognizer[NumberOptions]):
 
 
 def recognize_number(query: str, culture: str, options: NumberOptions = NumberOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = NumberRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(NumberRecognizer, culture, options)
     model = recognizer.get_number_model(culture, fallback_to_default_culture)
     return model.parse(query)
 
 
 def recognize_ordinal(query: str, culture: str, options: NumberOptions = NumberOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = NumberRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(NumberRecognizer, culture, options)
     model = recognizer.get_ordinal_model(culture, fallback_to_default_culture)
     return model.parse(query)
 
 
 def recognize_percentage(query: str, culture: str, options: NumberOptions = NumberOptions.NONE, fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = NumberRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(NumberRecognizer, culture, options)
     model = recognizer.get_percentage_model(
         culture, fallback_to_default_culture)
     return model.parse(query)
@@ -9,7 +9,8 @@ from recognizers_sequence.sequence.config.url_configuration import URLConfigurat
 from recognizers_text.matcher.string_matcher import StringMatcher
 
 from .constants import *
-from recognizers_text.utilities import RegExpUtility
+from recognizers_text.utilities import RegExpUtility, MatchedSpans
+from recognizers_text.regex_set import RegexSet
 from recognizers_text.extractor import Extractor, ExtractResult
 from recognizers_number.culture import CultureInfo
 from recognizers_sequence.resources import *
@@ -32,49 +33,34 @@ class SequenceExtractor(Extractor):
     def _extract_type(self) -> str:
         raise NotImplementedError
 
+    @property
+    def regex_set(self) -> RegexSet:
+        regex_set = self.__dict__.get('_regex_set', None)
+        if regex_set is None:
+            regex_set = self._regex_set = RegexSet(self.regexes)
+        return regex_set
+
     def extract(self, source: str) -> List[ExtractResult]:
         result: List[ExtractResult] = list()
         if not self._pre_check_str(source):
             return result
 
-        matched: List[bool] = [False] * len(source)
-
-        match_source: Dict[Match, str] = dict()
-
-        matches_list = list(
-            map(lambda x: MatchesVal(matches=list(re.finditer(x.re, source)), val=x.val), self.regexes))
-        matches_list = list(filter(lambda x: len(x.matches) > 0, matches_list))
-
-        for ml in matches_list:
-            for m in ml.matches:
-                if self._is_valid_match(m):
-                    for j in range(len(m.group())):
-                        matched[m.start() + j] = True
-                    # Keep Source Data for extra information
-                    match_source[m] = ml.val
-        last = -1
-
-        for i in range(len(source)):
-            if not matched[i]:
-                last = i
-            else:
-                if i + 1 == len(source) or not matched[i + 1]:
-                    start = last + 1
-                    length = i - last
-                    substring = source[start:start + length].strip()
-                    src_match = next(
-                        (x for x in iter(match_source) if (x.start() ==
-                                                           start and (x.end() - x.start()) == length)),
-                        None)
-
-                    if src_match is not None:
-                        value = ExtractResult()
-                        value.start = start
-                        value.length = length
-                        value.text = substring
-                        value.type = self._extract_type
-                        value.data = match_source.get(src_match, None)
-                        result.append(value)
+        spans = MatchedSpans(len(source))
+
+        for m, val in self.regex_set.finditer(source):
+            if self._is_valid_match(m):
+                # Keep Source Data for extra information
+                spans.add(m, val)
+
+        for span in spans:
+            if span.match is not None:
+                value = ExtractResult()
+                value.start = span.start
+                value.length = span.length
+                value.text = source[span.start:span.start + span.length].strip()
+                value.type = self._extract_type
+                value.data = span.data
+                result.append(value)
 
         return result
 
@@ -271,55 +257,37 @@ class BaseIpExtractor(SequenceExtractor):
         if not self._pre_check_str(source):
             return result
 
-        matched: List[bool] = [False] * len(source)
-
-        match_source: Dict[Match, str] = dict()
-        matches_list = list(
-            map(lambda x: MatchesVal(matches=list(re.finditer(x.re, source)), val=x.val), self.regexes))
-        matches_list = list(filter(lambda x: len(x.matches) > 0, matches_list))
-
-        for ml in matches_list:
-            for m in ml.matches:
-                for j in range(len(m.group())):
-                    matched[m.start() + j] = True
-                # Keep Source Data for extra information
-                match_source[m] = ml.val
-        last = -1
-
-        for i in range(len(source)):
-            if not matched[i]:
-                last = i
-            else:
-                if i + 1 == len(source) or not matched[i + 1]:
-                    start = last + 1
-                    length = i - last
-                    substring = source[start:start + length].strip()
-                    simple_tokenizer = SimpleTokenizer()
-                    if substring.startswith(Constants.IPV6_ELLIPSIS) and (
-                            start > 0 and (str.isdigit(source[start - 1]) or
-                                           (str.isalpha(source[start - 1]) and
-                                            not simple_tokenizer.is_cjk(c=list(source)[start - 1])))):
-                        continue
+        spans = MatchedSpans(len(source))
+
+        for m, val in self.regex_set.finditer(source):
+            # Keep Source Data for extra information
+            spans.add(m, val)
+
+        simple_tokenizer = SimpleTokenizer()
+        for span in spans:
+            start = span.start
+            end = span.start + span.length
+            substring = source[start:end].strip()
+            if substring.startswith(Constants.IPV6_ELLIPSIS) and (
+                    start > 0 and (str.isdigit(source[start - 1]) or
+                                   (str.isalpha(source[start - 1]) and
+                                    not simple_tokenizer.is_cjk(c=source[start - 1])))):
+                continue
 
-                    elif substring.endswith(Constants.IPV6_ELLIPSIS) and (
-                            i + 1 < len(source) and (str.isdigit(source[i + 1]) or
-                                                     (str.isalpha(source[i + 1]) and
-                                                      not simple_tokenizer.is_cjk(c=list(source)[start - 1])))):
-                        continue
+            elif substring.endswith(Constants.IPV6_ELLIPSIS) and (
+                    end < len(source) and (str.isdigit(source[end]) or
+                                           (str.isalpha(source[end]) and
+                                            not simple_tokenizer.is_cjk(c=source[start - 1])))):
+                continue
 
-                    src_match = next(
-                        (x for x in iter(match_source) if (x.start() ==
-                                                           start and (x.end() - x.start()) == length)),
-                        None)
-
-                    if src_match is not None:
-                        value = ExtractResult()
-                        value.start = start
-                        value.length = length
-                        value.text = substring
-                        value.type = self._extract_type
-                        value.data = match_source.get(src_match, None)
-                        result.append(value)
+            if span.match is not None:
+                value = ExtractResult()
+                value.start = start
+                value.length = span.length
+                value.text = substring
+                value.type = self._extract_type
+                value.data = span.data
+                result.append(value)
         return result
 
     def __init__(self, config):
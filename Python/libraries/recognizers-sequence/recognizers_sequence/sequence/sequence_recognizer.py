@@ -95,48 +95,48 @@ class SequenceRecognizer(Recognizer[SequenceOptions]):
 
 def recognize_phone_number(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
                            fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = SequenceRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(SequenceRecognizer, culture, options)
     model = recognizer.get_phone_number_model(culture, fallback_to_default_culture)
     return model.parse(query)
 
 
 def recognize_email(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
                     fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = SequenceRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(SequenceRecognizer, culture, options)
     model = recognizer.get_email_model(culture, fallback_to_default_culture)
     return model.parse(query)
 
 
 def recognize_ip_address(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
                          fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = SequenceRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(SequenceRecognizer, culture, options)
     model = recognizer.get_ip_address_model(culture, fallback_to_default_culture)
     return model.parse(query)
 
 
 def recognize_mention(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
                       fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = SequenceRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(SequenceRecognizer, culture, options)
     model = recognizer.get_mention_model(culture, fallback_to_default_culture)
     return model.parse(query)
 
 
 def recognize_hashtag(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
                       fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = SequenceRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(SequenceRecognizer, culture, options)
     model = recognizer.get_hashtag_model(culture, fallback_to_default_culture)
     return model.parse(query)
 
 
 def recognize_url(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
                   fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = SequenceRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(SequenceRecognizer, culture, options)
     model = recognizer.get_url_model(culture, fallback_to_default_culture)
     return model.parse(query)
 
 
 def recognize_guid(query: str, culture: str, options: SequenceOptions = SequenceOptions.NONE,
                    fallback_to_default_culture: bool = True) -> List[ModelResult]:
-    recognizer = SequenceRecognizer(culture, options)
+    recognizer = RecognizerRegistry.get_recognizer(SequenceRecognizer, culture, options)
     model = recognizer.get_guid_model(culture, fallback_to_default_culture)
     return model.parse(query)
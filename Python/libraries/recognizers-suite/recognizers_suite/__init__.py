@@ -3,8 +3,10 @@
 
 from recognizers_text.model import ModelResult
 from recognizers_text.culture import Culture
-from recognizers_number.number.number_recognizer import recognize_number, recognize_ordinal, recognize_percentage, NumberOptions
-from recognizers_number_with_unit.number_with_unit.number_with_unit_recognizer import recognize_age, recognize_currency, recognize_dimension, recognize_temperature, NumberWithUnitOptions
-from recognizers_date_time.date_time.date_time_recognizer import recognize_datetime, DateTimeOptions
-from recognizers_sequence.sequence.sequence_recognizer import recognize_phone_number, recognize_email, recognize_url, recognize_ip_address, SequenceOptions
+from recognizers_text.recognizer_registry import RecognizerRegistry
+from recognizers_number.number.number_recognizer import recognize_number, recognize_ordinal, recognize_percentage, NumberOptions, NumberRecognizer
+from recognizers_number_with_unit.number_with_unit.number_with_unit_recognizer import recognize_age, recognize_currency, recognize_dimension, recognize_temperature, NumberWithUnitOptions, NumberWithUnitRecognizer
+from recognizers_date_time.date_time.date_time_recognizer import recognize_datetime, DateTimeOptions, DateTimeRecognizer
+from recognizers_sequence.sequence.sequence_recognizer import recognize_phone_number, recognize_email, recognize_url, recognize_ip_address, SequenceOptions, SequenceRecognizer
 from recognizers_choice.choice.recognizers_choice import *
+from .pipeline import recognize_all, get_models, ModelNames, DEFAULT_MODELS
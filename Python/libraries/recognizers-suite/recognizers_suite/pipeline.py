@@ -0,0 +1,90 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from datetime import datetime
+from typing import List
+from collections import namedtuple
+
+from recognizers_text.model import Model, ModelResult
+from recognizers_text.extraction_context import ExtractionContext
+from recognizers_text.recognizer_registry import RecognizerRegistry
+from recognizers_number.number.number_recognizer import NumberRecognizer, NumberOptions
+from recognizers_number_with_unit.number_with_unit.number_with_unit_recognizer import NumberWithUnitRecognizer, NumberWithUnitOptions
+from recognizers_date_time.date_time.date_time_recognizer import DateTimeRecognizer, DateTimeOptions
+from recognizers_date_time.date_time.models import DateTimeModel
+from recognizers_sequence.sequence.sequence_recognizer import SequenceRecognizer, SequenceOptions
+from recognizers_choice.choice.recognizers_choice import ChoiceRecognizer, ChoiceOptions
+
+ModelEntry = namedtuple('ModelEntry', ['recognizer_type', 'options', 'get_model'])
+
+
+class ModelNames:
+    NUMBER: str = 'number'
+    ORDINAL: str = 'ordinal'
+    PERCENTAGE: str = 'percentage'
+    AGE: str = 'age'
+    CURRENCY: str = 'currency'
+    DIMENSION: str = 'dimension'
+    TEMPERATURE: str = 'temperature'
+    DATETIME: str = 'datetime'
+    PHONE_NUMBER: str = 'phone_number'
+    EMAIL: str = 'email'
+    URL: str = 'url'
+    IP_ADDRESS: str = 'ip_address'
+    MENTION: str = 'mention'
+    HASHTAG: str = 'hashtag'
+    GUID: str = 'guid'
+    BOOLEAN: str = 'boolean'
+
+
+MODELS = {
+    ModelNames.NUMBER: ModelEntry(NumberRecognizer, NumberOptions.NONE, NumberRecognizer.get_number_model),
+    ModelNames.ORDINAL: ModelEntry(NumberRecognizer, NumberOptions.NONE, NumberRecognizer.get_ordinal_model),
+    ModelNames.PERCENTAGE: ModelEntry(NumberRecognizer, NumberOptions.NONE, NumberRecognizer.get_percentage_model),
+    ModelNames.AGE: ModelEntry(NumberWithUnitRecognizer, NumberWithUnitOptions.NONE, NumberWithUnitRecognizer.get_age_model),
+    ModelNames.CURRENCY: ModelEntry(NumberWithUnitRecognizer, NumberWithUnitOptions.NONE, NumberWithUnitRecognizer.get_currency_model),
+    ModelNames.DIMENSION: ModelEntry(NumberWithUnitRecognizer, NumberWithUnitOptions.NONE, NumberWithUnitRecognizer.get_dimension_model),
+    ModelNames.TEMPERATURE: ModelEntry(NumberWithUnitRecognizer, NumberWithUnitOptions.NONE, NumberWithUnitRecognizer.get_temperature_model),
+    ModelNames.DATETIME: ModelEntry(DateTimeRecognizer, DateTimeOptions.NONE, DateTimeRecognizer.get_datetime_model),
+    ModelNames.PHONE_NUMBER: ModelEntry(SequenceRecognizer, SequenceOptions.NONE, SequenceRecognizer.get_phone_number_model),
+    ModelNames.EMAIL: ModelEntry(SequenceRecognizer, SequenceOptions.NONE, SequenceRecognizer.get_email_model),
+    ModelNames.URL: ModelEntry(SequenceRecognizer, SequenceOptions.NONE, SequenceRecognizer.get_url_model),
+    ModelNames.IP_ADDRESS: ModelEntry(SequenceRecognizer, SequenceOptions.NONE, SequenceRecognizer.get_ip_address_model),
+    ModelNames.MENTION: ModelEntry(SequenceRecognizer, SequenceOptions.NONE, SequenceRecognizer.get_mention_model),
+    ModelNames.HASHTAG: ModelEntry(SequenceRecognizer, SequenceOptions.NONE, SequenceRecognizer.get_hashtag_model),
+    ModelNames.GUID: ModelEntry(SequenceRecognizer, SequenceOptions.NONE, SequenceRecognizer.get_guid_model),
+    ModelNames.BOOLEAN: ModelEntry(ChoiceRecognizer, ChoiceOptions.NONE, ChoiceRecognizer.get_boolean_model),
+}
+
+DEFAULT_MODELS = [ModelNames.NUMBER, ModelNames.ORDINAL, ModelNames.PERCENTAGE, ModelNames.AGE,
+                  ModelNames.CURRENCY, ModelNames.DIMENSION, ModelNames.TEMPERATURE, ModelNames.DATETIME,
+                  ModelNames.PHONE_NUMBER, ModelNames.EMAIL, ModelNames.URL, ModelNames.IP_ADDRESS,
+                  ModelNames.BOOLEAN]
+
+
+def get_models(culture: str, models: List[str] = None, fallback_to_default_culture: bool = True) -> List[Model]:
+    result = []
+    for name in models or DEFAULT_MODELS:
+        entry = MODELS.get(name, None)
+        if entry is None:
+            raise ValueError(f'Unknown model: {name}')
+        recognizer = RecognizerRegistry.get_recognizer(entry.recognizer_type, culture, entry.options)
+        result.append(entry.get_model(recognizer, culture, fallback_to_default_culture))
+    return result
+
+
+def recognize_all(query: str, culture: str, models: List[str] = None, reference: datetime = None,
+                  fallback_to_default_culture: bool = True) -> List[ModelResult]:
+    """
+    Runs the given models (all DEFAULT_MODELS when None) over one query and returns their
+    results in model order. The models share a single ExtractionContext, so the query is
+    preprocessed once per mode and number extractions are reused across models.
+    """
+    results = []
+    with ExtractionContext():
+        for model in get_models(culture, models, fallback_to_default_culture):
+            if isinstance(model, DateTimeModel):
+                results.extend(model.parse(query, reference))
+            else:
+                results.extend(model.parse(query))
+    return results
@@ -3,7 +3,12 @@
 
 from .culture import *
 from .recognizer import *
+from .recognizer_registry import *
+from .model_cache import *
+from .regex_set import *
+from .literal_prefilter import *
 from .model import *
+from .extraction_context import *
 from .extractor import *
 from .parser import *
 from .utilities import *
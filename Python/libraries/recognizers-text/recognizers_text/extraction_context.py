@@ -0,0 +1,102 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from copy import copy
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Dict, Hashable, List, Optional
+
+from .extractor import ExtractResult
+
+
+class ExtractorStatistics:
+    def __init__(self):
+        self.calls: int = 0
+        self.extractions: int = 0
+
+    @property
+    def reused(self) -> int:
+        return self.calls - self.extractions
+
+    def __repr__(self) -> str:
+        return 'calls={}, extractions={}, reused={}'.format(self.calls, self.extractions, self.reused)
+
+
+class ExtractionContext:
+    """
+    Request-scoped memo shared by every model and extractor running inside a
+    `with ExtractionContext():` block. It keeps preprocessed queries and extractor
+    outputs so dependent extractors, and several models recognizing the same
+    utterance, compute them once. Entering an active context again is allowed.
+    """
+    __current: ContextVar = ContextVar('extraction_context', default=None)
+
+    def __init__(self):
+        self.__values: Dict[Hashable, object] = dict()
+        self.__tokens = []
+        self.__statistics: Dict[str, ExtractorStatistics] = dict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def current() -> Optional['ExtractionContext']:
+        return ExtractionContext.__current.get()
+
+    @staticmethod
+    def active_or_new() -> 'ExtractionContext':
+        return ExtractionContext.__current.get() or ExtractionContext()
+
+    def __enter__(self) -> 'ExtractionContext':
+        self.__tokens.append(ExtractionContext.__current.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        ExtractionContext.__current.reset(self.__tokens.pop())
+
+    @property
+    def avoided_extractions(self) -> int:
+        return sum(statistics.reused for statistics in self.__statistics.values())
+
+    def statistics(self) -> Dict[str, ExtractorStatistics]:
+        """
+        Per extractor class: how many times extract was called in this context, how many
+        of those calls actually ran the extractor, and how many were served from the memo.
+        """
+        return dict(self.__statistics)
+
+    def get_or_add(self, key: Hashable, factory: Callable[[], object]) -> object:
+        if key in self.__values:
+            self.hits += 1
+            return self.__values[key]
+        self.misses += 1
+        value = factory()
+        self.__values[key] = value
+        return value
+
+    def get_or_extract(self, extractor: object, extractor_key: Hashable, source: str,
+                       extract: Callable[[str], List[ExtractResult]]) -> List[ExtractResult]:
+        name = type(extractor).__name__
+        statistics = self.__statistics.get(name, None)
+        if statistics is None:
+            statistics = self.__statistics[name] = ExtractorStatistics()
+        statistics.calls += 1
+
+        def run():
+            statistics.extractions += 1
+            return extract(source)
+
+        # Callers are free to mutate the results they get back, so only copies leave the memo.
+        results = self.get_or_add(('extract', extractor_key, source), run)
+        return [copy(result) for result in results]
+
+
+def in_extraction_context(parse):
+    """
+    Decorator for Model.parse implementations: runs the call inside the active
+    ExtractionContext, or a new one, so the extractors it triggers share results.
+    """
+    @wraps(parse)
+    def wrapper(*args, **kwargs):
+        with ExtractionContext.active_or_new():
+            return parse(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,473 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern
+import regex
+
+# Stands for "any decimal digit" among the literals a pattern requires.
+DIGIT = '\\d'
+
+_MAX_EXACT = 64
+_MAX_LITERAL_LENGTH = 24
+_EMPTY = frozenset([''])
+
+_pattern_types = (type(regex.compile('')), type(__import__('re').compile('')))
+_quantifier = regex.compile(r'\{(\d*)(?:(,)(\d*))?\}')
+_zero_width_escapes = set('bBAZzGmM')
+_any_char_escapes = set('DwWsSpPXNRhHvVK')
+_space_escapes = set('sWhvR')
+_control_escapes = {'n': '\n', 't': '\t', 'r': '\r', 'f': '\f', 'v': '\v', 'a': '\a', 'e': '\x1b', '0': '\0'}
+
+# exact: every string the expression can match, when there are only a few, else None.
+# required: literals at least one of which is in the text whenever it matches, None when unknown.
+# alnum: whether a match can contain a letter or digit.
+# wordy: literals in the text whenever a match contains a letter or digit, None when unknown.
+# nonempty: whether every match is at least one character long.
+_Info = namedtuple('_Info', ['exact', 'required', 'alnum', 'wordy', 'nonempty'])
+
+_NOTHING = frozenset()
+_ANY = _Info(None, None, True, None, False)
+_ANY_CHAR = _Info(None, None, True, None, True)
+_EMPTY_INFO = _Info(_EMPTY, None, False, _NOTHING, False)
+_NEVER = _Info(_NOTHING, None, False, _NOTHING, True)
+
+
+def _has_alnum(value: str) -> bool:
+    return any(char.isalnum() for char in value)
+
+
+def _exact(values: FrozenSet[str], nonempty: bool) -> _Info:
+    wordy = frozenset(value for value in values if _has_alnum(value))
+    return _Info(values, None, bool(wordy), wordy, nonempty)
+
+
+def _literal(chars) -> _Info:
+    chars = frozenset(char.lower() for char in chars)
+    return _exact(chars, bool(chars))
+
+
+def _required_of(info: _Info) -> Optional[FrozenSet[str]]:
+    if info.exact is not None:
+        return None if '' in info.exact else info.exact
+    return info.required
+
+
+def _union(literals: Iterable[Optional[FrozenSet[str]]]) -> Optional[FrozenSet[str]]:
+    literals = list(literals)
+    if any(value is None for value in literals):
+        return None
+    return frozenset().union(*literals)
+
+
+def _selectivity(literals: Optional[FrozenSet[str]]) -> tuple:
+    if literals is None:
+        return -1, 0
+    if not literals:
+        return _MAX_LITERAL_LENGTH + 1, 0
+    shortest = min(3 if literal == DIGIT else len(literal) for literal in literals)
+    return shortest, -len(literals)
+
+
+def _best(first: Optional[FrozenSet[str]], second: Optional[FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+    return first if _selectivity(first) >= _selectivity(second) else second
+
+
+def _concat(first: _Info, second: _Info) -> _Info:
+    nonempty = first.nonempty or second.nonempty
+    if first.exact is not None and second.exact is not None and \
+            len(first.exact) * len(second.exact) <= _MAX_EXACT:
+        exact = frozenset(a + b for a in first.exact for b in second.exact)
+        if not exact or max(len(value) for value in exact) <= _MAX_LITERAL_LENGTH:
+            return _exact(exact, nonempty)
+    required = _best(_required_of(first), _required_of(second))
+    wordy = _best(required, _union([first.wordy, second.wordy]))
+    return _Info(None, required, first.alnum or second.alnum, wordy, nonempty)
+
+
+def _alternate(branches: List[_Info]) -> _Info:
+    nonempty = all(branch.nonempty for branch in branches)
+    if all(branch.exact is not None for branch in branches):
+        exact = frozenset().union(*(branch.exact for branch in branches))
+        if len(exact) <= _MAX_EXACT:
+            return _exact(exact, nonempty)
+    required = _union(_required_of(branch) for branch in branches)
+    wordy = _union(branch.wordy for branch in branches)
+    return _Info(None, required, any(branch.alnum for branch in branches), wordy, nonempty)
+
+
+def _repeat(info: _Info, minimum: int, maximum: Optional[int]) -> _Info:
+    if maximum == 0:
+        return _EMPTY_INFO
+    if minimum == 0:
+        if maximum == 1 and info.exact is not None:
+            return _exact(info.exact | _EMPTY, False)
+        return _Info(None, None, info.alnum, info.wordy, False)
+    if minimum == 1 and maximum == 1:
+        return info
+    # A repeated match holding a letter or digit has an iteration holding one.
+    return _Info(None, _required_of(info), info.alnum, info.wordy, info.nonempty)
+
+
+def _class(required: Optional[FrozenSet[str]], alnum: bool) -> _Info:
+    # A single character out of a set too large to list.
+    return _Info(None, required, alnum, required if alnum else _NOTHING, True)
+
+
+class _Analyzer:
+    """
+    Walks the source of a regex pattern and computes which literals every match contains.
+    Any construct it does not understand makes the analysis give up rather than guess.
+    """
+
+    def __init__(self, pattern: str, multiline: bool = False):
+        self.pattern = pattern
+        self.position = 0
+        self.multiline = multiline
+
+    def parse(self) -> _Info:
+        info = self.__alternation()
+        if self.position != len(self.pattern):
+            raise ValueError('Unbalanced pattern')
+        return info
+
+    def __peek(self, offset: int = 0) -> str:
+        index = self.position + offset
+        return self.pattern[index] if index < len(self.pattern) else ''
+
+    def __alternation(self) -> _Info:
+        branches = [self.__sequence()]
+        while self.__peek() == '|':
+            self.position += 1
+            branches.append(self.__sequence())
+        return branches[0] if len(branches) == 1 else _alternate(branches)
+
+    def __sequence(self) -> _Info:
+        info = _EMPTY_INFO
+        # Runs of atoms with known matches are joined before the rest so 'noon' stays one literal.
+        run = _EMPTY_INFO
+        while self.__peek() not in ('', '|', ')'):
+            if self.__peek() == '^' and (info.nonempty or run.nonempty) and not self.multiline:
+                # Placeholders such as '.^' never match.
+                info, run = _NEVER, _EMPTY_INFO
+            atom = self.__quantified(self.__atom())
+            if atom.exact is not None:
+                joined = _concat(run, atom)
+                if joined.exact is not None:
+                    run = joined
+                    continue
+            info = _concat(_concat(info, run), atom)
+            run = _EMPTY_INFO
+        return _concat(info, run)
+
+    def __quantified(self, info: _Info) -> _Info:
+        while True:
+            char = self.__peek()
+            if char == '*':
+                self.position += 1
+                info = _repeat(info, 0, None)
+            elif char == '+':
+                self.position += 1
+                info = _repeat(info, 1, None)
+            elif char == '?':
+                self.position += 1
+                info = _repeat(info, 0, 1)
+            elif char == '{':
+                match = _quantifier.match(self.pattern, self.position)
+                if match is None or not (match.group(1) or match.group(3)):
+                    if regex.match(r'\{\s*[eids]', self.pattern[self.position:]):
+                        raise ValueError('Fuzzy matching')
+                    return info
+                self.position = match.end()
+                minimum = int(match.group(1) or 0)
+                if match.group(2):
+                    maximum = int(match.group(3)) if match.group(3) else None
+                else:
+                    maximum = minimum
+                info = _repeat(info, minimum, maximum)
+            else:
+                return info
+            # Lazy and possessive markers do not change what can be matched.
+            if self.__peek() in ('?', '+'):
+                self.position += 1
+
+    def __atom(self) -> _Info:
+        char = self.__peek()
+        self.position += 1
+        if char == '(':
+            return self.__group()
+        if char == '[':
+            return self.__character_class()
+        if char == '\\':
+            return self.__escape()
+        if char in ('^', '$'):
+            return _EMPTY_INFO
+        if char == '.':
+            return _ANY_CHAR
+        return _literal(char)
+
+    def __group(self) -> _Info:
+        if self.__peek() != '?':
+            return self.__close(self.__alternation())
+
+        rest = self.pattern[self.position:]
+        if rest.startswith(('?=', '?<=')):
+            # What a positive lookaround requires is not part of the match, but must be in the text.
+            self.position += 3 if rest.startswith('?<') else 2
+            required = _required_of(self.__close(self.__alternation()))
+            return _EMPTY_INFO if required is None else _Info(None, required, False, _NOTHING, False)
+        if rest.startswith(('?!', '?<!')):
+            self.position += 3 if rest.startswith('?<') else 2
+            self.__close(self.__alternation())
+            return _EMPTY_INFO
+        if rest.startswith(('?:', '?>', '?|')):
+            self.position += 2
+            return self.__close(self.__alternation())
+        if rest.startswith('?#'):
+            self.position = self.pattern.index(')', self.position) + 1
+            return _EMPTY_INFO
+        named = regex.match(r'\?P?<\w+>', rest)
+        if named:
+            self.position += named.end()
+            return self.__close(self.__alternation())
+        flags = regex.match(r'\?[a-zA-Z]*(-[a-zA-Z]+)?([:)])', rest)
+        if flags:
+            enabled = flags.group(0).split('-')[0]
+            if 'x' in enabled:
+                raise ValueError('Verbose patterns are not analyzed')
+            self.multiline = self.multiline or 'm' in enabled
+            self.position += flags.end()
+            if flags.group(2) == ')':
+                return _EMPTY_INFO
+            return self.__close(self.__alternation())
+        raise ValueError('Unsupported group')
+
+    def __close(self, info: _Info) -> _Info:
+        if self.__peek() != ')':
+            raise ValueError('Unbalanced group')
+        self.position += 1
+        return info
+
+    def __escape(self) -> _Info:
+        char = self.__peek()
+        self.position += 1
+        if char == '':
+            raise ValueError('Trailing escape')
+        if char == 'd':
+            return _Info(None, frozenset([DIGIT]), True, frozenset([DIGIT]), True)
+        if char in _zero_width_escapes:
+            return _EMPTY_INFO
+        if char in ('p', 'P') and self.__peek() == '{':
+            self.position = self.pattern.index('}', self.position) + 1
+            return _ANY_CHAR
+        if char in ('g', 'k', 'L') and self.__peek() == '<':
+            self.position = self.pattern.index('>', self.position) + 1
+            return _ANY
+        if char.isdigit() and char != '0':
+            return _ANY
+        if char in _any_char_escapes:
+            return _class(None, char not in _space_escapes)
+        return _literal(self.__code_point(char))
+
+    def __code_point(self, char: str) -> str:
+        widths = {'x': 2, 'u': 4, 'U': 8}
+        if char in widths:
+            if char == 'x' and self.__peek() == '{':
+                end = self.pattern.index('}', self.position)
+                value = self.pattern[self.position + 1:end]
+                self.position = end + 1
+                return chr(int(value, 16))
+            value = self.pattern[self.position:self.position + widths[char]]
+            self.position += widths[char]
+            return chr(int(value, 16))
+        if char == 'N':
+            raise ValueError('Named characters are not analyzed')
+        return _control_escapes.get(char, char)
+
+    def __character_class(self) -> _Info:
+        negated = self.__peek() == '^'
+        if negated:
+            self.position += 1
+        chars = set()
+        only_digits = True
+        alnum = False
+        first = True
+        while True:
+            char = self.__peek()
+            if char == '':
+                raise ValueError('Unbalanced character class')
+            if char == ']' and not first:
+                self.position += 1
+                break
+            first = False
+            if char == '[' and self.__peek(1) == ':':
+                raise ValueError('POSIX classes are not analyzed')
+            self.position += 1
+            if char == '\\':
+                escaped = self.__peek()
+                self.position += 1
+                if escaped == 'd':
+                    chars = None if chars is None else chars | set('0123456789')
+                    alnum = True
+                    continue
+                if escaped in ('p', 'P') and self.__peek() == '{':
+                    self.position = self.pattern.index('}', self.position) + 1
+                    chars, only_digits, alnum = None, False, True
+                    continue
+                if escaped in _any_char_escapes:
+                    chars, only_digits = None, False
+                    alnum = alnum or escaped not in _space_escapes
+                    continue
+                char = self.__code_point(escaped)
+            if self.__peek() == '-' and self.__peek(1) not in (']', ''):
+                self.position += 1
+                end = self.__peek()
+                self.position += 1
+                if end == '\\':
+                    escaped = self.__peek()
+                    self.position += 1
+                    end = self.__code_point(escaped)
+                if not ('0' <= char <= '9' and '0' <= end <= '9'):
+                    only_digits = False
+                alnum = alnum or any(chr(code).isalnum() for code in range(ord(char), ord(end) + 1))
+                if chars is not None and ord(end) - ord(char) < _MAX_EXACT:
+                    chars |= set(chr(code) for code in range(ord(char), ord(end) + 1))
+                else:
+                    chars = None
+                continue
+            if not char.isdigit():
+                only_digits = False
+            alnum = alnum or char.isalnum()
+            if chars is not None:
+                chars.add(char)
+
+        if negated:
+            return _ANY_CHAR
+        if only_digits and chars:
+            return _class(frozenset([DIGIT]), True)
+        if chars is None or len(chars) > _MAX_EXACT:
+            return _class(None, alnum)
+        return _literal(chars)
+
+
+def _analyze(pattern) -> Optional[_Info]:
+    if isinstance(pattern, str):
+        return _analyze_source(pattern, 0)
+    if not isinstance(pattern.pattern, str):
+        return None
+    return _analyze_source(pattern.pattern, pattern.flags)
+
+
+@lru_cache(maxsize=4096)
+def _analyze_source(source: str, flags: int) -> Optional[_Info]:
+    # Extractors of a culture share most of their patterns, each is only analyzed once.
+    if flags & regex.VERBOSE:
+        return None
+    try:
+        return _Analyzer(source, bool(flags & regex.MULTILINE)).parse()
+    except (ValueError, IndexError):
+        return None
+
+
+def required_literals(pattern) -> Optional[FrozenSet[str]]:
+    """
+    Lower cased literals at least one of which is in the text whenever the pattern matches
+    a letter or digit, DIGIT standing for any digit. Empty when it only ever matches spaces
+    and punctuation, None when it can match words without any of them.
+    """
+    info = _analyze(pattern)
+    return None if info is None else _best(_required_of(info), info.wordy)
+
+
+def reachable_patterns(root: object) -> List[Pattern]:
+    """
+    Every compiled pattern held by an object, its attributes and collections, recursively.
+    """
+    seen = set()
+    pending = [root]
+    patterns = list()
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or obj is None or isinstance(obj, (type, str, bytes, int, float, bool)):
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, _pattern_types):
+            patterns.append(obj)
+            continue
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        if hasattr(obj, '__dict__'):
+            pending.extend(vars(obj).values())
+    return patterns
+
+
+PrefilterStatistics = namedtuple('PrefilterStatistics', ['calls', 'skipped', 'skip_rate'])
+
+
+class LiteralPrefilter:
+    """
+    Fast reject for a group of patterns: may_match is False only when none of the
+    literals required by their matches occurs in the text. A prefilter built from
+    a pattern it cannot analyze always answers True.
+    """
+
+    def __init__(self, patterns: Iterable):
+        literals = set()
+        self.__digits = False
+        self.__always = False
+        for pattern in patterns:
+            required = required_literals(pattern)
+            if required is None:
+                self.__always = True
+                break
+            literals |= required
+        self.__digits = DIGIT in literals
+        literals.discard(DIGIT)
+        # Text holding 'often' holds 'of' too, the longer literal adds nothing.
+        literals = set(literal for literal in literals
+                       if not any(other != literal and other in literal for other in literals))
+        self.__literals: FrozenSet[str] = frozenset(literals)
+        self.__scanner = None
+        if literals and not self.__always:
+            self.__scanner = regex.compile(r'\L<literals>', literals=sorted(literals))
+        self.__calls = 0
+        self.__skipped = 0
+
+    @staticmethod
+    def of(root: object) -> 'LiteralPrefilter':
+        return LiteralPrefilter(reachable_patterns(root))
+
+    @property
+    def always(self) -> bool:
+        return self.__always
+
+    @property
+    def literals(self) -> FrozenSet[str]:
+        return self.__literals
+
+    def may_match(self, text: str) -> bool:
+        self.__calls += 1
+        if self.test(text):
+            return True
+        self.__skipped += 1
+        return False
+
+    def test(self, text: str) -> bool:
+        # Same answer as may_match, without counting the call.
+        if self.__always or not text:
+            return True
+        if self.__digits and any(char.isdigit() for char in text):
+            return True
+        return self.__scanner is not None and self.__scanner.search(text.lower()) is not None
+
+    def statistics(self) -> PrefilterStatistics:
+        calls, skipped = self.__calls, self.__skipped
+        return PrefilterStatistics(calls, skipped, skipped / calls if calls else 0.0)
+
+    def reset_statistics(self):
+        self.__calls = 0
+        self.__skipped = 0
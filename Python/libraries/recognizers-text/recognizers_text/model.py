@@ -2,11 +2,15 @@
 #  Licensed under the MIT License.
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from datetime import datetime
 from enum import Flag
-from typing import List, Dict, Generic, TypeVar, Callable, Optional, Union, Any
+from time import perf_counter
+from typing import List, Dict, Generic, TypeVar, Callable, Optional, Union, Any, Iterable
 from collections import namedtuple
 
 from .culture import Culture
+from .model_cache import ModelCache, CachePolicy, CacheStatistics
 
 T_MODEL_OPTIONS = TypeVar('T_MODEL_OPTIONS', bound=Flag)
 
@@ -61,14 +65,56 @@ class Model(ABC):
     def parse(self, query: str) -> List[ModelResult]:
         raise NotImplementedError
 
+    def parse_batch(self, queries: Iterable[str], reference: datetime = None, max_workers: int = None,
+                    use_processes: bool = False, chunk_size: int = 64) -> List[List[ModelResult]]:
+        """
+        Parses every query and returns one result list per query, in input order.
+        With max_workers > 1 the queries are split into chunks of chunk_size and spread
+        over a thread pool, or over a process pool when use_processes is set. Each worker
+        process receives a copy of the model once, when it starts.
+        """
+        queries = list(queries)
+        if not max_workers or max_workers <= 1 or len(queries) <= chunk_size:
+            return _parse_chunk(self, queries, reference)
+
+        chunks = [queries[i:i + chunk_size] for i in range(0, len(queries), chunk_size)]
+        if use_processes:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_initialize_worker,
+                                     initargs=(self,)) as executor:
+                chunk_results = executor.map(_parse_worker_chunk, chunks, [reference] * len(chunks))
+                return [results for chunk in chunk_results for results in chunk]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunk_results = executor.map(lambda chunk: _parse_chunk(self, chunk, reference), chunks)
+            return [results for chunk in chunk_results for results in chunk]
+
+
+def _parse_chunk(model: Model, queries: List[str], reference: datetime) -> List[List[ModelResult]]:
+    if reference is None:
+        return [model.parse(query) for query in queries]
+    return [model.parse(query, reference) for query in queries]
+
+
+_worker_model: Optional[Model] = None
+
+
+def _initialize_worker(model: Model):
+    global _worker_model
+    _worker_model = model
+
+
+def _parse_worker_chunk(queries: List[str], reference: datetime) -> List[List[ModelResult]]:
+    return _parse_chunk(_worker_model, queries, reference)
+
 
 CacheKey = namedtuple('CacheKey', ['model_type', 'culture', 'options'])
 ModelCtorKey = namedtuple('ModelCtorKey', ['model_type', 'culture'])
+ModelBuildReport = namedtuple('ModelBuildReport', ['model_type', 'culture', 'seconds', 'cached'])
 
 
 class ModelFactory(Generic[T_MODEL_OPTIONS]):
     __fallback_to_default_culture = Culture.English
-    __cache: Dict[CacheKey, Model] = dict()
+    __cache: ModelCache = ModelCache()
 
     def __init__(self):
         self.model_factories: Dict[ModelCtorKey,
@@ -91,30 +137,70 @@ class ModelFactory(Generic[T_MODEL_OPTIONS]):
         self.model_factories[key] = model_ctor
 
     def try_get_model(self, model_type_name: str, culture: str, options: T_MODEL_OPTIONS) -> Optional[Model]:
-        cache_result = self.get_model_from_cache(
-            model_type_name, culture, options)
-        if cache_result is not None:
-            return cache_result
         key = ModelCtorKey(model_type=model_type_name, culture=culture)
         model_ctor = self.model_factories.get(key, None)
-        if model_ctor is not None:
-            model = model_ctor(options)
-            self.register_model_in_cache(
-                model_type_name, culture, options, model)
-            return model
-        return None
+        if model_ctor is None:
+            return self.get_model_from_cache(model_type_name, culture, options)
+        cache_key = CacheKey(model_type=model_type_name,
+                             culture=culture, options=options)
+        # Concurrent callers asking for the same missing model wait for a single build
+        return ModelFactory.__cache.get_or_add(cache_key, lambda: model_ctor(options))
 
     def get_model_from_cache(self, model_type_name: str, culture: str, options: T_MODEL_OPTIONS) -> Model:
         key = CacheKey(model_type=model_type_name,
                        culture=culture, options=options)
-        return ModelFactory.__cache.get(key, None)
+        return ModelFactory.__cache.get(key)
 
     def register_model_in_cache(self, model_type_name: str, culture: str, options: T_MODEL_OPTIONS, model: Model):
         key = CacheKey(model_type=model_type_name,
                        culture=culture, options=options)
-        ModelFactory.__cache[key] = model
+        ModelFactory.__cache.put(key, model)
+
+    @staticmethod
+    def set_cache_policy(policy: CachePolicy):
+        ModelFactory.__cache.policy = policy
+
+    @staticmethod
+    def get_cache_policy() -> CachePolicy:
+        return ModelFactory.__cache.policy
+
+    @staticmethod
+    def get_cache_statistics() -> CacheStatistics:
+        return ModelFactory.__cache.statistics()
+
+    @staticmethod
+    def clear_cache():
+        ModelFactory.__cache.clear()
+        ModelFactory.__cache.reset_statistics()
 
     def initialize_models(self, target_culture: str, options: T_MODEL_OPTIONS):
         for key in self.model_factories:
-            if target_culture is None or target_culture is key.culture:
+            if target_culture is None or target_culture == key.culture:
                 self.try_get_model(key.model_type, key.culture, options)
+
+    def warm_up(self, options: T_MODEL_OPTIONS, cultures: List[str] = None, model_types: List[str] = None,
+                max_workers: int = None) -> List[ModelBuildReport]:
+        """
+        Builds every registered model matching the given cultures and model types (None matches all)
+        on a thread pool and reports how long each build took. Models already in the cache are
+        reported with cached=True.
+        """
+        keys = [key for key in self.model_factories
+                if (cultures is None or key.culture in cultures) and
+                (model_types is None or key.model_type in model_types)]
+
+        if max_workers == 1 or len(keys) < 2:
+            return [self.__build_model(key, options) for key in keys]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda key: self.__build_model(key, options), keys))
+
+    def __build_model(self, key: ModelCtorKey, options: T_MODEL_OPTIONS) -> ModelBuildReport:
+        cache_key = CacheKey(model_type=key.model_type, culture=key.culture, options=options)
+        if cache_key in ModelFactory.__cache:
+            return ModelBuildReport(model_type=key.model_type, culture=key.culture, seconds=0.0, cached=True)
+
+        start = perf_counter()
+        self.try_get_model(key.model_type, key.culture, options)
+        return ModelBuildReport(model_type=key.model_type, culture=key.culture,
+                                seconds=perf_counter() - start, cached=False)
@@ -0,0 +1,236 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import sys
+from enum import Enum
+from threading import Lock, Event
+from collections import OrderedDict, namedtuple
+from typing import Callable, Dict, Hashable, Optional
+
+
+class EvictionStrategy(Enum):
+    LRU = 0
+    LFU = 1
+
+
+CacheStatistics = namedtuple('CacheStatistics', ['hits', 'misses', 'evictions', 'entries', 'bytes'])
+
+
+def estimate_size(root: object) -> int:
+    """
+    Approximate deep size in bytes of an object graph (models hold extractors, parsers,
+    configurations and compiled patterns). Shared objects are only counted once.
+    """
+    seen = set()
+    pending = [root]
+    size = 0
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj, 0)
+        if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        if hasattr(obj, '__dict__'):
+            pending.append(vars(obj))
+        for slot in getattr(type(obj), '__slots__', ()):
+            if hasattr(obj, slot):
+                pending.append(getattr(obj, slot))
+    return size
+
+
+class CachePolicy:
+    def __init__(self, max_entries: Optional[int] = None,
+                 eviction_strategy: EvictionStrategy = EvictionStrategy.LRU,
+                 max_bytes: Optional[int] = None,
+                 size_estimator: Callable[[object], int] = estimate_size):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError('max_entries must be a positive number')
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError('max_bytes must be a positive number')
+        self.max_entries: Optional[int] = max_entries
+        self.eviction_strategy: EvictionStrategy = eviction_strategy
+        self.max_bytes: Optional[int] = max_bytes
+        self.size_estimator: Callable[[object], int] = size_estimator
+
+
+class _CacheEntry:
+    __slots__ = ('value', 'size', 'frequency')
+
+    def __init__(self, value: object, size: int):
+        self.value = value
+        self.size = size
+        self.frequency = 1
+
+
+class _PendingBuild:
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = Event()
+        self.value = None
+        self.error = None
+
+
+class ModelCache:
+    """
+    Thread-safe cache of built models. Concurrent requests for a missing key are
+    coalesced so the same model is never constructed twice at the same time.
+    An unbounded policy (the default) keeps the previous grow-only behavior.
+    """
+
+    def __init__(self, policy: CachePolicy = None):
+        self.__policy: CachePolicy = policy or CachePolicy()
+        self.__entries: Dict[Hashable, _CacheEntry] = OrderedDict()
+        self.__pending: Dict[Hashable, _PendingBuild] = dict()
+        self.__lock = Lock()
+        self.__bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @property
+    def policy(self) -> CachePolicy:
+        return self.__policy
+
+    @policy.setter
+    def policy(self, policy: CachePolicy):
+        with self.__lock:
+            self.__policy = policy or CachePolicy()
+            if self.__policy.max_bytes is not None:
+                for entry in self.__entries.values():
+                    if entry.size == 0:
+                        entry.size = self.__policy.size_estimator(entry.value)
+                self.__bytes = sum(entry.size for entry in self.__entries.values())
+            self.__shrink()
+
+    def get(self, key: Hashable) -> Optional[object]:
+        with self.__lock:
+            entry = self.__entries.get(key, None)
+            if entry is None:
+                self.__misses += 1
+                return None
+            self.__hits += 1
+            self.__touch(key, entry)
+            return entry.value
+
+    def put(self, key: Hashable, value: object) -> None:
+        size = self.__measure(value)
+        with self.__lock:
+            self.__store(key, value, size)
+
+    def get_or_add(self, key: Hashable, factory: Callable[[], object]) -> object:
+        while True:
+            with self.__lock:
+                entry = self.__entries.get(key, None)
+                if entry is not None:
+                    self.__hits += 1
+                    self.__touch(key, entry)
+                    return entry.value
+                pending = self.__pending.get(key, None)
+                owner = pending is None
+                if owner:
+                    self.__misses += 1
+                    pending = _PendingBuild()
+                    self.__pending[key] = pending
+
+            if not owner:
+                pending.done.wait()
+                if pending.error is None:
+                    return pending.value
+                # The build failed for the owner, let this caller try again.
+                continue
+
+            try:
+                value = factory()
+                size = self.__measure(value)
+            except BaseException as error:
+                with self.__lock:
+                    del self.__pending[key]
+                pending.error = error
+                pending.done.set()
+                raise
+
+            with self.__lock:
+                self.__store(key, value, size)
+                del self.__pending[key]
+            pending.value = value
+            pending.done.set()
+            return value
+
+    def remove(self, key: Hashable) -> bool:
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+            if entry is None:
+                return False
+            self.__bytes -= entry.size
+            return True
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+
+    def statistics(self) -> CacheStatistics:
+        with self.__lock:
+            return CacheStatistics(hits=self.__hits, misses=self.__misses, evictions=self.__evictions,
+                                   entries=len(self.__entries), bytes=self.__bytes)
+
+    def reset_statistics(self) -> None:
+        with self.__lock:
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__entries
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def keys(self):
+        with self.__lock:
+            return list(self.__entries.keys())
+
+    def __measure(self, value: object) -> int:
+        if self.__policy.max_bytes is None:
+            return 0
+        return self.__policy.size_estimator(value)
+
+    def __touch(self, key: Hashable, entry: _CacheEntry) -> None:
+        entry.frequency += 1
+        self.__entries.move_to_end(key)
+
+    def __store(self, key: Hashable, value: object, size: int) -> None:
+        previous = self.__entries.pop(key, None)
+        if previous is not None:
+            self.__bytes -= previous.size
+        self.__entries[key] = _CacheEntry(value, size)
+        self.__bytes += size
+        self.__shrink(key)
+
+    def __shrink(self, keep: Hashable = None) -> None:
+        policy = self.__policy
+        while self.__entries:
+            over_entries = policy.max_entries is not None and len(self.__entries) > policy.max_entries
+            over_bytes = policy.max_bytes is not None and self.__bytes > policy.max_bytes
+            if not (over_entries or over_bytes):
+                break
+            victim = self.__select_victim(keep)
+            if victim is None:
+                break
+            self.__bytes -= self.__entries.pop(victim).size
+            self.__evictions += 1
+
+    def __select_victim(self, keep: Hashable) -> Optional[Hashable]:
+        # Entries are kept in recency order, oldest first, which also breaks LFU ties.
+        candidates = (key for key in self.__entries if key != keep)
+        if self.__policy.eviction_strategy == EvictionStrategy.LFU:
+            return min(candidates, key=lambda k: self.__entries[k].frequency, default=None)
+        return next(candidates, None)
@@ -2,18 +2,23 @@
 #  Licensed under the MIT License.
 
 from abc import ABC, abstractmethod
-from typing import Generic, Callable
-from .model import T_MODEL_OPTIONS, ModelFactory, Model
+from typing import Generic, Callable, List
+from .model import T_MODEL_OPTIONS, ModelFactory, Model, ModelBuildReport
 
 
 class Recognizer(Generic[T_MODEL_OPTIONS], ABC):
     def __init__(self, target_culture: str, options: T_MODEL_OPTIONS, lazy_initialization: bool):
+        """
+        With lazy_initialization each model is built on its first get_model call.
+        Otherwise (eager) every model registered for target_culture, or for all cultures
+        when target_culture is None, is built before the constructor returns.
+        """
         self.target_culture: str = target_culture
         self.options: T_MODEL_OPTIONS = options
         self.model_factory: ModelFactory = ModelFactory()
         self.initialize_configuration()
 
-        if lazy_initialization:
+        if not lazy_initialization:
             self.initialize_models()
 
     @abstractmethod
@@ -30,3 +35,9 @@ class Recognizer(Generic[T_MODEL_OPTIONS], ABC):
 
     def initialize_models(self):
         self.model_factory.initialize_models(self.target_culture, self.options)
+
+    def warm_up(self, cultures: List[str] = None, model_types: List[str] = None,
+                max_workers: int = None) -> List[ModelBuildReport]:
+        if cultures is None and self.target_culture is not None:
+            cultures = [self.target_culture]
+        return self.model_factory.warm_up(self.options, cultures, model_types, max_workers)
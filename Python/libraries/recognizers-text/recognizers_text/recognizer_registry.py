@@ -0,0 +1,80 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from threading import RLock
+from typing import Dict, List, Type, Optional
+from collections import namedtuple
+
+from .recognizer import Recognizer
+from .model import ModelBuildReport
+
+RegistryKey = namedtuple('RegistryKey', ['recognizer_type', 'culture', 'options'])
+
+
+class RecognizerRegistry:
+    """
+    Process-wide store of recognizer instances keyed by (recognizer type, culture, options).
+    Lookups of an already registered recognizer are a plain dictionary read, so the
+    recognize_* helpers do not re-run initialize_configuration on every call.
+    """
+    __recognizers: Dict[RegistryKey, Recognizer] = dict()
+    __lock = RLock()
+
+    @staticmethod
+    def get_recognizer(recognizer_type: Type[Recognizer], culture: str = None, options=None) -> Recognizer:
+        key = RegistryKey(recognizer_type=recognizer_type, culture=culture, options=options)
+        recognizer = RecognizerRegistry.__recognizers.get(key, None)
+        if recognizer is not None:
+            return recognizer
+
+        with RecognizerRegistry.__lock:
+            recognizer = RecognizerRegistry.__recognizers.get(key, None)
+            if recognizer is None:
+                if options is None:
+                    recognizer = recognizer_type(culture)
+                else:
+                    recognizer = recognizer_type(culture, options)
+                RecognizerRegistry.__recognizers[key] = recognizer
+            return recognizer
+
+    @staticmethod
+    def warm_up(recognizer_type: Type[Recognizer], cultures: List[str], options=None,
+                model_types: List[str] = None, max_workers: int = None) -> List[ModelBuildReport]:
+        """
+        Registers a recognizer per culture and builds its models, so the first real
+        request does not pay for regex compilation.
+        """
+        reports = []
+        for culture in cultures:
+            recognizer = RecognizerRegistry.get_recognizer(recognizer_type, culture, options)
+            reports.extend(recognizer.warm_up([culture], model_types, max_workers))
+        return reports
+
+    @staticmethod
+    def evict(recognizer_type: Optional[Type[Recognizer]] = None, culture: str = None, options=None) -> int:
+        """
+        Removes every registered recognizer matching the given filters (None matches anything)
+        and returns how many were removed. Models already built stay in the ModelFactory cache.
+        """
+        with RecognizerRegistry.__lock:
+            keys = [key for key in RecognizerRegistry.__recognizers
+                    if (recognizer_type is None or key.recognizer_type is recognizer_type) and
+                    (culture is None or key.culture == culture) and
+                    (options is None or key.options == options)]
+            for key in keys:
+                del RecognizerRegistry.__recognizers[key]
+            return len(keys)
+
+    @staticmethod
+    def clear() -> None:
+        with RecognizerRegistry.__lock:
+            RecognizerRegistry.__recognizers.clear()
+
+    @staticmethod
+    def contains(recognizer_type: Type[Recognizer], culture: str = None, options=None) -> bool:
+        key = RegistryKey(recognizer_type=recognizer_type, culture=culture, options=options)
+        return key in RecognizerRegistry.__recognizers
+
+    @staticmethod
+    def count() -> int:
+        return len(RecognizerRegistry.__recognizers)
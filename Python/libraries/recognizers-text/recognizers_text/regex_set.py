@@ -0,0 +1,120 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from enum import Enum
+from typing import Dict, Iterable, List, Match, Pattern, Tuple, Union
+import regex
+
+# Patterns using numbered back references or global inline flags cannot be moved into a larger expression.
+_not_combinable = regex.compile(r'(?<!\\)(\\\\)*\\([1-9]|g<\d)|^\(\?[a-zA-Z]+\)')
+_pattern_type = type(regex.compile(''))
+
+
+class RegexScanStrategy(Enum):
+    # One finditer per pattern.
+    SEPARATE = 0
+    # One scan of a combined alternation finds where any pattern can start,
+    # each pattern is then only tried at those positions.
+    COMBINED = 1
+    # Runs both and raises ValueError when they disagree, used for conformance runs.
+    VERIFY = 2
+
+
+class RegexSet:
+    """
+    An ordered list of patterns, each tagged with a value, scanned together.
+    finditer yields (match, value) pairs in the order looping over the patterns
+    and calling finditer on each would, whatever the scan strategy.
+    """
+    __strategy: RegexScanStrategy = RegexScanStrategy.SEPARATE
+
+    def __init__(self, patterns: Iterable[Tuple[Union[Pattern, str], object]]):
+        self.__patterns: List[Pattern] = list()
+        self.__values: List[object] = list()
+        for pattern, value in patterns:
+            self.__patterns.append(regex.compile(pattern) if isinstance(pattern, str) else pattern)
+            self.__values.append(value)
+        self.__scanners = None
+
+    @staticmethod
+    def set_strategy(strategy: RegexScanStrategy):
+        RegexSet.__strategy = strategy
+
+    @staticmethod
+    def get_strategy() -> RegexScanStrategy:
+        return RegexSet.__strategy
+
+    @property
+    def patterns(self) -> List[Pattern]:
+        return list(self.__patterns)
+
+    def finditer(self, source: str, strategy: RegexScanStrategy = None) -> List[Tuple[Match, object]]:
+        if strategy is None:
+            strategy = RegexSet.__strategy
+        if strategy == RegexScanStrategy.SEPARATE:
+            return self.__find_separately(source)
+        if strategy == RegexScanStrategy.COMBINED:
+            return self.__find_combined(source)
+
+        expected = self.__find_separately(source)
+        actual = self.__find_combined(source)
+        if [(m.span(), m.re) for m, _ in actual] != [(m.span(), m.re) for m, _ in expected]:
+            raise ValueError('Combined scan differs from separate scans for: {}'.format(source))
+        return expected
+
+    def __find_separately(self, source: str) -> List[Tuple[Match, object]]:
+        result = list()
+        for pattern, value in zip(self.__patterns, self.__values):
+            result.extend((match, value) for match in pattern.finditer(source))
+        return result
+
+    def __find_combined(self, source: str) -> List[Tuple[Match, object]]:
+        if self.__scanners is None:
+            self.__scanners = self.__build_scanners()
+
+        starts = dict()
+        for scanner, indices in self.__scanners:
+            if scanner is None:
+                continue
+            positions = [match.start() for match in scanner.finditer(source)]
+            for index in indices:
+                starts[index] = positions
+
+        result = list()
+        for index, (pattern, value) in enumerate(zip(self.__patterns, self.__values)):
+            positions = starts.get(index, None)
+            if positions is None:
+                result.extend((match, value) for match in pattern.finditer(source))
+                continue
+
+            # Emulate finditer: leftmost match, next search from where the last one ended.
+            end = 0
+            for position in positions:
+                if position < end:
+                    continue
+                match = pattern.match(source, position)
+                if match is None:
+                    continue
+                if match.end() == position:
+                    # Empty matches step forward differently, let the engine take over.
+                    result.extend((m, value) for m in pattern.finditer(source, position))
+                    break
+                result.append((match, value))
+                end = match.end()
+        return result
+
+    def __build_scanners(self) -> List[Tuple[Pattern, List[int]]]:
+        # One zero width scanner per distinct set of flags, matching wherever any of its patterns could start.
+        groups: Dict[int, List[int]] = dict()
+        for index, pattern in enumerate(self.__patterns):
+            if isinstance(pattern, _pattern_type) and _not_combinable.search(pattern.pattern) is None:
+                groups.setdefault(pattern.flags, list()).append(index)
+
+        scanners = list()
+        for flags, indices in groups.items():
+            alternation = '|'.join('(?:{})'.format(self.__patterns[i].pattern) for i in indices)
+            try:
+                scanners.append((regex.compile('(?=(?:{}))'.format(alternation), flags), indices))
+            except regex.error:
+                scanners.append((None, indices))
+        return scanners
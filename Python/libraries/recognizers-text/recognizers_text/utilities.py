@@ -3,10 +3,12 @@
 
 import re
 import unicodedata
-from typing import Pattern, Union, List, Match, Dict
+from typing import Pattern, Union, List, Match, Dict, Tuple, Optional, Iterator
+from collections import namedtuple
 import regex
 from emoji import UNICODE_EMOJI
 from multipledispatch import dispatch
+from .extraction_context import ExtractionContext
 
 
 class StringUtility:
@@ -52,7 +54,7 @@ class ConditionalMatch:
 
     @property
     def index(self) -> int:
-        return self.match[0].string.index(self.match[0].group())
+        return self.match[0].start()
 
     @property
     def length(self) -> int:
@@ -80,6 +82,47 @@ class ConditionalMatch:
         return self.match[0].groupdict().get(group, default_val) or default_val
 
 
+MatchedSpan = namedtuple('MatchedSpan', ['start', 'length', 'match', 'data'])
+
+
+class MatchedSpans:
+    """
+    Character coverage of the regex matches found in a source, with the matches
+    indexed by (start, length) so every covered span is paired with the match that
+    spans it exactly in constant time. The first match added for a position wins.
+    """
+
+    def __init__(self, source_length: int):
+        self.__matched: List[bool] = [False] * source_length
+        self.__matches: Dict[Tuple[int, int], Tuple[Match, object]] = dict()
+
+    def add(self, match: Match, data: object = None):
+        start, end = match.span()
+        self.__matched[start:end] = [True] * (end - start)
+        self.__matches.setdefault((start, end - start), (match, data))
+
+    def get(self, start: int, length: int) -> Optional[Tuple[Match, object]]:
+        return self.__matches.get((start, length), None)
+
+    def __iter__(self) -> Iterator[MatchedSpan]:
+        """
+        Yields every maximal run of covered characters, left to right. When no single
+        match covers the run exactly, match and data are None.
+        """
+        matched = self.__matched
+        size = len(matched)
+        i = 0
+        while i < size:
+            if not matched[i]:
+                i += 1
+                continue
+            start = i
+            while i < size and matched[i]:
+                i += 1
+            match, data = self.__matches.get((start, i - start), (None, None))
+            yield MatchedSpan(start, i - start, match, data)
+
+
 class RegExpUtility:
     @staticmethod
     def get_safe_reg_exp(source: str, flags: int = regex.I | regex.S) -> Pattern:
@@ -111,7 +154,7 @@ class RegExpUtility:
         if match is None:
             return None
 
-        str_before = text[0: text.index(match.group())]
+        str_before = text[0: match.start()]
 
         if trim:
             str_before = str_before.strip()
@@ -125,7 +168,7 @@ class RegExpUtility:
         if match is None:
             return None
 
-        srt_after = text[text.index(match.group()) + (match.end() - match.start()):]
+        srt_after = text[match.end():]
 
         if trim:
             srt_after = srt_after.strip()
@@ -154,6 +197,14 @@ class RegExpUtility:
 class QueryProcessor:
     @staticmethod
     def preprocess(source: str, case_sensitive: bool = False, recode: bool = True) -> str:
+        context = ExtractionContext.current()
+        if context is not None:
+            return context.get_or_add(('preprocess', source, case_sensitive, recode),
+                                      lambda: QueryProcessor.__preprocess(source, case_sensitive, recode))
+        return QueryProcessor.__preprocess(source, case_sensitive, recode)
+
+    @staticmethod
+    def __preprocess(source: str, case_sensitive: bool, recode: bool) -> str:
 
         result: str = source
 
@@ -7,6 +7,7 @@ import json
 import re
 import pytest
 from recognizers_text.culture import Culture
+from recognizers_text.regex_set import RegexSet, RegexScanStrategy
 
 
 def split_all(path):
@@ -88,6 +89,10 @@ CULTURES = {
 
 SPECS = get_all_specs()
 
+# Set to COMBINED or VERIFY to run the Specs with the combined regex scan, VERIFY fails any
+# spec whose separate and combined scans disagree.
+RegexSet.set_strategy(RegexScanStrategy[os.environ.get('RECOGNIZERS_REGEX_SCAN', 'SEPARATE')])
+
 if __name__ == "__main__":
 
     print("OK")
@@ -0,0 +1,47 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from recognizers_text import Culture
+from recognizers_date_time.date_time.component_container import ComponentContainer, EnglishDateTimeComponents
+from recognizers_date_time.date_time.english.merged_extractor_config import EnglishMergedExtractorConfiguration
+from recognizers_date_time.date_time.english.dateperiod_extractor_config import \
+    EnglishDatePeriodExtractorConfiguration
+
+
+class Component:
+    def __init__(self, *dependencies):
+        self.dependencies = dependencies
+
+
+class Dependency:
+    pass
+
+
+class TestComponentContainer():
+
+    def test_builds_each_component_once(self):
+        container = ComponentContainer(Culture.English)
+        component = container.get(Component, Dependency)
+        assert container.get(Component, Dependency) is component
+        assert component.dependencies[0] is container.get(Dependency)
+        assert container.get(Component) is not component
+        assert len(container) == 3
+
+        container.clear()
+        assert container.get(Component, Dependency) is not component
+
+    def test_disabled_container_builds_new_components(self):
+        container = ComponentContainer(Culture.English)
+        ComponentContainer.set_enabled(False)
+        try:
+            assert container.get(Dependency) is not container.get(Dependency)
+            assert len(container) == 0
+        finally:
+            ComponentContainer.set_enabled(True)
+
+    def test_configurations_share_extractors(self):
+        merged = EnglishMergedExtractorConfiguration()
+        date_period = EnglishDatePeriodExtractorConfiguration()
+        assert merged.date_extractor is date_period.date_point_extractor
+        assert merged.duration_extractor is date_period.duration_extractor
+        assert merged.integer_extractor is EnglishDateTimeComponents.get(type(merged.integer_extractor))
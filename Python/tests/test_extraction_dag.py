@@ -0,0 +1,54 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from datetime import datetime
+from recognizers_text import ExtractionContext
+from recognizers_date_time.date_time.base_merged import BaseMergedExtractor
+from recognizers_date_time.date_time.chinese.merged_extractor import ChineseMergedExtractor
+from recognizers_date_time.date_time.english.merged_extractor_config import EnglishMergedExtractorConfiguration
+from recognizers_date_time.date_time.utilities import DateTimeOptions
+
+REFERENCE = datetime(2016, 11, 7)
+ENGLISH = 'I will leave tomorrow at 5pm for two weeks and come back next monday morning'
+CHINESE = '我明天下午5点出发，下周一上午回来'
+
+
+def extract_texts(extractor, source):
+    return [(r.start, r.length, r.type, r.text) for r in extractor.extract(source, REFERENCE)]
+
+
+class TestExtractionDag():
+
+    def test_primitive_extractors_run_once(self):
+        extractor = BaseMergedExtractor(EnglishMergedExtractorConfiguration(), DateTimeOptions.NONE)
+        with ExtractionContext() as context:
+            extractor.extract(ENGLISH, REFERENCE)
+            statistics = context.statistics()
+
+        assert statistics['BaseTimeExtractor'].reused > 0
+        assert statistics['BaseDateExtractor'].reused > 0
+        assert all(s.extractions <= s.calls for s in statistics.values())
+
+        with ExtractionContext() as context:
+            extractor.extract(ENGLISH, REFERENCE)
+            extractor.extract(ENGLISH, REFERENCE)
+            again = context.statistics()
+        assert all(again[name].extractions == s.extractions for name, s in statistics.items())
+
+    def test_results_do_not_change(self):
+        for extractor, source in [
+                (BaseMergedExtractor(EnglishMergedExtractorConfiguration(), DateTimeOptions.NONE), ENGLISH),
+                (ChineseMergedExtractor(DateTimeOptions.NONE), CHINESE)]:
+            with ExtractionContext():
+                memoized = extract_texts(extractor, source)
+                assert extract_texts(extractor, source) == memoized
+            assert ExtractionContext.current() is None
+            assert memoized
+
+    def test_reference_is_part_of_the_key(self):
+        extractor = BaseMergedExtractor(EnglishMergedExtractorConfiguration(), DateTimeOptions.NONE)
+        with ExtractionContext() as context:
+            extractor.extract(ENGLISH, REFERENCE)
+            extractor.extract(ENGLISH, datetime(2017, 1, 1))
+            statistics = context.statistics()
+        assert statistics['BaseHolidayExtractor'].extractions == 2
@@ -0,0 +1,33 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import pytest
+from recognizers_date_time.date_time.base_merged import BaseMergedExtractor
+from recognizers_date_time.date_time.chinese.merged_extractor import ChineseMergedExtractor
+from recognizers_date_time.date_time.english.merged_extractor_config import EnglishMergedExtractorConfiguration
+from recognizers_date_time.date_time.spanish.merged_extractor_config import SpanishMergedExtractorConfiguration
+from recognizers_date_time.date_time.utilities import DateTimeOptions
+
+
+def texts(results):
+    return [(r.text, r.start, r.type) for r in results]
+
+
+@pytest.mark.parametrize('create, source, fails_fast', [
+    (lambda options: BaseMergedExtractor(EnglishMergedExtractorConfiguration(), options), 'ok sounds good', True),
+    (lambda options: BaseMergedExtractor(EnglishMergedExtractorConfiguration(), options), 'see you at ramadan', True),
+    (lambda options: BaseMergedExtractor(EnglishMergedExtractorConfiguration(), options), 'see you tomorrow at 5pm', False),
+    (lambda options: BaseMergedExtractor(SpanishMergedExtractorConfiguration(), options), 'nos vemos mañana', False),
+    (lambda options: ChineseMergedExtractor(options), '你好吗', True),
+    (lambda options: ChineseMergedExtractor(options), '明天下午五点见', False),
+])
+def test_fail_fast_keeps_results(create, source, fails_fast):
+    extractor = create(DateTimeOptions.FAIL_FAST)
+    assert extractor.is_fail_fast_case(source) == fails_fast
+    assert texts(extractor.extract(source)) == texts(create(DateTimeOptions.NONE).extract(source))
+
+
+def test_fail_fast_still_finds_holidays():
+    extractor = BaseMergedExtractor(EnglishMergedExtractorConfiguration(), DateTimeOptions.FAIL_FAST)
+    assert extractor.is_fail_fast_case('celebrate juneteenth')
+    assert texts(extractor.extract('celebrate juneteenth')) == [('juneteenth', 10, 'date')]
@@ -2,7 +2,7 @@
 #  Licensed under the MIT License.
 
 import pytest
-from recognizers_text import Culture
+from recognizers_text import Culture, ModelFactory
 from recognizers_number.number import NumberOptions, NumberModel, NumberRecognizer
 from recognizers_number.number.models import NumberMode
 from recognizers_number.number.parsers import BaseNumberParser
@@ -78,3 +78,25 @@ class TestInitializationNumberRecognizer():
     def test_initialization_with_invalid_options_throw_error(self):
         with pytest.raises(ValueError):
             NumberRecognizer(self.invalid_culture, -1)
+
+    def test_eager_initialization_builds_models_for_equal_culture(self):
+        ModelFactory.clear_cache()
+        culture = ''.join(['en', '-', 'us'])
+        NumberRecognizer(culture, NumberOptions.NONE, False)
+        assert ModelFactory.get_cache_statistics().entries == 3
+
+    def test_lazy_initialization_builds_on_demand(self):
+        ModelFactory.clear_cache()
+        recognizer = NumberRecognizer(self.english_culture, NumberOptions.NONE, True)
+        assert ModelFactory.get_cache_statistics().entries == 0
+        recognizer.get_number_model()
+        assert ModelFactory.get_cache_statistics().entries == 1
+
+    def test_warm_up_reports_every_model(self):
+        ModelFactory.clear_cache()
+        recognizer = NumberRecognizer(self.english_culture)
+        reports = recognizer.warm_up(max_workers=2)
+        assert sorted(report.model_type for report in reports) == ['NumberModel', 'OrdinalModel', 'PercentModel']
+        assert not any(report.cached for report in reports)
+        assert all(report.seconds >= 0 for report in reports)
+        assert all(report.cached for report in recognizer.warm_up(model_types=['NumberModel']))
@@ -0,0 +1,39 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import regex
+from recognizers_text.literal_prefilter import DIGIT, LiteralPrefilter, required_literals
+from recognizers_date_time.date_time.base_merged import BaseMergedExtractor
+from recognizers_date_time.date_time.english.merged_extractor_config import EnglishMergedExtractorConfiguration
+from recognizers_date_time.date_time.utilities import DateTimeOptions
+
+
+class TestLiteralPrefilter():
+
+    def test_required_literals(self):
+        assert required_literals(r'to(morrow|day|night)') == {'tomorrow', 'today', 'tonight'}
+        assert required_literals(r'\b(?:Zero|one)\b') == {'zero', 'one'}
+        assert required_literals(r'(12\s)?noon') == {'noon'}
+        assert required_literals(r'[0-9]{2}\s*h') == {DIGIT}
+        assert required_literals(r'^\s*(and|,)\s*$') == {'and'}
+        assert required_literals(r'.^') == set()
+        assert required_literals(r'\w+') is None
+        assert required_literals(r'(?x) a b') is None
+
+    def test_may_match(self):
+        prefilter = LiteralPrefilter([regex.compile(r'\b(tomorrow|today)\b', regex.I), regex.compile(r'\d+')])
+        assert prefilter.may_match('see you TODAY')
+        assert prefilter.may_match('room 42')
+        assert not prefilter.may_match('see you soon')
+        assert prefilter.statistics() == (3, 1, 1 / 3)
+
+        assert LiteralPrefilter([regex.compile(r'.+')]).may_match('anything')
+
+    def test_merged_extractor_skips_and_keeps_results(self):
+        extractor = BaseMergedExtractor(EnglishMergedExtractorConfiguration(), DateTimeOptions.NONE)
+        assert [r.text for r in extractor.extract('see you tomorrow at 5pm')] == ['tomorrow at 5pm']
+        assert extractor.extract('ok, sounds good!') == []
+
+        statistics = extractor.prefilter_statistics()
+        assert statistics['holiday_extractor'].skipped == 1
+        assert all(s.calls == 2 for s in statistics.values())
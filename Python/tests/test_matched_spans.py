@@ -0,0 +1,48 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import regex
+from recognizers_text.utilities import MatchedSpans
+from recognizers_number.number.english.extractors import EnglishNumberExtractor
+from recognizers_sequence.sequence.sequence_recognizer import SequenceOptions
+from recognizers_sequence.sequence.extractors import BasePhoneNumberExtractor, BaseIpExtractor
+from recognizers_sequence.sequence.english.extractors import EnglishPhoneNumberExtractorConfiguration, \
+    EnglishIpExtractorConfiguration
+
+
+class TestMatchedSpans():
+
+    def test_spans_pair_exact_matches(self):
+        source = 'ab cd abcd'
+        spans = MatchedSpans(len(source))
+        for match in regex.finditer('ab|cd', source):
+            spans.add(match, 'short')
+        for match in regex.finditer('abcd', source):
+            spans.add(match, 'long')
+        actual = [(s.start, s.length, s.data) for s in spans]
+        assert actual == [(0, 2, 'short'), (3, 2, 'short'), (6, 4, 'long')]
+
+    def test_runs_without_exact_match_have_no_data(self):
+        source = 'abcd'
+        spans = MatchedSpans(len(source))
+        for pattern, data in (('abc', 1), ('bcd', 2)):
+            spans.add(regex.search(pattern, source), data)
+        assert [(s.start, s.length, s.match, s.data) for s in spans] == [(0, 4, None, None)]
+
+    def test_first_match_wins(self):
+        source = 'abc'
+        spans = MatchedSpans(len(source))
+        spans.add(regex.search('abc', source), 'first')
+        spans.add(regex.search('a.c', source), 'second')
+        assert spans.get(0, 3)[1] == 'first'
+
+    def test_long_document(self):
+        sentence = 'I bought 12 apples and 3 pears, called 555-123-4567 and pinged 10.0.0.1 today. '
+        source = sentence * 200
+        numbers = EnglishNumberExtractor().extract(source)
+        phones = BasePhoneNumberExtractor(EnglishPhoneNumberExtractorConfiguration()).extract(source)
+        ips = BaseIpExtractor(EnglishIpExtractorConfiguration(SequenceOptions.NONE)).extract(source)
+        assert len(numbers) == len(EnglishNumberExtractor().extract(sentence)) * 200
+        assert len(phones) == 200
+        assert len(ips) == 200
+        assert all(source[r.start:r.start + r.length] == r.text for r in numbers + phones + ips)
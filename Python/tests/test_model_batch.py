@@ -0,0 +1,39 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from datetime import datetime
+from recognizers_text import Culture
+from recognizers_number.number import NumberRecognizer
+from recognizers_date_time.date_time import DateTimeRecognizer
+
+QUERIES = ['I have two apples', 'nothing to see here', 'one hundred and twenty three',
+           '3.5 million', 'five or six']
+
+
+def as_tuples(batch):
+    return [[(r.type_name, r.text, r.start, r.end, r.resolution) for r in results] for results in batch]
+
+
+class TestModelBatch():
+    number_model = NumberRecognizer(Culture.English).get_number_model()
+
+    def test_batch_matches_single_parse(self):
+        expected = [self.number_model.parse(query) for query in QUERIES]
+        assert as_tuples(self.number_model.parse_batch(QUERIES)) == as_tuples(expected)
+
+    def test_thread_pool_preserves_order(self):
+        expected = as_tuples(self.number_model.parse_batch(QUERIES))
+        actual = self.number_model.parse_batch(QUERIES, max_workers=3, chunk_size=1)
+        assert as_tuples(actual) == expected
+
+    def test_process_pool_preserves_order(self):
+        expected = as_tuples(self.number_model.parse_batch(QUERIES))
+        actual = self.number_model.parse_batch(QUERIES, max_workers=2, use_processes=True, chunk_size=2)
+        assert as_tuples(actual) == expected
+
+    def test_reference_is_forwarded(self):
+        model = DateTimeRecognizer(Culture.English).get_datetime_model()
+        reference = datetime(2016, 11, 7)
+        batch = model.parse_batch(['tomorrow', 'no date'], reference)
+        assert batch[0][0].resolution['values'][0]['value'] == '2016-11-08'
+        assert batch[1] == []
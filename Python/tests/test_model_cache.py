@@ -0,0 +1,97 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import threading
+import time
+import pytest
+from recognizers_text import Culture, ModelFactory
+from recognizers_text.model_cache import ModelCache, CachePolicy, EvictionStrategy
+from recognizers_number.number import NumberRecognizer, NumberOptions
+
+
+class TestModelCache():
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = ModelCache(CachePolicy(max_entries=2))
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert cache.statistics().evictions == 1
+
+    def test_lfu_evicts_least_frequently_used(self):
+        cache = ModelCache(CachePolicy(max_entries=2, eviction_strategy=EvictionStrategy.LFU))
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.get('a')
+        cache.get('b')
+        cache.put('c', 3)
+        assert 'a' in cache
+        assert 'b' not in cache
+
+    def test_byte_budget_evicts_oldest(self):
+        cache = ModelCache(CachePolicy(max_bytes=100, size_estimator=lambda value: value))
+        cache.put('a', 60)
+        cache.put('b', 30)
+        cache.put('c', 30)
+        assert 'a' not in cache
+        assert cache.statistics().bytes == 60
+
+    def test_counters(self):
+        cache = ModelCache()
+        cache.get_or_add('a', lambda: 1)
+        cache.get_or_add('a', lambda: 2)
+        statistics = cache.statistics()
+        assert (statistics.hits, statistics.misses, statistics.entries) == (1, 1, 1)
+
+    def test_concurrent_requests_build_once(self):
+        cache = ModelCache()
+        builds = []
+
+        def build():
+            builds.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_add('key', build)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(builds) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_failed_build_is_not_cached(self):
+        cache = ModelCache()
+
+        def fail():
+            raise ValueError()
+
+        with pytest.raises(ValueError):
+            cache.get_or_add('key', fail)
+        assert cache.get_or_add('key', lambda: 1) == 1
+
+    def test_invalid_policy_throw_error(self):
+        with pytest.raises(ValueError):
+            CachePolicy(max_entries=0)
+
+    def test_model_factory_honors_policy(self):
+        previous = ModelFactory.get_cache_policy()
+        try:
+            ModelFactory.clear_cache()
+            ModelFactory.set_cache_policy(CachePolicy(max_entries=1))
+            recognizer = NumberRecognizer(Culture.English, NumberOptions.NONE, True)
+            recognizer.get_number_model()
+            recognizer.get_ordinal_model()
+            statistics = ModelFactory.get_cache_statistics()
+            assert statistics.entries == 1
+            assert statistics.evictions == 1
+        finally:
+            ModelFactory.set_cache_policy(previous)
+            ModelFactory.clear_cache()
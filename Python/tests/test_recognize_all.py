@@ -0,0 +1,66 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+from datetime import datetime
+import pytest
+from recognizers_text import Culture, ExtractionContext
+from recognizers_number.number.english.extractors import EnglishNumberExtractor
+from recognizers_number.number.models import NumberMode
+import recognizers_suite as Recognizers
+
+QUERY = "I'll pay you 20 dollars on the 3rd of May at 5pm, call 555-123-4567, it's 25% off and 30 degrees, yes"
+
+
+def as_strings(results):
+    return [(str(r), r.resolution) for r in results]
+
+
+class TestRecognizeAll():
+
+    def test_matches_individual_recognizers(self):
+        reference = datetime(2016, 11, 7)
+        expected = Recognizers.recognize_number(QUERY, Culture.English) + \
+            Recognizers.recognize_currency(QUERY, Culture.English) + \
+            Recognizers.recognize_datetime(QUERY, Culture.English, reference=reference) + \
+            Recognizers.recognize_phone_number(QUERY, Culture.English) + \
+            Recognizers.recognize_boolean(QUERY, Culture.English)
+        actual = Recognizers.recognize_all(QUERY, Culture.English, [
+            Recognizers.ModelNames.NUMBER, Recognizers.ModelNames.CURRENCY, Recognizers.ModelNames.DATETIME,
+            Recognizers.ModelNames.PHONE_NUMBER, Recognizers.ModelNames.BOOLEAN], reference)
+        assert as_strings(actual) == as_strings(expected)
+
+    def test_default_models(self):
+        type_names = {r.type_name for r in Recognizers.recognize_all(QUERY, Culture.English)}
+        assert {'number', 'ordinal', 'percentage', 'currency', 'temperature', 'phonenumber', 'boolean'} <= type_names
+
+    def test_unknown_model_throw_error(self):
+        with pytest.raises(ValueError):
+            Recognizers.recognize_all(QUERY, Culture.English, ['unknown'])
+
+    def test_equal_number_extractors_share_extractions(self):
+        first = EnglishNumberExtractor(NumberMode.PURE_NUMBER)
+        second = EnglishNumberExtractor(NumberMode.PURE_NUMBER)
+        assert first.extraction_key == second.extraction_key
+        assert first.extraction_key != EnglishNumberExtractor(NumberMode.DEFAULT).extraction_key
+
+        with ExtractionContext() as context:
+            expected = first.extract('two apples and 3 pears')
+            actual = second.extract('two apples and 3 pears')
+            assert context.hits == 1
+        assert [(r.start, r.length, r.text) for r in actual] == [(r.start, r.length, r.text) for r in expected]
+
+    def test_memoized_results_are_copies(self):
+        extractor = EnglishNumberExtractor()
+        with ExtractionContext():
+            extractor.extract('two apples')[0].start = 42
+            assert extractor.extract('two apples')[0].start == 0
+
+    def test_models_share_extractions_within_parse(self):
+        model = Recognizers.DateTimeRecognizer(Culture.English).get_datetime_model()
+        with ExtractionContext() as context:
+            model.parse('I will be there on the 3rd of May at 5pm', datetime(2016, 11, 7))
+            statistics = context.statistics()
+            assert context.avoided_extractions > 0
+            assert context.avoided_extractions == sum(s.calls - s.extractions for s in statistics.values())
+            assert ExtractionContext.current() is context
+        assert ExtractionContext.current() is None
@@ -0,0 +1,46 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import pytest
+from recognizers_text import Culture, RecognizerRegistry
+from recognizers_number.number import NumberOptions, NumberRecognizer, recognize_number
+from recognizers_choice.choice import ChoiceOptions, ChoiceRecognizer
+
+
+class TestRecognizerRegistry():
+
+    def setup_method(self):
+        RecognizerRegistry.clear()
+
+    def test_same_key_returns_same_recognizer(self):
+        first = RecognizerRegistry.get_recognizer(NumberRecognizer, Culture.English, NumberOptions.NONE)
+        second = RecognizerRegistry.get_recognizer(NumberRecognizer, Culture.English, NumberOptions.NONE)
+        assert first is second
+        assert RecognizerRegistry.count() == 1
+
+    def test_different_culture_returns_different_recognizer(self):
+        english = RecognizerRegistry.get_recognizer(NumberRecognizer, Culture.English, NumberOptions.NONE)
+        spanish = RecognizerRegistry.get_recognizer(NumberRecognizer, Culture.Spanish, NumberOptions.NONE)
+        assert english is not spanish
+        assert spanish.target_culture == Culture.Spanish
+
+    def test_helper_registers_recognizer(self):
+        recognize_number('I have two apples', Culture.English)
+        assert RecognizerRegistry.contains(NumberRecognizer, Culture.English, NumberOptions.NONE)
+
+    def test_warm_up_registers_every_culture(self):
+        reports = RecognizerRegistry.warm_up(ChoiceRecognizer, [Culture.English, Culture.Spanish], ChoiceOptions.NONE)
+        assert [(report.model_type, report.culture) for report in reports] == [('BooleanModel', Culture.English)]
+        assert RecognizerRegistry.contains(ChoiceRecognizer, Culture.English, ChoiceOptions.NONE)
+        assert RecognizerRegistry.contains(ChoiceRecognizer, Culture.Spanish, ChoiceOptions.NONE)
+
+    def test_evict_by_culture(self):
+        RecognizerRegistry.warm_up(ChoiceRecognizer, [Culture.English, Culture.Spanish], ChoiceOptions.NONE)
+        assert RecognizerRegistry.evict(culture=Culture.Spanish) == 1
+        assert RecognizerRegistry.contains(ChoiceRecognizer, Culture.English, ChoiceOptions.NONE)
+        assert not RecognizerRegistry.contains(ChoiceRecognizer, Culture.Spanish, ChoiceOptions.NONE)
+
+    def test_invalid_options_are_not_registered(self):
+        with pytest.raises(ValueError):
+            RecognizerRegistry.get_recognizer(NumberRecognizer, Culture.English, -1)
+        assert RecognizerRegistry.count() == 0
@@ -0,0 +1,43 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import regex
+from recognizers_text.regex_set import RegexSet, RegexScanStrategy
+from recognizers_number.number.english.extractors import EnglishNumberExtractor
+
+SOURCE = 'call 555-1234 or 555 1234, ab ab abab x'
+
+
+def as_tuples(results):
+    return [(match.span(), value) for match, value in results]
+
+
+class TestRegexSet():
+    regex_set = RegexSet([
+        (regex.compile(r'\d+'), 'digits'),
+        (regex.compile(r'\d{3}[- ]\d{4}'), 'phone'),
+        (r'(ab)\1', 'repeat'),
+        (regex.compile(r'(?<=\s)ab', regex.I), 'ab'),
+        (regex.compile(r'x?'), 'optional'),
+    ])
+
+    def test_reports_values_in_pattern_order(self):
+        results = as_tuples(self.regex_set.finditer(SOURCE, RegexScanStrategy.SEPARATE))
+        assert results[:2] == [((5, 8), 'digits'), ((9, 13), 'digits')]
+        assert ((33, 37), 'repeat') in results
+
+    def test_combined_matches_separate(self):
+        expected = as_tuples(self.regex_set.finditer(SOURCE, RegexScanStrategy.SEPARATE))
+        assert as_tuples(self.regex_set.finditer(SOURCE, RegexScanStrategy.COMBINED)) == expected
+        assert as_tuples(self.regex_set.finditer(SOURCE, RegexScanStrategy.VERIFY)) == expected
+
+    def test_number_extractor_with_combined_scan(self):
+        source = 'I bought twenty one apples, 3.5 kg of rice and 1,000 nails for half a dozen friends'
+        extractor = EnglishNumberExtractor()
+        expected = [(r.start, r.length, r.data) for r in extractor.extract(source)]
+        previous = RegexSet.get_strategy()
+        try:
+            RegexSet.set_strategy(RegexScanStrategy.VERIFY)
+            assert [(r.start, r.length, r.data) for r in extractor.extract(source)] == expected
+        finally:
+            RegexSet.set_strategy(previous)
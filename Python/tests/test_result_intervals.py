@@ -0,0 +1,112 @@
+#  Copyright (c) Microsoft Corporation. All rights reserved.
+#  Licensed under the MIT License.
+
+import random
+from typing import List
+from recognizers_text import ExtractResult
+from recognizers_date_time.date_time.base_merged import BaseMergedExtractor
+from recognizers_date_time.date_time.chinese.merged_extractor import ChineseMergedExtractor
+from recognizers_date_time.date_time.english.merged_extractor_config import EnglishMergedExtractorConfiguration
+from recognizers_date_time.date_time.utilities import DateTimeOptions, ResultIntervals, Token, merge_all_tokens
+
+TEXT = 'abcdefghij' * 20
+
+
+def result(start: int, length: int) -> ExtractResult:
+    value = ExtractResult()
+    value.start = start
+    value.length = length
+    value.text = TEXT[start:start + length]
+    return value
+
+
+def random_results(generator: random.Random, count: int) -> List[ExtractResult]:
+    return [result(generator.randrange(150), generator.randint(1, 30)) for _ in range(count)]
+
+
+def spans(results) -> List[tuple]:
+    return [(r.start, r.length) for r in results]
+
+
+# The quadratic merges the interval based ones replaced, kept as the reference behavior.
+def reference_add_to(destinations: List[ExtractResult], source: List[ExtractResult]) -> List[ExtractResult]:
+    for value in source:
+        overlap_indexes = [index for index, d in enumerate(destinations) if d.overlap(value) and d.cover(value)]
+        if not any(d.overlap(value) for d in destinations):
+            destinations.append(value)
+        elif overlap_indexes:
+            destinations = [d for index, d in enumerate(destinations) if index not in overlap_indexes]
+            destinations.insert(overlap_indexes[0], value)
+    return destinations
+
+
+def reference_chinese_add_to(destination: List[ExtractResult], source: List[ExtractResult]) -> List[ExtractResult]:
+    for value in source:
+        index = next((index for index, d in enumerate(destination) if d.overlap(value)), None)
+        if index is None:
+            destination.append(value)
+        elif value.length > destination[index].length:
+            end = index + 1
+            while end < len(destination) and destination[end].overlap(value):
+                end += 1
+            del destination[index:end]
+            destination = [d for d in destination if not (d.text in value.text and (
+                d.start == value.start or d.start + d.length == value.start + value.length))]
+            destination.insert(index, value)
+    return destination
+
+
+def reference_merge_all_tokens(tokens: List[Token]) -> List[tuple]:
+    merged: List[Token] = list()
+    for token in sorted(tokens, key=lambda x: x.start):
+        add = True
+        for index, m_token in enumerate(merged):
+            if not add:
+                break
+            if token.start >= m_token.start and token.end <= m_token.end:
+                add = False
+            if m_token.start < token.start < m_token.end:
+                add = False
+            if token.start <= m_token.start and token.end >= m_token.end:
+                add = False
+                merged[index] = token
+        if add:
+            merged.append(token)
+    return [(t.start, t.length) for t in merged]
+
+
+class TestResultIntervals():
+
+    def test_overlapping_in_list_order(self):
+        intervals = ResultIntervals([result(10, 5), result(0, 3), result(12, 10)])
+        assert [rank for rank, _ in intervals.overlapping(result(2, 9))] == [0, 1]
+        intervals.remove(0)
+        intervals.insert(0, result(40, 50))
+        intervals.append(result(0, 1))
+        assert spans(intervals.results()) == [(40, 50), (0, 3), (12, 10), (0, 1)]
+        assert [rank for rank, _ in intervals.overlapping(result(85, 1))] == [0]
+
+    def test_add_to_matches_reference(self):
+        generator = random.Random(7)
+        extractor = BaseMergedExtractor(EnglishMergedExtractorConfiguration(), DateTimeOptions.NONE)
+        for _ in range(300):
+            destinations = random_results(generator, 10)
+            source = random_results(generator, 10)
+            expected = reference_add_to(list(destinations), source)
+            assert spans(extractor.add_to(destinations, source, TEXT)) == spans(expected)
+
+    def test_chinese_add_to_matches_reference(self):
+        generator = random.Random(11)
+        extractor = ChineseMergedExtractor(DateTimeOptions.NONE)
+        for _ in range(300):
+            destination = random_results(generator, 10)
+            source = random_results(generator, 10)
+            expected = reference_chinese_add_to(list(destination), source)
+            assert spans(extractor.add_to(destination, source, TEXT)) == spans(expected)
+
+    def test_merge_all_tokens_matches_reference(self):
+        generator = random.Random(13)
+        for _ in range(300):
+            tokens = [Token(start, start + generator.randint(0, 30))
+                      for start in (generator.randrange(150) for _ in range(20))]
+            assert spans(merge_all_tokens(tokens, TEXT, 'date')) == reference_merge_all_tokens(tokens)